@@ -0,0 +1,4 @@
+"""
+Benchmarks for the Blog Generation System.
+Run each module with python -m benchmarks.<name>.
+"""
@@ -0,0 +1,36 @@
+"""
+Measurement helpers shared by the benchmarks.
+Kept free of src imports, so each benchmark can set its environment before
+the src singletons are created.
+"""
+
+import contextlib
+import gc
+import os
+import statistics
+import time
+from typing import Any, Callable, Iterator
+
+
+@contextlib.contextmanager
+def quiet() -> Iterator[None]:
+    """Silence the pipeline's progress output while measuring."""
+    with open(os.devnull, 'w', encoding='utf-8') as sink:
+        with contextlib.redirect_stdout(sink):
+            yield
+
+
+def median_ms(fn: Callable[[], Any], repeats: int) -> float:
+    """Median wall time of fn in milliseconds, after one warmup call, with GC paused like timeit."""
+    fn()
+    timings = []
+    for _ in range(repeats):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            fn()
+            timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            gc.enable()
+    return statistics.median(timings)
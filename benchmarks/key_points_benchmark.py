@@ -0,0 +1,208 @@
+"""
+Key point extraction benchmark for the Blog Generation System.
+
+Compares the two KEY_POINTS_MODE paths on the same research summaries:
+- llm: one key-points LLM call per summary
+- extractive: local TextRank over the summary sentences
+
+For each topic, research runs against the local stub server and the
+configured LLM writes the summary; both paths then extract key points from
+it. Reported per path: median and p95 latency. Reported for agreement:
+- overlap_f1: for each LLM key point, the best unigram F1 against the
+  extractive points, averaged
+- term_recall: share of the LLM key points' content words that the
+  extractive points contain
+
+Runs offline on the fake LLM backend by default; with LLM_BACKEND=groq and
+a GROQ_API_KEY set it measures the real model, which is where the overlap
+figures are meaningful.
+
+Usage:
+    python -m benchmarks.key_points_benchmark
+    LLM_BACKEND=groq python -m benchmarks.key_points_benchmark --topics 5 --json key_points.json
+"""
+
+import os
+
+# Settings read when the src singletons are created must be in place before importing them
+for name, value in {
+    "LLM_BACKEND": "fake",
+    "LLM_CACHE": "0",
+    "SEMANTIC_CACHE": "0",
+    "HTTP_CACHE": "0",
+    "CHECKPOINTS": "0",
+}.items():
+    os.environ.setdefault(name, value)
+if os.environ["LLM_BACKEND"] == "fake":
+    os.environ.setdefault("GROQ_REQUESTS_PER_MINUTE", "0")
+    os.environ.setdefault("GROQ_TOKENS_PER_MINUTE", "0")
+
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Dict, List
+
+from benchmarks._common import median_ms, quiet
+from src.tools.text_utils import tokenize
+from src.utils.batch import percentile
+from src.utils.config import config
+from src.utils.llm_factory import llm_factory
+
+
+TOPICS = [
+    "Solar power adoption in cities",
+    "The history of the printing press",
+    "Remote work and team productivity",
+    "Antibiotic resistance in hospitals",
+    "Electric vehicle battery recycling",
+    "Machine learning in weather forecasting",
+    "Urban beekeeping",
+    "The economics of streaming music",
+    "Coral reef restoration",
+    "Quantum computing for drug discovery",
+]
+
+
+def _f1(a: List[str], b: List[str]) -> float:
+    """Unigram F1 between two token lists."""
+    common = len(set(a) & set(b))
+    if not common:
+        return 0.0
+    precision, recall = common / len(set(b)), common / len(set(a))
+    return 2 * precision * recall / (precision + recall)
+
+
+def agreement(reference: List[str], candidate: List[str]) -> Dict[str, float]:
+    """
+    Agreement of extracted key points with reference key points.
+
+    Args:
+        reference: Key points from the LLM path
+        candidate: Key points from the extractive path
+
+    Returns:
+        overlap_f1 and term_recall, both in [0, 1]
+    """
+    reference_tokens = [tokenize(point) for point in reference]
+    candidate_tokens = [tokenize(point) for point in candidate]
+    if not reference_tokens or not candidate_tokens:
+        return {"overlap_f1": 0.0, "term_recall": 0.0}
+
+    overlap = statistics.mean(
+        max(_f1(ref, cand) for cand in candidate_tokens) for ref in reference_tokens
+    )
+    reference_terms = {token for tokens in reference_tokens for token in tokens}
+    candidate_terms = {token for tokens in candidate_tokens for token in tokens}
+    recall = len(reference_terms & candidate_terms) / len(reference_terms) if reference_terms else 0.0
+    return {"overlap_f1": overlap, "term_recall": recall}
+
+
+def run(topics: List[str], repeats: int, latency_ms: float) -> Dict[str, Any]:
+    """
+    Research each topic, then time and compare both key point paths.
+
+    Args:
+        topics: Topics to research
+        repeats: Timed repetitions of the extractive path per summary
+        latency_ms: Simulated model latency per call (fake backend only)
+
+    Returns:
+        Results with summary metrics and per-topic rows
+    """
+    from src.agents.research_agent import research_agent
+    from src.prompts.research_prompts import research_prompts
+    from src.tools.stub_server import StubServer
+
+    config.FAKE_LLM_LATENCY_MS = latency_ms
+    llm_factory.reset()
+
+    rows = []
+    with StubServer() as stub, quiet():
+        config.WIKIPEDIA_BASE_URL = stub.base_url
+        config.WEB_SEARCH_URL = stub.base_url
+
+        for topic in topics:
+            sources = research_agent._perform_research(topic, [])
+            summary = research_agent._invoke(
+                research_prompts.research_analysis_prompt,
+                research_agent._analysis_inputs(topic, sources),
+                name="research_analysis"
+            ).strip()
+
+            config.KEY_POINTS_MODE = "llm"
+            start = time.perf_counter()
+            llm_points = research_agent._extract_key_points(summary, topic)
+            llm_ms = (time.perf_counter() - start) * 1000
+
+            config.KEY_POINTS_MODE = "extractive"
+            extractive_points = research_agent._extract_key_points(summary, topic)
+            extractive_ms = median_ms(lambda: research_agent._extract_key_points(summary, topic), repeats)
+
+            rows.append({
+                "topic": topic,
+                "llm_ms": llm_ms,
+                "extractive_ms": extractive_ms,
+                "llm_points": llm_points,
+                "extractive_points": extractive_points,
+                **agreement(llm_points, extractive_points),
+            })
+
+    llm_times = [row["llm_ms"] for row in rows]
+    extractive_times = [row["extractive_ms"] for row in rows]
+    metrics = {
+        "llm.p50_ms": percentile(llm_times, 50),
+        "llm.p95_ms": percentile(llm_times, 95),
+        "extractive.p50_ms": percentile(extractive_times, 50),
+        "extractive.p95_ms": percentile(extractive_times, 95),
+        "overlap_f1": statistics.mean(row["overlap_f1"] for row in rows),
+        "term_recall": statistics.mean(row["term_recall"] for row in rows),
+    }
+    return {
+        "settings": {
+            "backend": llm_factory.backend,
+            "model": llm_factory.model_id(config.GROQ_MODEL),
+            "topics": len(topics),
+            "repeats": repeats,
+            "latency_ms": latency_ms if llm_factory.backend == "fake" else None,
+        },
+        "metrics": metrics,
+        "topics": rows,
+    }
+
+
+def format_report(results: Dict[str, Any]) -> str:
+    """Render results as a text table."""
+    settings, metrics = results["settings"], results["metrics"]
+    lines = [
+        f"Key point benchmark ({settings['model']}, {settings['topics']} topics)",
+        f"{'path':<12}{'p50 ms':>12}{'p95 ms':>12}",
+        f"{'llm':<12}{metrics['llm.p50_ms']:>12.2f}{metrics['llm.p95_ms']:>12.2f}",
+        f"{'extractive':<12}{metrics['extractive.p50_ms']:>12.2f}{metrics['extractive.p95_ms']:>12.2f}",
+        f"speedup (p50): {metrics['llm.p50_ms'] / max(metrics['extractive.p50_ms'], 1e-6):.0f}x",
+        f"agreement with the llm path: overlap F1 {metrics['overlap_f1']:.2f}, term recall {metrics['term_recall']:.2f}",
+    ]
+    if settings["backend"] == "fake":
+        lines.append("(fake backend: the llm key points are synthetic, so agreement is not meaningful)")
+    return "\n".join(lines)
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Compare LLM and extractive key point extraction.")
+    parser.add_argument("--topics", type=int, default=len(TOPICS), help=f"Topics to run (at most {len(TOPICS)})")
+    parser.add_argument("--repeats", type=int, default=7, help="Timed repetitions of the extractive path")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Fake model latency per call")
+    parser.add_argument("--json", help="Write results (including every key point) to this file")
+    args = parser.parse_args()
+
+    results = run(TOPICS[:max(1, args.topics)], args.repeats, args.latency_ms)
+    print(format_report(results))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results saved to: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
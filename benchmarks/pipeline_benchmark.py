@@ -0,0 +1,447 @@
+"""
+Pipeline benchmark for the Blog Generation System.
+
+Runs fully offline against the fake LLM backend and the local stub HTTP
+server, and measures:
+- e2e: generate_blog latency (p50/p95) and throughput at several
+  concurrency levels, with a fixed simulated model latency
+- agents: per-agent overhead, i.e. wall time minus time spent in the model
+- parsers: _parse_outline_text and _format_blog_content on large inputs
+- output: saving a blog and its metadata
+
+Results are written as JSON and compared with a stored baseline; a metric
+worse than its baseline by more than the tolerance fails the run.
+
+Usage:
+    python -m benchmarks.pipeline_benchmark
+    python -m benchmarks.pipeline_benchmark --json results.json
+    python -m benchmarks.pipeline_benchmark --update-baseline
+"""
+
+import os
+
+# Settings read when the src singletons are created must be in place before importing them
+os.environ.update({
+    "LLM_BACKEND": "fake",
+    "LLM_CACHE": "0",
+    "SEMANTIC_CACHE": "0",
+    "HTTP_CACHE": "0",
+    "CHECKPOINTS": "0",
+    "GROQ_REQUESTS_PER_MINUTE": "0",
+    "GROQ_TOKENS_PER_MINUTE": "0",
+    # Every stub page is on one host; the per-host politeness limit would serialize them
+    "WEB_FETCH_PER_HOST": "64",
+})
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks._common import median_ms, quiet
+from src.utils.batch import percentile
+from src.utils.config import config
+from src.utils.llm_factory import llm_factory
+
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_MIN_DELTA_MS = 2.0
+
+
+class _TimedModel:
+    """Wraps a chat model and accumulates the time spent inside it."""
+
+    def __init__(self, model: Any):
+        self.model = model
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def _add(self, seconds: float):
+        with self._lock:
+            self.seconds += seconds
+
+    def invoke(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.model.invoke(*args, **kwargs)
+        finally:
+            self._add(time.perf_counter() - start)
+
+    def stream(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            yield from self.model.stream(*args, **kwargs)
+        finally:
+            self._add(time.perf_counter() - start)
+
+
+def bench_e2e(levels: List[int], blogs_per_worker: int, output_dir: str) -> Dict[str, float]:
+    """
+    Measure end-to-end generation at each concurrency level.
+
+    Args:
+        levels: Concurrency levels
+        blogs_per_worker: Blogs generated per concurrent slot at each level
+        output_dir: Directory for the generated files
+
+    Returns:
+        Metrics by name
+    """
+    from src.main import BlogGenerationSystem
+
+    system = BlogGenerationSystem()
+    metrics = {}
+
+    with quiet():
+        # Warm up imports, prompt compilation and the HTTP pool
+        system.generate_blog("Benchmark warmup", output_dir=output_dir)
+
+        latencies = []
+        for i in range(blogs_per_worker):
+            start = time.perf_counter()
+            blog = system.generate_blog(f"Sequential benchmark topic {i}", output_dir=output_dir)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if blog is None:
+                raise RuntimeError("generate_blog failed during the benchmark")
+    metrics["e2e.generate_blog.p50_ms"] = percentile(latencies, 50)
+    metrics["e2e.generate_blog.p95_ms"] = percentile(latencies, 95)
+
+    for level in levels:
+        topics = [f"Concurrent benchmark topic {level}-{i}" for i in range(level * blogs_per_worker)]
+        latencies = []
+
+        async def run_level():
+            semaphore = asyncio.Semaphore(level)
+
+            async def run(topic: str):
+                async with semaphore:
+                    start = time.perf_counter()
+                    blog = await system.agenerate_blog(topic, output_dir=output_dir)
+                    latencies.append((time.perf_counter() - start) * 1000)
+                    return blog
+
+            return await asyncio.gather(*(run(topic) for topic in topics))
+
+        with quiet():
+            start = time.perf_counter()
+            blogs = asyncio.run(run_level())
+            elapsed = time.perf_counter() - start
+        if any(blog is None for blog in blogs):
+            raise RuntimeError(f"agenerate_blog failed at concurrency {level}")
+        metrics[f"e2e.c{level}.p50_ms"] = percentile(latencies, 50)
+        metrics[f"e2e.c{level}.p95_ms"] = percentile(latencies, 95)
+        metrics[f"e2e.c{level}.blogs_per_s"] = len(topics) / elapsed
+    return metrics
+
+
+def bench_agents(repeats: int) -> Dict[str, Any]:
+    """
+    Measure each agent's own time: wall time minus time spent in the model.
+
+    Args:
+        repeats: Runs per agent
+
+    Returns:
+        Dictionary with the metrics and the last generated blog
+    """
+    from src.agents.outline_agent import outline_agent
+    from src.agents.research_agent import research_agent
+    from src.agents.writing_agent import writing_agent
+
+    agents = (research_agent, outline_agent, writing_agent)
+    overheads: Dict[str, List[float]] = {"research": [], "outline": [], "writing": []}
+    blog = None
+
+    saved_latency = config.FAKE_LLM_LATENCY_MS
+    config.FAKE_LLM_LATENCY_MS = 0.0
+    llm_factory.reset()
+    try:
+        for agent in agents:
+            agent.llm = _TimedModel(llm_factory.get(**agent.llm_config))
+
+        def measure(name: str, agent: Any, call: Callable[[], Any]):
+            model_before = agent.llm.seconds
+            start = time.perf_counter()
+            response = call()
+            wall = time.perf_counter() - start
+            if not response.success:
+                raise RuntimeError(f"{name} agent failed: {response.error_message}")
+            overheads[name].append((wall - (agent.llm.seconds - model_before)) * 1000)
+            return response.data
+
+        with quiet():
+            for i in range(repeats + 1):
+                topic = f"Agent benchmark topic {i}"
+                research = measure("research", research_agent, lambda: research_agent.conduct_research(topic))
+                outline = measure("outline", outline_agent, lambda: outline_agent.create_outline(research))
+                blog = measure("writing", writing_agent, lambda: writing_agent.write_blog(outline, research))
+                if i == 0:
+                    # The first run is a warmup
+                    for values in overheads.values():
+                        values.clear()
+    finally:
+        for agent in agents:
+            agent.llm = None
+        config.FAKE_LLM_LATENCY_MS = saved_latency
+        llm_factory.reset()
+
+    metrics = {f"agents.{name}.overhead_ms": statistics.median(values) for name, values in overheads.items()}
+    return {"metrics": metrics, "blog": blog}
+
+
+def _large_outline(sections: int) -> str:
+    lines = ["# A Very Long Benchmark Outline", "", "## Introduction", "- Why this matters", ""]
+    for i in range(sections):
+        lines.append(f"## Section {i}: Aspect number {i}")
+        lines.extend(f"- Subpoint {j} of section {i} with some descriptive words" for j in range(4))
+        lines.append("")
+    lines += ["## Conclusion", "- Main takeaways"]
+    return "\n".join(lines)
+
+
+def _large_blog(sections: int) -> str:
+    paragraph = " ".join(["Benchmark prose with **bold** terms and plain words."] * 12)
+    parts = ["# A Very Long Benchmark Post", ""]
+    for i in range(sections):
+        parts += [f"## Section {i}", "", paragraph, "", f"- point {i}a", f"- point {i}b", "", paragraph, ""]
+    return "\n".join(parts)
+
+
+def bench_parsers(repeats: int) -> Dict[str, float]:
+    """
+    Measure the outline and blog content parsers on large inputs.
+
+    Args:
+        repeats: Timed calls per parser
+
+    Returns:
+        Metrics by name
+    """
+    from src.agents.outline_agent import outline_agent
+    from src.agents.writing_agent import writing_agent
+
+    outline_text = _large_outline(500)
+    blog_text = _large_blog(500)
+    with quiet():
+        return {
+            "parsers.parse_outline_text_ms": median_ms(
+                lambda: outline_agent._parse_outline_text(outline_text, "Benchmark topic"), repeats
+            ),
+            "parsers.format_blog_content_ms": median_ms(
+                lambda: writing_agent._format_blog_content(blog_text), repeats
+            ),
+        }
+
+
+def bench_output(blog: Any, output_dir: str, repeats: int) -> Dict[str, float]:
+    """
+    Measure saving a blog and its metadata.
+
+    Args:
+        blog: GeneratedBlog to save
+        output_dir: Directory for the files
+        repeats: Timed saves
+
+    Returns:
+        Metrics by name
+    """
+    from src.utils.file_handlers import file_handlers
+
+    def save():
+        filepath = file_handlers.save_blog_to_file(blog, output_dir=output_dir)
+        file_handlers.save_metadata(blog, filepath)
+
+    with quiet():
+        return {"output.save_blog_ms": median_ms(save, repeats)}
+
+
+def run(levels: List[int], blogs_per_worker: int, repeats: int, latency_ms: float) -> dict:
+    """
+    Run every benchmark group against the fake LLM and the stub server.
+
+    Args:
+        levels: Concurrency levels for the end-to-end group
+        blogs_per_worker: Blogs per concurrent slot in the end-to-end group
+        repeats: Repetitions for the agent, parser and output groups
+        latency_ms: Simulated model latency per call in the end-to-end group
+
+    Returns:
+        Results with metrics and run settings
+    """
+    from src.tools.stub_server import StubServer
+
+    config.FAKE_LLM_LATENCY_MS = latency_ms
+    config.FAKE_LLM_TOKENS_PER_SECOND = 0.0
+    config.FAKE_LLM_ERROR_RATE = 0.0
+    llm_factory.reset()
+
+    metrics: Dict[str, float] = {}
+    with StubServer() as stub, tempfile.TemporaryDirectory() as output_dir:
+        config.WIKIPEDIA_BASE_URL = stub.base_url
+        config.WEB_SEARCH_URL = stub.base_url
+        metrics.update(bench_e2e(levels, blogs_per_worker, output_dir))
+        agents = bench_agents(repeats)
+        metrics.update(agents["metrics"])
+        metrics.update(bench_parsers(repeats))
+        metrics.update(bench_output(agents["blog"], output_dir, repeats))
+
+    return {
+        "environment": {"python": sys.version.split()[0], "platform": platform.platform()},
+        "settings": {
+            "levels": levels,
+            "blogs_per_worker": blogs_per_worker,
+            "repeats": repeats,
+            "latency_ms": latency_ms,
+        },
+        "metrics": {name: round(value, 3) for name, value in metrics.items()},
+    }
+
+
+def higher_is_better(name: str) -> bool:
+    """Whether a larger value of a metric is an improvement (throughputs)."""
+    return name.endswith("_per_s")
+
+
+def compare(
+    results: dict,
+    baseline: dict,
+    tolerance: float = DEFAULT_TOLERANCE,
+    min_delta_ms: float = DEFAULT_MIN_DELTA_MS
+) -> List[dict]:
+    """
+    Compare results with a baseline.
+
+    A metric regresses when it is worse than the baseline by more than the
+    tolerance (a fraction of the baseline value) and, for timings, by more
+    than min_delta_ms, so tiny timings do not fail on noise. A baseline may
+    set per-metric tolerances under "tolerances".
+
+    Args:
+        results: Output of run
+        baseline: Stored baseline results
+        tolerance: Default allowed relative change
+        min_delta_ms: Smallest timing change in milliseconds that can fail
+
+    Returns:
+        One row per metric with baseline, current, change and status
+    """
+    rows = []
+    base_metrics = baseline.get("metrics", {})
+    tolerances = baseline.get("tolerances", {})
+    for name, current in results["metrics"].items():
+        base = base_metrics.get(name)
+        if base is None:
+            rows.append({"metric": name, "baseline": None, "current": current, "change": None, "status": "new"})
+            continue
+
+        change = (current - base) / base if base else 0.0
+        allowed = tolerances.get(name, tolerance)
+        if higher_is_better(name):
+            regressed = change < -allowed
+        else:
+            regressed = change > allowed and current - base > min_delta_ms
+        rows.append({
+            "metric": name,
+            "baseline": base,
+            "current": current,
+            "change": change,
+            "status": "regressed" if regressed else "ok",
+        })
+    for name in base_metrics:
+        if name not in results["metrics"]:
+            rows.append({"metric": name, "baseline": base_metrics[name], "current": None, "change": None, "status": "missing"})
+    return rows
+
+
+def format_results(results: dict, rows: Optional[List[dict]] = None) -> str:
+    """Render results, and their comparison with the baseline if any, as a table."""
+    lines = [f"Pipeline benchmark (Python {results['environment']['python']}, fake LLM {results['settings']['latency_ms']} ms/call)"]
+    if rows is None:
+        lines.append(f"{'metric':<38}{'value':>12}")
+        lines.extend(f"{name:<38}{value:>12.3f}" for name, value in results["metrics"].items())
+        return "\n".join(lines)
+
+    lines.append(f"{'metric':<38}{'baseline':>12}{'current':>12}{'change':>9}  status")
+    for row in rows:
+        base = f"{row['baseline']:.3f}" if row["baseline"] is not None else "-"
+        current = f"{row['current']:.3f}" if row["current"] is not None else "-"
+        change = f"{row['change']:+.0%}" if row["change"] is not None else "-"
+        marker = "❌ " if row["status"] == "regressed" else ""
+        lines.append(f"{row['metric']:<38}{base:>12}{current:>12}{change:>9}  {marker}{row['status']}")
+    return "\n".join(lines)
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.pipeline_benchmark", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--levels", default="1,4,16", help="Comma-separated concurrency levels (default: 1,4,16)")
+    parser.add_argument("--blogs-per-worker", type=int, default=3, help="Blogs per concurrent slot (default: 3)")
+    parser.add_argument("--repeats", type=int, default=7, help="Repetitions for agent, parser and output timings (default: 7)")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Simulated model latency per call (default: 20)")
+    parser.add_argument("--json", metavar="FILE", help="Write the results as JSON")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline JSON to compare with")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE,
+        help=f"Allowed relative regression per metric (default: {DEFAULT_TOLERANCE})"
+    )
+    parser.add_argument(
+        "--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS,
+        help=f"Smallest timing regression in ms that fails the run (default: {DEFAULT_MIN_DELTA_MS})"
+    )
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.levels.split(",") if level.strip()]
+    results = run(levels, max(1, args.blogs_per_worker), max(1, args.repeats), args.latency_ms)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        if baseline_path.is_file():
+            # Keep hand-tuned per-metric tolerances
+            with open(baseline_path, 'r', encoding='utf-8') as f:
+                tolerances = json.load(f).get("tolerances")
+            if tolerances:
+                results = dict(results, tolerances=tolerances)
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(format_results(results))
+        print(f"Baseline saved to: {baseline_path}")
+        return
+
+    if not baseline_path.is_file():
+        print(format_results(results))
+        print(f"No baseline at {baseline_path}; run with --update-baseline to create one")
+        return
+
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get("settings") != results["settings"]:
+        print(f"⚠️ Baseline was recorded with different settings: {baseline.get('settings')}")
+    if baseline.get("environment") != results["environment"]:
+        print(f"⚠️ Baseline was recorded on {baseline.get('environment')}")
+
+    rows = compare(results, baseline, args.tolerance, args.min_delta_ms)
+    print(format_results(results, rows))
+    regressions = [row["metric"] for row in rows if row["status"] == "regressed"]
+    if regressions:
+        print(f"❌ {len(regressions)} metric(s) regressed: {', '.join(regressions)}")
+        sys.exit(1)
+    print("✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
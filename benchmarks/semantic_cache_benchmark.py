@@ -0,0 +1,114 @@
+"""
+Semantic cache matching benchmark for the Blog Generation System.
+
+Scores topic pairs with the semantic cache's normalization and embedding:
+- paraphrases must reach SEMANTIC_CACHE_THRESHOLD, so their research is reused
+- opposites (negations, for/against, before/after, more/less) must stay below
+  it, so neither topic is served the other's research
+
+Also reports the median time to normalize and embed a topic. Exits with
+status 1 when any pair lands on the wrong side of the threshold.
+
+Usage:
+    python -m benchmarks.semantic_cache_benchmark
+    python -m benchmarks.semantic_cache_benchmark --json semantic_cache.json
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Tuple
+
+from benchmarks._common import median_ms
+from src.utils.config import config
+from src.utils.semantic_cache import SemanticCache
+
+
+PARAPHRASES: List[Tuple[str, str]] = [
+    ("Future of AI", "The Future of Artificial Intelligence"),
+    ("Electric vehicles in the UK", "EVs in the United Kingdom"),
+    ("How LLMs work", "How large language models work"),
+    ("Benefits of remote work", "The benefits of remote work"),
+    ("Machine learning basics", "ML basics"),
+]
+
+OPPOSITES: List[Tuple[str, str]] = [
+    ("Life before the internet", "Life after the internet"),
+    ("The case for nuclear power", "The case against nuclear power"),
+    ("Why you should not learn Java", "Why you should learn Java"),
+    ("Living over the poverty line", "Living under the poverty line"),
+    ("Why cities need more cars", "Why cities need fewer cars"),
+    ("Moving to Canada", "Moving from Canada"),
+]
+
+
+def run(repeats: int) -> Dict[str, Any]:
+    """
+    Score every pair and time topic embedding.
+
+    Args:
+        repeats: Timed repetitions of the embedding
+
+    Returns:
+        Results with the threshold, per-pair rows and failures
+    """
+    cache = SemanticCache(cache_dir="", threshold=config.SEMANTIC_CACHE_THRESHOLD)
+    threshold = cache.threshold
+
+    rows = []
+    for kind, pairs in (("paraphrase", PARAPHRASES), ("opposite", OPPOSITES)):
+        for first, second in pairs:
+            similarity = float(cache._embed(first) @ cache._embed(second))
+            matched = similarity >= threshold
+            rows.append({
+                "kind": kind,
+                "topics": [first, second],
+                "normalized": [cache.normalize(first), cache.normalize(second)],
+                "similarity": round(similarity, 4),
+                "ok": matched if kind == "paraphrase" else not matched,
+            })
+
+    topic = OPPOSITES[0][0]
+    return {
+        "threshold": threshold,
+        "embed_ms": median_ms(lambda: cache._embed(topic), repeats),
+        "pairs": rows,
+        "failures": [row["topics"] for row in rows if not row["ok"]],
+    }
+
+
+def format_report(results: Dict[str, Any]) -> str:
+    """Render results as a text table."""
+    lines = [
+        f"Semantic cache matching (threshold {results['threshold']:.2f}, embed {results['embed_ms']:.3f} ms/topic)",
+        f"{'kind':<12}{'similarity':>11}  topics",
+    ]
+    for row in results["pairs"]:
+        marker = "" if row["ok"] else "❌ "
+        lines.append(f"{row['kind']:<12}{row['similarity']:>11.3f}  {marker}{row['topics'][0]!r} / {row['topics'][1]!r}")
+    if results["failures"]:
+        lines.append(f"❌ {len(results['failures'])} pair(s) on the wrong side of the threshold")
+    else:
+        lines.append("✅ Paraphrases match and opposites do not")
+    return "\n".join(lines)
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Check which topic pairs the semantic cache treats as the same.")
+    parser.add_argument("--repeats", type=int, default=200, help="Timed repetitions of the topic embedding")
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    results = run(max(1, args.repeats))
+    print(format_report(results))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results saved to: {args.json}")
+    if results["failures"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Cold start benchmark for the Blog Generation System.
+
+Each run uses a fresh interpreter and measures:
+- cli_help: wall time of `python -m src.main --help`
+- import: importing src.main
+- agents: resolving the three agents on first use
+- client: constructing the shared LLM client
+- first_call: the first agent LLM call (search query generation) with a
+  canned model response, so no network or API key is needed
+
+Usage:
+    python -m benchmarks.startup_benchmark --runs 10
+    python -m benchmarks.startup_benchmark --max-import-ms 250
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from src.utils.batch import percentile
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+STAGES = ("cli_help", "import", "agents", "client", "first_call")
+
+PROBE = r"""
+import json, sys, time
+
+start = time.perf_counter()
+import src.main
+imported = time.perf_counter()
+
+heavy_after_import = [name for name in ("pydantic", "langchain_core", "langchain_groq", "requests") if name in sys.modules]
+
+system = src.main.BlogGenerationSystem()
+agent = system.research_agent
+system.outline_agent
+system.writing_agent
+agents = time.perf_counter()
+
+agent.llm
+client = time.perf_counter()
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+agent.llm = FakeListChatModel(responses=["history of the topic\nmodern uses of the topic"])
+call_start = time.perf_counter()
+agent._generate_search_queries("startup benchmark")
+call_end = time.perf_counter()
+
+print(json.dumps({
+    "import": imported - start,
+    "agents": agents - imported,
+    "client": client - agents,
+    "first_call": call_end - call_start,
+    "heavy_after_import": heavy_after_import,
+}))
+"""
+
+
+def _probe_env() -> Dict[str, str]:
+    """Environment for probe processes: no caches, no rate limits, a dummy key."""
+    env = dict(os.environ)
+    env.setdefault("GROQ_API_KEY", "benchmark-key")
+    env.update({
+        "LLM_CACHE": "0",
+        "CHECKPOINTS": "0",
+        "GROQ_REQUESTS_PER_MINUTE": "0",
+        "GROQ_TOKENS_PER_MINUTE": "0",
+        "PYTHONPATH": str(ROOT),
+    })
+    return env
+
+
+def run_once() -> Dict[str, float]:
+    """
+    Measure one cold start in fresh interpreters.
+
+    Returns:
+        Seconds per stage, plus the heavy modules loaded by importing src.main
+    """
+    env = _probe_env()
+
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "src.main", "--help"],
+        cwd=ROOT, env=env, check=True, stdout=subprocess.DEVNULL
+    )
+    cli_help = time.perf_counter() - start
+
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=ROOT, env=env, check=True, capture_output=True, text=True
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    result["cli_help"] = cli_help
+    return result
+
+
+def summarize(runs: List[Dict[str, float]]) -> dict:
+    """
+    Aggregate runs into per-stage latency percentiles in milliseconds.
+
+    Args:
+        runs: Results of run_once
+
+    Returns:
+        Summary dictionary
+    """
+    stages = {}
+    for stage in STAGES:
+        values = [run[stage] * 1000 for run in runs]
+        stages[stage] = {
+            "p50_ms": round(percentile(values, 50), 1),
+            "p95_ms": round(percentile(values, 95), 1),
+            "min_ms": round(min(values), 1),
+        }
+    return {
+        "runs": len(runs),
+        "python": sys.version.split()[0],
+        "stages": stages,
+        "heavy_modules_after_import": sorted({name for run in runs for name in run["heavy_after_import"]}),
+    }
+
+
+def format_summary(summary: dict) -> str:
+    """Render a summary as a table."""
+    lines = [f"Startup benchmark ({summary['runs']} runs, Python {summary['python']})"]
+    lines.append(f"{'stage':<12}{'p50 ms':>10}{'p95 ms':>10}{'min ms':>10}")
+    for stage, values in summary["stages"].items():
+        lines.append(f"{stage:<12}{values['p50_ms']:>10}{values['p95_ms']:>10}{values['min_ms']:>10}")
+    heavy = summary["heavy_modules_after_import"]
+    lines.append(f"Heavy modules loaded by 'import src.main': {', '.join(heavy) if heavy else 'none'}")
+    return "\n".join(lines)
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup_benchmark", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts to measure (default: 5)")
+    parser.add_argument("--json", metavar="FILE", help="Also write the summary as JSON")
+    parser.add_argument(
+        "--max-import-ms", type=float, default=None,
+        help="Exit with status 1 if the p50 import time exceeds this budget"
+    )
+    args = parser.parse_args()
+
+    runs = [run_once() for _ in range(max(1, args.runs))]
+    summary = summarize(runs)
+    print(format_summary(summary))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        print(f"Summary saved to: {args.json}")
+
+    if args.max_import_ms is not None and summary["stages"]["import"]["p50_ms"] > args.max_import_ms:
+        print(f"❌ Import time regressed: p50 {summary['stages']['import']['p50_ms']} ms > {args.max_import_ms} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
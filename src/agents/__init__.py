@@ -5,11 +5,13 @@ Agents package for Blog Generation System.
 Specialized agents for research, outlining, and writing.
 """
 
+from .base_agent import BaseAgent
 from .research_agent import ResearchAgent, research_agent
 from .outline_agent import OutlineAgent, outline_agent
 from .writing_agent import WritingAgent, writing_agent
 
 __all__ = [
+    "BaseAgent",
     "ResearchAgent",
     "research_agent",
     "OutlineAgent",
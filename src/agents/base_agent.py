@@ -0,0 +1,209 @@
+#src/agents/base_agent.py
+
+"""
+Base Agent for the Blog Generation System.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from ..utils.config import config
+from ..utils.instrumentation import Span, tracer, usage_from_message
+from ..utils.llm_cache import llm_cache
+from ..utils.llm_factory import llm_factory
+from ..utils.rate_limiter import capture_response_headers, estimate_tokens, rate_limiter
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+    from langchain_core.prompts import PromptTemplate
+
+
+class BaseAgent:
+    """Shared LLM access for all agents, backed by the response cache and rate limiter."""
+
+    def __init__(self):
+        """Initialize the agent; the LLM client is created on first use."""
+        self.llm_config = config.get_groq_config()
+        self._llm: Optional["BaseChatModel"] = None
+
+    @property
+    def llm(self) -> "BaseChatModel":
+        """Chat model client, shared between agents through the factory."""
+        if self._llm is None:
+            self._llm = llm_factory.get(**self.llm_config)
+        return self._llm
+
+    @llm.setter
+    def llm(self, value: "BaseChatModel"):
+        self._llm = value
+
+    def _cache_key(self, prompt: "PromptTemplate", inputs: Dict[str, Any]) -> str:
+        """Build the response cache key for a prompt and its inputs."""
+        return llm_cache.make_key(
+            llm_factory.model_id(self.llm_config["model"]),
+            self.llm_config["temperature"],
+            self.llm_config["max_tokens"],
+            prompt.format(**llm_cache.key_inputs(inputs))
+        )
+
+    def _cache_get(self, prompt: "PromptTemplate", inputs: Dict[str, Any]) -> Optional[str]:
+        """Cached completion for a prompt and its inputs, without calling the LLM."""
+        if not llm_cache.enabled:
+            return None
+        return llm_cache.get(self._cache_key(prompt, inputs))
+
+    def _cache_set(self, prompt: "PromptTemplate", inputs: Dict[str, Any], content: str):
+        """Store a completion obtained some other way (e.g. from a batched call) for a prompt."""
+        if llm_cache.enabled:
+            llm_cache.set(self._cache_key(prompt, inputs), content)
+
+    @staticmethod
+    def _estimated_tokens(prompt_value: Any) -> int:
+        """Tokens to reserve from the rate budget before sending a prompt."""
+        return estimate_tokens(prompt_value.to_string()) + config.LLM_COMPLETION_TOKEN_ESTIMATE
+
+    @staticmethod
+    def _used_tokens(message: Any) -> Optional[int]:
+        """Total tokens a completed call reported, if any."""
+        usage = usage_from_message(message)
+        return sum(usage.values()) if usage else None
+
+    def _llm_span(self, name: str):
+        """Open an instrumentation span for one LLM call."""
+        return tracer.span(
+            f"llm.{name}",
+            kind="llm",
+            agent=type(self).__name__,
+            model=llm_factory.model_id(self.llm_config["model"])
+        )
+
+    def _lookup(self, span: Span, prompt: "PromptTemplate", inputs: Dict[str, Any]) -> Tuple[Any, Optional[str], Optional[str]]:
+        """
+        Render a prompt and consult the response cache.
+
+        Returns:
+            Tuple of (rendered prompt value, cache key or None, cached completion or None)
+        """
+        prompt_value = prompt.invoke(inputs)
+        span.set(chars_in=len(prompt_value.to_string()))
+
+        if not llm_cache.enabled:
+            span.set(cache="bypass")
+            return prompt_value, None, None
+
+        key = self._cache_key(prompt, inputs)
+        cached = llm_cache.get(key)
+        if cached is not None:
+            span.set(cache="hit", chars_out=len(cached))
+        else:
+            span.set(cache="miss")
+        return prompt_value, key, cached
+
+    def _invoke(self, prompt: "PromptTemplate", inputs: Dict[str, Any], name: str = "call") -> str:
+        """Render a prompt, call the LLM and return the completion text."""
+        with self._llm_span(name) as span:
+            prompt_value, key, cached = self._lookup(span, prompt, inputs)
+            if cached is not None:
+                return cached
+
+            with capture_response_headers() as headers:
+                response = rate_limiter.call(
+                    lambda: self.llm.invoke(prompt_value),
+                    self._estimated_tokens(prompt_value),
+                    self._used_tokens
+                )
+            rate_limiter.observe_headers(headers)
+            content = response.content
+            span.set(chars_out=len(content), **usage_from_message(response))
+
+            if key:
+                llm_cache.set(key, content)
+            return content
+
+    async def _ainvoke(self, prompt: "PromptTemplate", inputs: Dict[str, Any], name: str = "call") -> str:
+        """Render a prompt, call the LLM asynchronously and return the completion text."""
+        with self._llm_span(name) as span:
+            prompt_value, key, cached = self._lookup(span, prompt, inputs)
+            if cached is not None:
+                return cached
+
+            with capture_response_headers() as headers:
+                response = await rate_limiter.acall(
+                    lambda: self.llm.ainvoke(prompt_value),
+                    self._estimated_tokens(prompt_value),
+                    self._used_tokens
+                )
+            rate_limiter.observe_headers(headers)
+            content = response.content
+            span.set(chars_out=len(content), **usage_from_message(response))
+
+            if key:
+                llm_cache.set(key, content)
+            return content
+
+    def _invoke_many(self, calls: List[Tuple["PromptTemplate", Dict[str, Any], str]]) -> List[str]:
+        """Run independent (prompt, inputs, name) LLM calls concurrently, in call order."""
+        if not calls:
+            return []
+        with ThreadPoolExecutor(max_workers=len(calls), thread_name_prefix="llm") as executor:
+            # Each call runs in a copy of the caller's context so its span nests correctly
+            futures = [executor.submit(copy_context().run, self._invoke, *call) for call in calls]
+            return [future.result() for future in futures]
+
+    async def _ainvoke_many(self, calls: List[Tuple["PromptTemplate", Dict[str, Any], str]]) -> List[str]:
+        """Run independent (prompt, inputs, name) LLM calls concurrently on the event loop, in call order."""
+        return list(await asyncio.gather(*(self._ainvoke(*call) for call in calls)))
+
+    def _stream(self, prompt: "PromptTemplate", inputs: Dict[str, Any], name: str = "call") -> Iterator[str]:
+        """Render a prompt and yield completion text chunks as the LLM produces them."""
+        with self._llm_span(name) as span:
+            prompt_value, key, cached = self._lookup(span, prompt, inputs)
+            if cached is not None:
+                with tracer.suspended():
+                    yield cached
+                return
+
+            chunks = []
+            usage = {}
+            estimated_tokens = self._estimated_tokens(prompt_value)
+            with rate_limiter.permit(estimated_tokens):
+                for chunk in self.llm.stream(prompt_value):
+                    usage.update(usage_from_message(chunk))
+                    if chunk.content:
+                        chunks.append(chunk.content)
+                        with tracer.suspended():
+                            yield chunk.content
+            rate_limiter.settle(estimated_tokens, sum(usage.values()) if usage else None)
+
+            content = "".join(chunks)
+            span.set(chars_out=len(content), **usage)
+            if key:
+                llm_cache.set(key, content)
+
+    async def _astream(self, prompt: "PromptTemplate", inputs: Dict[str, Any], name: str = "call") -> AsyncIterator[str]:
+        """Render a prompt and asynchronously yield completion text chunks."""
+        with self._llm_span(name) as span:
+            prompt_value, key, cached = self._lookup(span, prompt, inputs)
+            if cached is not None:
+                with tracer.suspended():
+                    yield cached
+                return
+
+            chunks = []
+            usage = {}
+            estimated_tokens = self._estimated_tokens(prompt_value)
+            async with rate_limiter.apermit(estimated_tokens):
+                async for chunk in self.llm.astream(prompt_value):
+                    usage.update(usage_from_message(chunk))
+                    if chunk.content:
+                        chunks.append(chunk.content)
+                        with tracer.suspended():
+                            yield chunk.content
+            rate_limiter.settle(estimated_tokens, sum(usage.values()) if usage else None)
+
+            content = "".join(chunks)
+            span.set(chars_out=len(content), **usage)
+            if key:
+                llm_cache.set(key, content)
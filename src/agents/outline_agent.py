@@ -2,27 +2,48 @@
 Outline Agent for the Blog Generation System.
 """
 
+import re
 import time
 from datetime import datetime
-from langchain_groq import ChatGroq
+from typing import List, Optional, Tuple
 
 from ..models.blog_models import BlogOutline, ResearchResult, AgentResponse, BlogSection
 from ..utils.config import config
+from .base_agent import BaseAgent
 from ..prompts.outline_prompts import outline_prompts
+from ..tools.text_utils import STOPWORDS, text_utils, tokenize
 
 
-class OutlineAgent:
+# Body sections used when an outline names none
+DEFAULT_SECTION_HEADINGS = [
+    "Current Landscape and Trends",
+    "Key Challenges and Opportunities",
+    "Practical Applications and Case Studies",
+    "Future Outlook and Implications"
+]
+INTRODUCTION_PLACEHOLDER = "Engaging introduction that hooks the reader and explains the importance of the topic. This section will provide context and set the stage for the detailed discussion to follow."
+CONCLUSION_PLACEHOLDER = "Summary of key insights, main takeaways, and final thoughts. This section will reinforce the main points and provide readers with clear actionable insights or recommendations."
+MIN_SECTION_WORDS = 100
+MAX_HEADING_WORDS = 8
+MIN_SUPPORT_OVERLAP = 2
+
+_MARKDOWN_HEADING = re.compile(r'^\s*(#{1,6})\s+(.+)$')
+_BOLD_HEADING = re.compile(r'^\*\*([^*]+?):?\*\*:?$')
+_NUMBERED_HEADING = re.compile(r'^(?:[IVXLC]+|\d+)[.)]\s+(.+)$')
+_NUMBERING_START = frozenset("0123456789IVXLC")
+_LIST_MARKER = re.compile(r'^(?:[-*+•]|\d+[.)]|[a-zA-Z][.)])\s+')
+_HEADING_PREFIX = re.compile(r'^(?:(?:main\s+)?(?:section|part)\s+\d+\s*[:.\-–]\s*|(?:[IVXLC]+|\d+)[.)]\s+)', re.IGNORECASE)
+_WRAPPER_HEADING = re.compile(r'^(?:\d+[.)]\s*)?(?:main\s+)?(?:content|body)(?:\s+sections?)?:?$', re.IGNORECASE)
+_INTRODUCTION_HEADING = re.compile(r'^(?:introduction|intro|opening)\b', re.IGNORECASE)
+_CONCLUSION_HEADING = re.compile(r'^(?:conclusion|summary|final thoughts|key takeaways|wrapping up)\b', re.IGNORECASE)
+_TITLE_LABELS = {"title", "heading", "main heading", "blog title", "main heading/title"}
+_META_LABELS = {"target audience", "tone", "word count", "estimated word count"}
+_CLAUSE_BOUNDARY = re.compile(r'[,;:(]|\s+(?:and|which|while|because|but|so that)\s+')
+
+
+class OutlineAgent(BaseAgent):
     """Agent responsible for creating blog outlines."""
     
-    def __init__(self):
-        """Initialize the Outline Agent."""
-        self.llm = ChatGroq(
-            groq_api_key=config.GROQ_API_KEY,
-            model_name=config.GROQ_MODEL,
-            temperature=config.GROQ_TEMPERATURE,
-            max_tokens=config.GROQ_MAX_TOKENS
-        )
-    
     def create_outline(self, research_result: ResearchResult) -> AgentResponse:
         """
         Create a blog outline from research results.
@@ -54,75 +75,258 @@ class OutlineAgent:
                 processing_time=processing_time
             )
     
+    async def acreate_outline(self, research_result: ResearchResult) -> AgentResponse:
+        """
+        Create a blog outline from research results without blocking the event loop.
+        """
+        start_time = time.time()
+        
+        try:
+            print(f"📝 Outline Agent: Creating outline for '{research_result.topic}'")
+            
+            blog_outline = await self._agenerate_outline(research_result)
+            
+            processing_time = time.time() - start_time
+            print(f"✅ Outline created in {processing_time:.2f}s")
+            
+            return AgentResponse(
+                success=True,
+                data=blog_outline,
+                processing_time=processing_time
+            )
+            
+        except Exception as e:
+            processing_time = time.time() - start_time
+            error_msg = f"Outline creation failed: {str(e)}"
+            print(f"❌ Outline Agent: {error_msg}")
+            
+            return AgentResponse(
+                success=False,
+                error_message=error_msg,
+                processing_time=processing_time
+            )
+    
     def _generate_outline(self, research_result: ResearchResult) -> BlogOutline:
         """Generate blog outline using research results."""
+        if config.OUTLINE_MODE == "deterministic":
+            return self._derive_outline(research_result)
+        
+        prompt = outline_prompts.blog_outline_prompt
+        response = self._invoke(prompt, self._outline_inputs(research_result), name="outline")
+        outline_text = response.strip()
+        
+        # Parse the outline into structured format
+        return self._parse_outline_text(outline_text, research_result.topic)
+    
+    async def _agenerate_outline(self, research_result: ResearchResult) -> BlogOutline:
+        """Generate blog outline using research results asynchronously."""
+        if config.OUTLINE_MODE == "deterministic":
+            return self._derive_outline(research_result)
+        
         prompt = outline_prompts.blog_outline_prompt
-        chain = prompt | self.llm
+        response = await self._ainvoke(prompt, self._outline_inputs(research_result), name="outline")
+        outline_text = response.strip()
         
-        response = chain.invoke({
+        return self._parse_outline_text(outline_text, research_result.topic)
+    
+    def _outline_inputs(self, research_result: ResearchResult) -> dict:
+        """Build the outline prompt inputs from research results."""
+        return {
             "topic": research_result.topic,
             "research_summary": research_result.summary,
             "key_points": "\n".join(f"- {point}" for point in research_result.key_points),
             "current_date": datetime.now().strftime("%Y-%m-%d")
-        })
-        
-        outline_text = response.content.strip()
-        
-        # Parse the outline into structured format
-        return self._parse_outline_text(outline_text, research_result.topic)
+        }
     
     def _parse_outline_text(self, outline_text: str, topic: str) -> BlogOutline:
-        """Parse LLM response into structured BlogOutline."""
-        lines = [line.strip() for line in outline_text.split('\n') if line.strip()]
+        """
+        Parse the LLM's outline into a structured BlogOutline in one pass over its lines.
         
-        # Extract title
-        title = topic
-        for line in lines:
-            if line and line.startswith('# '):
-                title = line.replace('#', '').strip()
-                break
+        Markdown headings, bold lines and unindented numbered lines open
+        sections; bullets, indented items, deeper headings and prose become
+        the current section's subpoints. Introduction and conclusion are
+        recognized by their headings, and "Main Content"-style wrappers are
+        skipped. Missing parts fall back to the default structure.
+        """
+        title = None
+        introduction = None
+        conclusion = None
+        content_sections = []
+        current = None
+        current_level = 0
+        current_numbered = False
         
-        # Create structured sections with proper content
-        introduction = BlogSection(
-            heading="Introduction",
-            content="Engaging introduction that hooks the reader and explains the importance of the topic. This section will provide context and set the stage for the detailed discussion to follow.",
-            word_count=150
-        )
+        for raw_line in outline_text.split('\n'):
+            if not raw_line.strip():
+                continue
+            line = raw_line.rstrip()
+            
+            heading, level = self._outline_heading(line)
+            if heading is None:
+                point = _LIST_MARKER.sub('', line.strip()).strip()
+                if ':' in point:
+                    label, _, value = point.partition(':')
+                    label = label.strip('* ').lower()
+                    if label in _TITLE_LABELS and value.strip():
+                        title = title or _clean_heading(value)
+                        continue
+                    if label in _META_LABELS:
+                        continue
+                if current is not None and point:
+                    current[1].append(point.replace('**', ''))
+                continue
+            
+            if level is None:
+                # Numbered lines are sections only in a numbered outline, else subpoints
+                if current is not None and not current_numbered:
+                    current[1].append(heading)
+                    continue
+                numbered, level = True, 2
+            else:
+                numbered = False
+            if current is not None and level > current_level:
+                current[1].append(heading)
+                continue
+            
+            label, _, value = heading.partition(':')
+            if label.lower() in _TITLE_LABELS and value.strip():
+                title = title or _clean_heading(value)
+                continue
+            if level == 1 and title is None:
+                title = heading
+                continue
+            if _WRAPPER_HEADING.match(heading):
+                current = None
+                continue
+            
+            current = (_clean_heading(heading), [])
+            current_level = level
+            current_numbered = numbered
+            if _INTRODUCTION_HEADING.match(current[0]) and introduction is None:
+                introduction = current
+            elif _CONCLUSION_HEADING.match(current[0]) and conclusion is None:
+                conclusion = current
+            else:
+                content_sections.append(current)
         
-        # Create dynamic content sections based on key points
-        content_sections = []
-        section_headings = [
-            "Current Landscape and Trends",
-            "Key Challenges and Opportunities", 
-            "Practical Applications and Case Studies",
-            "Future Outlook and Implications"
-        ]
+        return self._build_outline(topic, title or topic, introduction, content_sections, conclusion)
+    
+    @staticmethod
+    def _outline_heading(line: str) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Recognize a section heading line.
         
-        for heading in section_headings:
-            content_sections.append(
-                BlogSection(
-                    heading=heading,
-                    content=f"Comprehensive analysis of {heading.lower()}, including relevant data, examples, and insights. This section will explore specific aspects and provide detailed information to support the main arguments.",
-                    word_count=300
-                )
+        Returns:
+            Tuple of (heading text, nesting level); the level is None for an
+            unindented numbered line and the heading None for other lines
+        """
+        # Dispatch on the first character so plain bullets skip the regexes
+        first = line.lstrip()[:1]
+        if first == '#':
+            match = _MARKDOWN_HEADING.match(line)
+            if match:
+                return match.group(2).strip().strip('*').strip(), len(match.group(1))
+        elif line.startswith('**'):
+            match = _BOLD_HEADING.match(line)
+            if match:
+                return match.group(1).strip(), 2
+        elif line[:1] in _NUMBERING_START:
+            match = _NUMBERED_HEADING.match(line)
+            if match:
+                return match.group(1).replace('**', '').strip(), None
+        return None, 0
+    
+    def _derive_outline(self, research_result: ResearchResult) -> BlogOutline:
+        """
+        Build an outline from the research without an LLM call: one body
+        section per key point, each guided by the summary sentences that
+        share the most words with it.
+        """
+        sentences = text_utils.split_sentences(research_result.summary)
+        sentence_words = [set(tokenize(sentence)) for sentence in sentences]
+        
+        content_sections = []
+        for point in research_result.key_points:
+            point = point.strip().rstrip('.')
+            if not point:
+                continue
+            words = set(tokenize(point))
+            ranked = sorted(
+                range(len(sentences)),
+                key=lambda i: len(words & sentence_words[i]),
+                reverse=True
             )
+            support = [
+                sentences[i] for i in ranked[:2]
+                if len(words & sentence_words[i]) >= MIN_SUPPORT_OVERLAP
+            ]
+            content_sections.append((_section_heading(point), [point] + support))
         
-        conclusion = BlogSection(
-            heading="Conclusion",
-            content="Summary of key insights, main takeaways, and final thoughts. This section will reinforce the main points and provide readers with clear actionable insights or recommendations.",
-            word_count=150
+        introduction = ("Introduction", sentences[:2])
+        conclusion = ("Conclusion", [f"Main takeaways about {research_result.topic}"] + sentences[-1:])
+        return self._build_outline(
+            research_result.topic, research_result.topic, introduction, content_sections, conclusion
         )
+    
+    def _build_outline(
+        self,
+        topic: str,
+        title: str,
+        introduction: Optional[Tuple[str, List[str]]],
+        content_sections: List[Tuple[str, List[str]]],
+        conclusion: Optional[Tuple[str, List[str]]]
+    ) -> BlogOutline:
+        """Assemble (heading, subpoints) pairs into a BlogOutline with per-section word targets."""
+        if not content_sections:
+            content_sections = [(heading, []) for heading in DEFAULT_SECTION_HEADINGS]
+        
+        edge_words = max(MIN_SECTION_WORDS, config.MAX_BLOG_LENGTH // 10)
+        body_words = max(MIN_SECTION_WORDS * len(content_sections), config.MAX_BLOG_LENGTH - 2 * edge_words)
+        weights = [max(1, len(points)) for _, points in content_sections]
+        total_weight = sum(weights)
+        
+        def section(heading: str, points: List[str], words: int, placeholder: str) -> BlogSection:
+            content = "\n".join(f"- {point}" for point in points) if points else placeholder
+            return BlogSection(heading=heading, content=content, word_count=words)
         
         return BlogOutline(
             topic=topic,
             title=title,
-            introduction=introduction,
-            content_sections=content_sections,
-            conclusion=conclusion,
+            introduction=section(
+                *(introduction or ("Introduction", [])), edge_words, INTRODUCTION_PLACEHOLDER
+            ),
+            content_sections=[
+                section(
+                    heading, points,
+                    max(MIN_SECTION_WORDS, round(body_words * weight / total_weight)),
+                    f"Comprehensive analysis of {heading.lower()}, including relevant data, examples, and insights."
+                )
+                for (heading, points), weight in zip(content_sections, weights)
+            ],
+            conclusion=section(
+                *(conclusion or ("Conclusion", [])), edge_words, CONCLUSION_PLACEHOLDER
+            ),
             target_audience="educated general readers and professionals",
             tone="professional yet accessible"
         )
 
 
+def _clean_heading(text: str) -> str:
+    """Strip numbering, "Section N:" prefixes and emphasis from a heading."""
+    text = text.replace('**', '').strip().rstrip(':').strip()
+    text = _HEADING_PREFIX.sub('', text).strip()
+    return text.strip('"').strip() or "Section"
+
+
+def _section_heading(point: str) -> str:
+    """Shorten a key point into a section heading at a clause boundary."""
+    clause = _CLAUSE_BOUNDARY.split(point, maxsplit=1)[0]
+    words = clause.split()[:MAX_HEADING_WORDS]
+    while len(words) > 1 and words[-1].lower() in STOPWORDS:
+        words.pop()
+    heading = " ".join(words).strip(",;: ")
+    return heading[0].upper() + heading[1:] if heading else "Section"
+
+
 # Create outline agent instance
 outline_agent = OutlineAgent()  
\ No newline at end of file
@@ -4,38 +4,65 @@
 Research Agent for the Blog Generation System.
 """
 
+import asyncio
+import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
 from datetime import datetime
-from typing import List
-from langchain_groq import ChatGroq
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
-from ..models.blog_models import ResearchResult, ResearchSource, AgentResponse
+from ..models.blog_models import ResearchAnalysis, ResearchResult, ResearchSource, AgentResponse
 from ..utils.config import config
+from ..utils.micro_batch import MicroBatcher, batching_active
+from ..utils.semantic_cache import ABBREVIATIONS, semantic_cache
+from .base_agent import BaseAgent
+from ..tools.context_packer import context_packer
+from ..tools.embeddings import source_ranker
+from ..tools.key_points import key_point_extractor
 from ..tools.search_tools import search_tools
+from ..tools.text_utils import text_utils
 from ..prompts.research_prompts import research_prompts
 
+if TYPE_CHECKING:
+    from langchain_core.prompts import PromptTemplate
 
-class ResearchAgent:
+
+class ResearchAgent(BaseAgent):
     """Agent responsible for conducting research."""
     
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+    
     def __init__(self):
-        """Initialize the Research Agent."""
-        self.llm = ChatGroq(
-            groq_api_key=config.GROQ_API_KEY,
-            model_name=config.GROQ_MODEL,
-            temperature=config.GROQ_TEMPERATURE,
-            max_tokens=config.GROQ_MAX_TOKENS
-        )
-        
-    def conduct_research(self, topic: str) -> AgentResponse:
+        """Initialize the agent and its cross-topic request batchers."""
+        super().__init__()
+        self._query_batcher = MicroBatcher(self._flush_search_queries)
+        self._key_points_batcher = MicroBatcher(self._flush_key_points)
+    
+    def conduct_research(self, topic: str, reuse: bool = True) -> AgentResponse:
         """
         Conduct comprehensive research.
+        
+        Args:
+            topic: Blog topic
+            reuse: Look up research for the topic or a paraphrase in the semantic cache
         """
         start_time = time.time()
         
         try:
             print(f"🔍 Research Agent: Starting research on '{topic}'")
             
+            # Reuse fresh research for the same or a paraphrased topic
+            cached = semantic_cache.lookup(topic) if reuse else None
+            if cached is not None:
+                return AgentResponse(
+                    success=True,
+                    data=cached,
+                    processing_time=time.time() - start_time
+                )
+            
             # Generate search queries
             search_queries = self._generate_search_queries(topic)
             print(f"   Generated {len(search_queries)} search queries")
@@ -62,6 +89,75 @@ class ResearchAgent:
                 research_queries=search_queries
             )
             
+            self._remember(topic, research_result)
+            
+            processing_time = time.time() - start_time
+            print(f"✅ Research completed in {processing_time:.2f}s")
+            
+            return AgentResponse(
+                success=True,
+                data=research_result,
+                processing_time=processing_time
+            )
+            
+        except Exception as e:
+            processing_time = time.time() - start_time
+            error_msg = f"Research failed: {str(e)}"
+            print(f"❌ Research Agent: {error_msg}")
+            
+            return AgentResponse(
+                success=False,
+                error_message=error_msg,
+                processing_time=processing_time
+            )
+    
+    async def aconduct_research(self, topic: str, reuse: bool = True) -> AgentResponse:
+        """
+        Conduct comprehensive research without blocking the event loop.
+        
+        Args:
+            topic: Blog topic
+            reuse: Look up research for the topic or a paraphrase in the semantic cache
+        """
+        start_time = time.time()
+        
+        try:
+            print(f"🔍 Research Agent: Starting research on '{topic}'")
+            
+            # Reuse fresh research for the same or a paraphrased topic
+            cached = semantic_cache.lookup(topic) if reuse else None
+            if cached is not None:
+                return AgentResponse(
+                    success=True,
+                    data=cached,
+                    processing_time=time.time() - start_time
+                )
+            
+            search_queries = await self._agenerate_search_queries(topic)
+            print(f"   Generated {len(search_queries)} search queries")
+            
+            # Search tools are blocking HTTP clients, so run them off the loop
+            research_sources = await asyncio.to_thread(self._perform_research, topic, search_queries)
+            
+            if not research_sources:
+                return AgentResponse(
+                    success=False,
+                    error_message="No research materials found for the topic.",
+                    processing_time=time.time() - start_time
+                )
+            
+            research_summary, key_points = await self._aanalyze_research(topic, research_sources)
+            
+            research_result = ResearchResult(
+                topic=topic,
+                summary=research_summary,
+                key_points=key_points,
+                sources=research_sources,
+                research_queries=search_queries
+            )
+            
+            self._remember(topic, research_result)
+            
             processing_time = time.time() - start_time
             print(f"✅ Research completed in {processing_time:.2f}s")
             
@@ -84,14 +180,60 @@ class ResearchAgent:
     
     def _generate_search_queries(self, topic: str) -> List[str]:
         """Generate search queries."""
+        if config.QUERY_MODE == "keyphrase":
+            return self._keyphrase_queries([topic])[0]
         try:
             prompt = research_prompts.research_queries_prompt
-            chain = prompt | self.llm
+            response = self._invoke(prompt, {"topic": topic}, name="search_queries")
+            return self._parse_search_queries(response.strip(), topic)
             
-            response = chain.invoke({"topic": topic})
-            queries_text = response.content.strip()
+        except Exception as e:
+            print(f"⚠️ Query generation failed, using fallback: {e}")
+            return [topic]
+    
+    async def _agenerate_search_queries(self, topic: str) -> List[str]:
+        """Generate search queries asynchronously, batched with concurrent topics in batch runs."""
+        if config.QUERY_MODE == "keyphrase":
+            return self._keyphrase_queries([topic])[0]
+        if not batching_active():
+            return await self._agenerate_search_queries_one(topic)
+        try:
+            return await self._query_batcher.submit({"topic": topic})
+        except Exception as e:
+            print(f"⚠️ Query generation failed, using fallback: {e}")
+            return [topic]
+    
+    async def _agenerate_search_queries_one(self, topic: str) -> List[str]:
+        """Generate search queries for a single topic asynchronously."""
+        try:
+            prompt = research_prompts.research_queries_prompt
+            response = await self._ainvoke(prompt, {"topic": topic}, name="search_queries")
+            return self._parse_search_queries(response.strip(), topic)
             
-            # Parse queries properly
+        except Exception as e:
+            print(f"⚠️ Query generation failed, using fallback: {e}")
+            return [topic]
+    
+    def _keyphrase_queries(self, topics: List[str]) -> List[List[str]]:
+        """
+        Expand topics into search queries from their key phrases, without an LLM call.
+        
+        The first query joins a topic's key phrases into a keyword query and
+        each multi-word phrase is also searched on its own; abbreviations
+        such as AI or EV are spelled out.
+        """
+        expansions = []
+        for topic, phrases in zip(topics, text_utils.extract_key_phrases_many(topics, max_phrases=4)):
+            phrases = [" ".join(ABBREVIATIONS.get(word, word) for word in phrase.split()) for phrase in phrases]
+            candidates = [" ".join(phrases)] + [phrase for phrase in phrases if " " in phrase]
+            queries = [query for query in dict.fromkeys(candidates) if query and query != topic.lower()]
+            expansions.append(queries[:3] or [topic])
+        return expansions
+    
+    def _parse_search_queries(self, queries_text: str, topic: str) -> List[str]:
+        """Parse search queries from the LLM response: a JSON array, or one query per line."""
+        queries = self._parse_json_list(queries_text)
+        if queries is None:
             queries = []
             for line in queries_text.split('\n'):
                 line = line.strip()
@@ -100,56 +242,140 @@ class ResearchAgent:
                     clean_query = line.lstrip('1234567890.-•* ').strip()
                     if clean_query and not clean_query.startswith('Here are'):
                         queries.append(clean_query)
-            
-            return queries[:3] if queries else [topic]
-            
-        except Exception as e:
-            print(f"⚠️ Query generation failed, using fallback: {e}")
-            return [topic]
+        
+        return queries[:3] if queries else [topic]
+    
+    @staticmethod
+    def _parse_json_list(text: str) -> Optional[List[str]]:
+        """Strings of a JSON array answer (None if the answer is not one)."""
+        text = text.strip()
+        # Models often wrap JSON in a Markdown code fence
+        if text.startswith("```"):
+            text = text.split("\n", 1)[1] if "\n" in text else ""
+            text = text.rstrip().removesuffix("```").strip()
+        # Only an answer that is an array; "[1]" inside a line answer is a citation
+        if not text.startswith("["):
+            return None
+        try:
+            data = json.loads(text[:text.rfind("]") + 1], strict=False)
+        except ValueError:
+            return None
+        if not isinstance(data, list):
+            return None
+        items = [item.strip() for item in data if isinstance(item, str) and item.strip()]
+        return items or None
+    
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Shared worker pool for research fetches, created on first use."""
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=config.RESEARCH_MAX_WORKERS,
+                        thread_name_prefix="research"
+                    )
+        return cls._executor
+    
+    def _research_backends(self) -> List[Tuple[str, Callable, int, bool]]:
+        """
+        Search backends as (name, search function, max results per query, batched).
+        
+        A batched backend takes every query at once and returns sources per query.
+        """
+        backends = [
+            ("wikipedia", search_tools.search_wikipedia_many, config.WIKIPEDIA_MAX_RESULTS, True),
+            ("web", search_tools.search_web_many, config.SEARCH_MAX_RESULTS, True),
+        ]
+        if search_tools.corpus_available():
+            backends.append(("corpus", search_tools.search_corpus, config.CORPUS_MAX_RESULTS, False))
+        return backends
     
     def _perform_research(self, topic: str, queries: List[str]) -> List[ResearchSource]:
-        """Perform research using search tools."""
-        all_sources = []
+        """
+        Perform research using search tools.
         
+        Every (query, backend) pair is fetched concurrently; a batched backend
+        fetches all queries in one task. Once enough sources have arrived the
+        outstanding fetches are cancelled. With ranking enabled a larger
+        candidate pool is gathered and the sources most similar to the topic
+        are kept, without near-duplicates; otherwise the first sources are
+        kept in query/backend order.
+        """
         # Use only valid queries
         valid_queries = [q for q in queries if len(q) > 5 and len(q) < 100]
-        research_queries = [topic] + valid_queries
+        research_queries = list(dict.fromkeys([topic] + valid_queries))[:config.RESEARCH_MAX_QUERIES]
+        
+        ranking = config.RESEARCH_RANKING_ENABLED
+        wanted = max(config.RESEARCH_CANDIDATE_POOL, config.RESEARCH_MAX_SOURCES) if ranking else config.RESEARCH_MAX_SOURCES
         
-        for query in research_queries[:2]:  # Limit to 2 queries
+        for query in research_queries:
             print(f"   Researching: '{query}'")
-            
-            try:
-                wiki_sources = search_tools.search_wikipedia(query)
-                web_sources = search_tools.search_web(query)
-                
-                all_sources.extend(wiki_sources)
-                all_sources.extend(web_sources)
-            except Exception as e:
-                print(f"⚠️ Research failed for '{query}': {e}")
+        
+        executor = self._get_executor()
+        futures = {}
+        for backend_index, (name, search, max_results, batched) in enumerate(self._research_backends()):
+            if batched:
+                future = executor.submit(copy_context().run, search, research_queries)
+                futures[future] = (backend_index, None, name, max_results)
                 continue
+            for query_index, query in enumerate(research_queries):
+                future = executor.submit(copy_context().run, search, query)
+                futures[future] = (backend_index, query_index, name, max_results)
+        
+        collected = []
+        source_count = 0
+        try:
+            for future in as_completed(futures):
+                backend_index, query_index, name, max_results = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    failed = research_queries if query_index is None else [research_queries[query_index]]
+                    print(f"⚠️ Research failed for {', '.join(repr(q) for q in failed)} ({name}): {e}")
+                    continue
+                
+                # Order by query, then backend
+                if query_index is None:
+                    per_query = [((i, backend_index), sources) for i, sources in enumerate(result)]
+                else:
+                    per_query = [((query_index, backend_index), result)]
+                for index, sources in per_query:
+                    collected.append((index, sources[:max_results]))
+                    source_count += len(sources[:max_results])
+                if source_count >= wanted:
+                    break
+        finally:
+            for future in futures:
+                future.cancel()
         
-        return all_sources[:4]  # Limit total sources
+        collected.sort(key=lambda item: item[0])
+        all_sources = [source for _, sources in collected for source in sources]
+        if ranking:
+            return source_ranker.rank(topic, all_sources, config.RESEARCH_MAX_SOURCES)
+        return all_sources[:config.RESEARCH_MAX_SOURCES]  # Limit total sources
+    
+    def _analysis_inputs(self, topic: str, sources: List[ResearchSource]) -> Dict[str, str]:
+        """Inputs of the research analysis prompts."""
+        return {
+            "topic": topic,
+            "research_materials": self._build_research_materials(sources),
+            "current_date": datetime.now().strftime("%Y-%m-%d")
+        }
     
     def _analyze_research(self, topic: str, sources: List[ResearchSource]) -> tuple:
         """Analyze research materials."""
+        if config.RESEARCH_ANALYSIS_MODE == "fused":
+            analysis = self._analyze_research_fused(topic, sources)
+            if analysis is not None:
+                return analysis
+        
         try:
-            # Prepare research materials
-            research_materials = ""
-            for i, source in enumerate(sources, 1):
-                research_materials += f"Source {i} ({source.source_type}): {source.reference}\n"
-                research_materials += f"Content: {source.content}\n\n"
-            
             # Generate research summary
             prompt = research_prompts.research_analysis_prompt
-            chain = prompt | self.llm
-            
-            response = chain.invoke({
-                "topic": topic,
-                "research_materials": research_materials,
-                "current_date": datetime.now().strftime("%Y-%m-%d")
-            })
+            response = self._invoke(prompt, self._analysis_inputs(topic, sources), name="research_analysis")
             
-            research_summary = response.content.strip()
+            research_summary = response.strip()
             
             # Extract key points
             key_points = self._extract_key_points(research_summary, topic)
@@ -158,25 +384,147 @@ class ResearchAgent:
             
         except Exception as e:
             print(f"⚠️ Research analysis failed: {e}")
-            # Return fallback content
-            fallback_summary = f"Research on {topic} revealed important insights about the subject. Key areas include current developments, challenges, and future prospects."
-            fallback_points = [f"Important aspects of {topic}", f"Current trends in {topic}", f"Future implications of {topic}"]
-            return fallback_summary, fallback_points
+            return self._fallback_analysis(topic)
+    
+    async def _aanalyze_research(self, topic: str, sources: List[ResearchSource]) -> tuple:
+        """Analyze research materials asynchronously."""
+        if config.RESEARCH_ANALYSIS_MODE == "fused":
+            analysis = await self._aanalyze_research_fused(topic, sources)
+            if analysis is not None:
+                return analysis
+        
+        try:
+            prompt = research_prompts.research_analysis_prompt
+            response = await self._ainvoke(prompt, self._analysis_inputs(topic, sources), name="research_analysis")
+            
+            research_summary = response.strip()
+            key_points = await self._aextract_key_points(research_summary, topic)
+            
+            return research_summary, key_points
+            
+        except Exception as e:
+            print(f"⚠️ Research analysis failed: {e}")
+            return self._fallback_analysis(topic)
+    
+    def _analyze_research_fused(self, topic: str, sources: List[ResearchSource]) -> Optional[tuple]:
+        """
+        Summarize research and extract its key points in one JSON call.
+        
+        Returns None when the answer is not valid JSON, so the caller can
+        fall back to separate summary and key point calls.
+        """
+        try:
+            prompt = research_prompts.research_analysis_json_prompt
+            response = self._invoke(prompt, self._analysis_inputs(topic, sources), name="research_analysis_fused")
+        except Exception as e:
+            print(f"⚠️ Research analysis failed: {e}")
+            return self._fallback_analysis(topic)
+        return self._parse_analysis(response)
+    
+    async def _aanalyze_research_fused(self, topic: str, sources: List[ResearchSource]) -> Optional[tuple]:
+        """Summarize research and extract its key points in one JSON call, asynchronously."""
+        try:
+            prompt = research_prompts.research_analysis_json_prompt
+            response = await self._ainvoke(prompt, self._analysis_inputs(topic, sources), name="research_analysis_fused")
+        except Exception as e:
+            print(f"⚠️ Research analysis failed: {e}")
+            return self._fallback_analysis(topic)
+        return self._parse_analysis(response)
+    
+    @staticmethod
+    def _parse_analysis(text: str) -> Optional[tuple]:
+        """Validate a fused analysis answer into (summary, key points), or None if malformed."""
+        start, end = text.find("{"), text.rfind("}")
+        try:
+            # strict=False: models often leave raw newlines inside the summary string
+            data = json.loads(text[start:end + 1], strict=False) if 0 <= start < end else None
+            analysis = ResearchAnalysis.model_validate(data)
+        except ValueError as e:
+            print(f"⚠️ Malformed research analysis JSON, using separate calls: {str(e).splitlines()[0]}")
+            return None
+        
+        key_points = [point.strip().lstrip('-•* ').strip() for point in analysis.key_points if point.strip()]
+        if not analysis.summary.strip() or not key_points:
+            print("⚠️ Empty research analysis JSON, using separate calls")
+            return None
+        return analysis.summary.strip(), key_points[:5]
+    
+    def _remember(self, topic: str, research_result: ResearchResult):
+        """Add research to the semantic cache unless it rests on placeholder sources or analysis."""
+        sources = research_result.sources
+        if not sources or any(search_tools.is_fallback(source) for source in sources):
+            return
+        if research_result.summary == self._fallback_analysis(topic)[0]:
+            return
+        try:
+            semantic_cache.store(topic, research_result)
+        except OSError as e:
+            print(f"⚠️ Could not write semantic cache entry: {e}")
+    
+    def _build_research_materials(self, sources: List[ResearchSource]) -> str:
+        """Prepare research materials for the analysis prompt, within the context token budget."""
+        return context_packer.pack(sources)
+    
+    def _fallback_analysis(self, topic: str) -> tuple:
+        """Fallback summary and key points when analysis fails."""
+        fallback_summary = f"Research on {topic} revealed important insights about the subject. Key areas include current developments, challenges, and future prospects."
+        fallback_points = [f"Important aspects of {topic}", f"Current trends in {topic}", f"Future implications of {topic}"]
+        return fallback_summary, fallback_points
     
     def _extract_key_points(self, research_summary: str, topic: str) -> List[str]:
         """Extract key points from research summary."""
+        if config.KEY_POINTS_MODE == "extractive":
+            return self._extract_key_points_local(research_summary, topic)
         try:
             prompt = research_prompts.key_points_extraction_prompt
-            chain = prompt | self.llm
+            response = self._invoke(prompt, {
+                "research_summary": research_summary,
+                "topic": topic
+            }, name="key_points")
+            
+            return self._parse_key_points(response.strip(), topic)
             
-            response = chain.invoke({
+        except Exception as e:
+            print(f"⚠️ Key points extraction failed: {e}")
+            return [f"Important aspects of {topic}"]
+    
+    async def _aextract_key_points(self, research_summary: str, topic: str) -> List[str]:
+        """Extract key points asynchronously, batched with concurrent topics in batch runs."""
+        if config.KEY_POINTS_MODE == "extractive":
+            return self._extract_key_points_local(research_summary, topic)
+        if not batching_active():
+            return await self._aextract_key_points_one(research_summary, topic)
+        try:
+            return await self._key_points_batcher.submit({"research_summary": research_summary, "topic": topic})
+        except Exception as e:
+            print(f"⚠️ Key points extraction failed: {e}")
+            return [f"Important aspects of {topic}"]
+    
+    def _extract_key_points_local(self, research_summary: str, topic: str) -> List[str]:
+        """Select key point sentences from the summary without an LLM call."""
+        key_points = key_point_extractor.extract(research_summary, topic)
+        return key_points or [f"Key information about {topic}"]
+    
+    async def _aextract_key_points_one(self, research_summary: str, topic: str) -> List[str]:
+        """Extract key points from a single research summary asynchronously."""
+        try:
+            prompt = research_prompts.key_points_extraction_prompt
+            response = await self._ainvoke(prompt, {
                 "research_summary": research_summary,
                 "topic": topic
-            })
+            }, name="key_points")
             
-            key_points_text = response.content.strip()
-            key_points = []
+            return self._parse_key_points(response.strip(), topic)
             
+        except Exception as e:
+            print(f"⚠️ Key points extraction failed: {e}")
+            return [f"Important aspects of {topic}"]
+    
+    def _parse_key_points(self, key_points_text: str, topic: str) -> List[str]:
+        """Parse key points from the LLM response: a JSON array, or one point per line."""
+        key_points = self._parse_json_list(key_points_text)
+        if key_points is None:
+            key_points = []
             for line in key_points_text.split('\n'):
                 line = line.strip()
                 if line and len(line) > 10:
@@ -184,12 +532,106 @@ class ResearchAgent:
                     clean_point = line.lstrip('1234567890.-•* ').strip()
                     if clean_point and not clean_point.startswith('KEY POINTS'):
                         key_points.append(clean_point)
+        
+        return key_points[:5] if key_points else [f"Key information about {topic}"]
+    
+    async def _flush_search_queries(self, items: List[Dict[str, str]]) -> List[List[str]]:
+        """Generate search queries for a batch of concurrent topics."""
+        return await self._run_batch(
+            "search_queries",
+            research_prompts.research_queries_prompt,
+            research_prompts.batch_research_queries_prompt,
+            items,
+            lambda pending: {
+                "topics": "\n".join(f"{i}. {item['topic']}" for i, item in enumerate(pending, 1)),
+                "count": len(pending)
+            },
+            lambda text, item: self._parse_search_queries(text, item["topic"]),
+            lambda item: self._agenerate_search_queries_one(item["topic"])
+        )
+    
+    async def _flush_key_points(self, items: List[Dict[str, str]]) -> List[List[str]]:
+        """Extract key points for a batch of concurrent topics."""
+        return await self._run_batch(
+            "key_points",
+            research_prompts.key_points_extraction_prompt,
+            research_prompts.batch_key_points_prompt,
+            items,
+            lambda pending: {
+                "summaries": "\n\n".join(
+                    f"SUMMARY {i} (topic: '{item['topic']}'):\n{item['research_summary']}"
+                    for i, item in enumerate(pending, 1)
+                ),
+                "count": len(pending)
+            },
+            lambda text, item: self._parse_key_points(text, item["topic"]),
+            lambda item: self._aextract_key_points_one(item["research_summary"], item["topic"])
+        )
+    
+    async def _run_batch(
+        self,
+        name: str,
+        prompt: "PromptTemplate",
+        batch_prompt: "PromptTemplate",
+        items: List[Dict[str, str]],
+        batch_inputs: Callable[[List[Dict[str, str]]], Dict[str, Any]],
+        parse: Callable[[str, Dict[str, str]], List[str]],
+        call_one: Callable[[Dict[str, str]], Awaitable[List[str]]]
+    ) -> List[List[str]]:
+        """
+        Answer several single-topic requests with one multi-item LLM call.
+        
+        Items already in the response cache are answered from it, and each
+        batched answer is cached under its single-topic prompt. Items the
+        batched answer misses or garbles fall back to individual calls.
+        """
+        results: List[Optional[List[str]]] = [None] * len(items)
+        pending = []
+        for index, item in enumerate(items):
+            cached = self._cache_get(prompt, item)
+            if cached is not None:
+                results[index] = parse(cached.strip(), item)
+            else:
+                pending.append(index)
+        
+        if len(pending) > 1:
+            try:
+                response = await self._ainvoke(
+                    batch_prompt, batch_inputs([items[index] for index in pending]), name=f"{name}_batch"
+                )
+                answers = self._parse_batch_answers(response, len(pending))
+            except Exception as e:
+                print(f"⚠️ Batched {name} call failed, falling back to individual calls: {e}")
+                answers = [None] * len(pending)
             
-            return key_points[:5] if key_points else [f"Key information about {topic}"]
-            
-        except Exception as e:
-            print(f"⚠️ Key points extraction failed: {e}")
-            return [f"Important aspects of {topic}"]
+            for index, answer in zip(pending, answers):
+                if answer:
+                    text = json.dumps(answer, ensure_ascii=False)
+                    self._cache_set(prompt, items[index], text)
+                    results[index] = parse(text, items[index])
+        
+        missing = [index for index, result in enumerate(results) if result is None]
+        for index, result in zip(missing, await asyncio.gather(*(call_one(items[index]) for index in missing))):
+            results[index] = result
+        return results
+    
+    @staticmethod
+    def _parse_batch_answers(text: str, count: int) -> List[Optional[List[str]]]:
+        """Split a multi-item JSON answer into per-item lines (None where missing or malformed)."""
+        start, end = text.find("{"), text.rfind("}")
+        try:
+            data = json.loads(text[start:end + 1]) if 0 <= start < end else {}
+        except ValueError:
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        
+        answers = []
+        for number in range(1, count + 1):
+            value = data.get(str(number))
+            lines = [v.strip() for v in value if isinstance(v, str) and v.strip()] if isinstance(value, list) else []
+            answers.append(lines or None)
+        return answers
 
 
 # Create research agent instance
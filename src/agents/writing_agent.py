@@ -7,24 +7,74 @@ Writing Agent for the Blog Generation System.
 
 import time
 from datetime import datetime
-from langchain_groq import ChatGroq
+from typing import Callable, List, Optional, TextIO, Tuple
+from langchain_core.prompts import PromptTemplate
 
 from ..models.blog_models import GeneratedBlog, BlogOutline, ResearchResult, AgentResponse
 from ..utils.config import config
+from .base_agent import BaseAgent
 from ..prompts.writing_prompts import writing_prompts
 
 
-class WritingAgent:
-    """Agent responsible for generating blog content."""
+class _LineStream:
+    """Assembles streamed completion chunks into formatted lines."""
     
-    def __init__(self):
-        """Initialize the Writing Agent."""
-        self.llm = ChatGroq(
-            groq_api_key=config.GROQ_API_KEY,
-            model_name=config.GROQ_MODEL,
-            temperature=config.GROQ_TEMPERATURE,
-            max_tokens=config.GROQ_MAX_TOKENS
-        )
+    def __init__(
+        self,
+        format_line: Callable[[str], str],
+        output_file: Optional[TextIO] = None,
+        on_line: Optional[Callable[[str], None]] = None
+    ):
+        """Initialize the stream with its line formatter and line consumers."""
+        self.format_line = format_line
+        self.output_file = output_file
+        self.on_line = on_line
+        self.lines: List[str] = []
+        self._buffer = ""
+        self._pending_blank = 0
+    
+    def feed(self, chunk: str):
+        """Consume a chunk and emit every line it completes."""
+        self._buffer += chunk
+        *complete, self._buffer = self._buffer.split('\n')
+        for line in complete:
+            self._emit(line)
+    
+    def close(self) -> str:
+        """Flush the last partial line and return the full formatted content."""
+        if self._buffer:
+            self._emit(self._buffer)
+            self._buffer = ""
+        return '\n'.join(self.lines)
+    
+    def _emit(self, raw_line: str):
+        """Format a complete line and hand it to the consumers."""
+        line = self.format_line(raw_line)
+        
+        # Match the non-streaming output: leading and trailing blank lines are dropped
+        if not line:
+            if self.lines:
+                self._pending_blank += 1
+            return
+        
+        for _ in range(self._pending_blank):
+            self._write("")
+        self._pending_blank = 0
+        self._write(line)
+    
+    def _write(self, line: str):
+        if self.output_file is not None:
+            if self.lines:
+                self.output_file.write('\n')
+            self.output_file.write(line)
+            self.output_file.flush()
+        self.lines.append(line)
+        if self.on_line is not None:
+            self.on_line(line)
+
+
+class WritingAgent(BaseAgent):
+    """Agent responsible for generating blog content."""
     
     def write_blog(self, outline: BlogOutline, research_result: ResearchResult) -> AgentResponse:
         """
@@ -36,23 +86,149 @@ class WritingAgent:
             print(f"✍️ Writing Agent: Writing blog '{outline.title}'")
             
             blog_content = self._generate_blog_content(outline, research_result)
-            word_count = self._count_words(blog_content)
-            
-            generated_blog = GeneratedBlog(
-                outline=outline,
-                content=blog_content,
-                word_count=word_count,
-                research_sources=research_result.sources,
-                generation_metadata={
-                    "research_queries_used": research_result.research_queries,
-                    "key_points_covered": research_result.key_points,
-                    "generation_timestamp": datetime.now().isoformat()
-                }
+            generated_blog = self._build_generated_blog(outline, research_result, blog_content)
+            
+            processing_time = time.time() - start_time
+            print(f"✅ Writing completed in {processing_time:.2f}s")
+            print(f"   Word count: {generated_blog.word_count}")
+            
+            return AgentResponse(
+                success=True,
+                data=generated_blog,
+                processing_time=processing_time
+            )
+            
+        except Exception as e:
+            processing_time = time.time() - start_time
+            error_msg = f"Blog writing failed: {str(e)}"
+            print(f"❌ Writing Agent: {error_msg}")
+            
+            return AgentResponse(
+                success=False,
+                error_message=error_msg,
+                processing_time=processing_time
+            )
+    
+    async def awrite_blog(self, outline: BlogOutline, research_result: ResearchResult) -> AgentResponse:
+        """
+        Write complete blog content without blocking the event loop.
+        """
+        start_time = time.time()
+        
+        try:
+            print(f"✍️ Writing Agent: Writing blog '{outline.title}'")
+            
+            blog_content = await self._agenerate_blog_content(outline, research_result)
+            generated_blog = self._build_generated_blog(outline, research_result, blog_content)
+            
+            processing_time = time.time() - start_time
+            print(f"✅ Writing completed in {processing_time:.2f}s")
+            print(f"   Word count: {generated_blog.word_count}")
+            
+            return AgentResponse(
+                success=True,
+                data=generated_blog,
+                processing_time=processing_time
+            )
+            
+        except Exception as e:
+            processing_time = time.time() - start_time
+            error_msg = f"Blog writing failed: {str(e)}"
+            print(f"❌ Writing Agent: {error_msg}")
+            
+            return AgentResponse(
+                success=False,
+                error_message=error_msg,
+                processing_time=processing_time
+            )
+    
+    def write_blog_stream(
+        self,
+        outline: BlogOutline,
+        research_result: ResearchResult,
+        on_line: Optional[Callable[[str], None]] = None,
+        filepath: Optional[str] = None
+    ) -> AgentResponse:
+        """
+        Write complete blog content, streaming formatted lines as they are generated.
+        
+        Each line is heading-normalized as soon as it is complete, appended
+        to filepath (if given) and passed to on_line (if given).
+        """
+        start_time = time.time()
+        
+        try:
+            print(f"✍️ Writing Agent: Streaming blog '{outline.title}'")
+            
+            prompt = writing_prompts.blog_generation_prompt
+            inputs = self._blog_inputs(outline, research_result)
+            
+            output_file = open(filepath, 'w', encoding='utf-8') if filepath else None
+            try:
+                line_stream = _LineStream(self._format_line, output_file, on_line)
+                for chunk in self._stream(prompt, inputs, name="blog"):
+                    line_stream.feed(chunk)
+                blog_content = line_stream.close()
+            finally:
+                if output_file is not None:
+                    output_file.close()
+            
+            generated_blog = self._build_generated_blog(outline, research_result, blog_content)
+            
+            processing_time = time.time() - start_time
+            print(f"✅ Writing completed in {processing_time:.2f}s")
+            print(f"   Word count: {generated_blog.word_count}")
+            
+            return AgentResponse(
+                success=True,
+                data=generated_blog,
+                processing_time=processing_time
+            )
+            
+        except Exception as e:
+            processing_time = time.time() - start_time
+            error_msg = f"Blog writing failed: {str(e)}"
+            print(f"❌ Writing Agent: {error_msg}")
+            
+            return AgentResponse(
+                success=False,
+                error_message=error_msg,
+                processing_time=processing_time
             )
+    
+    async def awrite_blog_stream(
+        self,
+        outline: BlogOutline,
+        research_result: ResearchResult,
+        on_line: Optional[Callable[[str], None]] = None,
+        filepath: Optional[str] = None
+    ) -> AgentResponse:
+        """
+        Write complete blog content asynchronously, streaming formatted lines as they are generated.
+        """
+        start_time = time.time()
+        
+        try:
+            print(f"✍️ Writing Agent: Streaming blog '{outline.title}'")
+            
+            prompt = writing_prompts.blog_generation_prompt
+            inputs = self._blog_inputs(outline, research_result)
+            
+            output_file = open(filepath, 'w', encoding='utf-8') if filepath else None
+            try:
+                line_stream = _LineStream(self._format_line, output_file, on_line)
+                async for chunk in self._astream(prompt, inputs, name="blog"):
+                    line_stream.feed(chunk)
+                blog_content = line_stream.close()
+            finally:
+                if output_file is not None:
+                    output_file.close()
+            
+            generated_blog = self._build_generated_blog(outline, research_result, blog_content)
             
             processing_time = time.time() - start_time
             print(f"✅ Writing completed in {processing_time:.2f}s")
-            print(f"   Word count: {word_count}")
+            print(f"   Word count: {generated_blog.word_count}")
             
             return AgentResponse(
                 success=True,
@@ -71,38 +247,136 @@ class WritingAgent:
                 processing_time=processing_time
             )
     
+    def _build_generated_blog(self, outline: BlogOutline, research_result: ResearchResult, blog_content: str) -> GeneratedBlog:
+        """Wrap written content and its provenance in a GeneratedBlog."""
+        return GeneratedBlog(
+            outline=outline,
+            content=blog_content,
+            word_count=self._count_words(blog_content),
+            research_sources=research_result.sources,
+            generation_metadata={
+                "research_queries_used": research_result.research_queries,
+                "key_points_covered": research_result.key_points,
+                "generation_timestamp": datetime.now().isoformat()
+            }
+        )
+    
     def _generate_blog_content(self, outline: BlogOutline, research_result: ResearchResult) -> str:
         """Generate blog content using outline and research."""
-        outline_str = self._format_outline_for_prompt(outline)
+        if config.WRITING_MODE == "sections":
+            section_texts = self._invoke_many(self._section_calls(outline, research_result))
+            return self._assemble_sections(outline, section_texts)
+        
+        prompt = writing_prompts.blog_generation_prompt
+        response = self._invoke(prompt, self._blog_inputs(outline, research_result), name="blog")
+        
+        return self._format_blog_content(response.strip())
+    
+    async def _agenerate_blog_content(self, outline: BlogOutline, research_result: ResearchResult) -> str:
+        """Generate blog content using outline and research asynchronously."""
+        if config.WRITING_MODE == "sections":
+            section_texts = await self._ainvoke_many(self._section_calls(outline, research_result))
+            return self._assemble_sections(outline, section_texts)
         
         prompt = writing_prompts.blog_generation_prompt
-        chain = prompt | self.llm
+        response = await self._ainvoke(prompt, self._blog_inputs(outline, research_result), name="blog")
         
-        response = chain.invoke({
+        return self._format_blog_content(response.strip())
+    
+    def _blog_inputs(self, outline: BlogOutline, research_result: ResearchResult) -> dict:
+        """Build the blog generation prompt inputs."""
+        return {
             "topic": outline.topic,
-            "outline": outline_str,
+            "outline": self._format_outline_for_prompt(outline),
             "research_summary": research_result.summary,
             "current_date": datetime.now().strftime("%Y-%m-%d")
-        })
+        }
+    
+    def _section_calls(self, outline: BlogOutline, research_result: ResearchResult) -> List[Tuple[PromptTemplate, dict, str]]:
+        """Build one independent LLM call per blog section, in reading order."""
+        key_points = "\n".join(f"- {point}" for point in research_result.key_points)
+        outline_str = self._format_outline_for_prompt(outline)
+        current_date = datetime.now().strftime("%Y-%m-%d")
+        
+        calls = [(writing_prompts.introduction_prompt, {
+            "topic": outline.topic,
+            "key_points": key_points,
+            "target_audience": outline.target_audience
+        }, "introduction")]
+        
+        for section in outline.content_sections:
+            calls.append((writing_prompts.section_prompt, {
+                "topic": outline.topic,
+                "title": outline.title,
+                "outline": outline_str,
+                "section_heading": section.heading,
+                "section_guidance": section.content,
+                "word_count": section.word_count,
+                "research_summary": research_result.summary,
+                "current_date": current_date
+            }, "section"))
+        
+        calls.append((writing_prompts.conclusion_prompt, {
+            "topic": outline.topic,
+            "main_insights": key_points,
+            "future_implications": outline.conclusion.content
+        }, "conclusion"))
+        return calls
+    
+    def _assemble_sections(self, outline: BlogOutline, section_texts: List[str]) -> str:
+        """Stitch independently written sections together under consistent headings."""
+        headings = (
+            [outline.introduction.heading]
+            + [section.heading for section in outline.content_sections]
+            + [outline.conclusion.heading]
+        )
+        
+        parts = [f"# {outline.title}"]
+        for heading, text in zip(headings, section_texts):
+            parts.append(f"## {heading}")
+            parts.append(self._clean_section_text(text, heading))
+        
+        return self._format_blog_content("\n\n".join(parts))
+    
+    def _clean_section_text(self, text: str, heading: str) -> str:
+        """Strip echoed headings from a section and nest its own headings below it."""
+        lines = text.strip().split('\n')
+        echoed_labels = {heading.lower(), "introduction", "conclusion", "section content"}
+        
+        while lines:
+            first = lines[0].strip()
+            label = first.strip('#*: ').lower()
+            if not first or first.startswith('#') or label in echoed_labels:
+                lines.pop(0)
+            else:
+                break
         
-        return self._format_blog_content(response.content.strip())
+        cleaned = []
+        for line in lines:
+            stripped = line.strip()
+            if stripped.startswith('#'):
+                cleaned.append(f"### {stripped.lstrip('#').strip()}")
+            else:
+                cleaned.append(line)
+        
+        return "\n".join(cleaned).strip()
     
     def _format_outline_for_prompt(self, outline: BlogOutline) -> str:
         """Format BlogOutline for the prompt."""
         outline_lines = []
         outline_lines.append(f"# {outline.title}")
         outline_lines.append("")
-        outline_lines.append("## Introduction")
+        outline_lines.append(f"## Introduction (~{outline.introduction.word_count} words)")
         outline_lines.append(f"{outline.introduction.content}")
         outline_lines.append("")
         
         outline_lines.append("## Content")
         for section in outline.content_sections:
-            outline_lines.append(f"### {section.heading}")
+            outline_lines.append(f"### {section.heading} (~{section.word_count} words)")
             outline_lines.append(f"{section.content}")
             outline_lines.append("")
         
-        outline_lines.append("## Summary")
+        outline_lines.append(f"## Summary (~{outline.conclusion.word_count} words)")
         outline_lines.append(f"{outline.conclusion.content}")
         outline_lines.append("")
         outline_lines.append(f"**Target Audience**: {outline.target_audience}")
@@ -112,20 +386,17 @@ class WritingAgent:
     
     def _format_blog_content(self, content: str) -> str:
         """Ensure proper formatting of blog content."""
-        lines = content.split('\n')
-        formatted_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            if line.startswith('## '):
-                # Ensure proper heading format
-                formatted_lines.append(f"## {line[3:].strip()}")
-            elif line.startswith('### '):
-                formatted_lines.append(f"### {line[4:].strip()}")
-            else:
-                formatted_lines.append(line)
-        
-        return '\n'.join(formatted_lines)
+        return '\n'.join(self._format_line(line) for line in content.split('\n'))
+    
+    def _format_line(self, line: str) -> str:
+        """Normalize a single line of blog content."""
+        line = line.strip()
+        if line.startswith('## '):
+            # Ensure proper heading format
+            return f"## {line[3:].strip()}"
+        elif line.startswith('### '):
+            return f"### {line[4:].strip()}"
+        return line
     
     def _count_words(self, text: str) -> int:
         """Count words in text."""
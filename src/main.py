@@ -2,31 +2,91 @@
 Main orchestration script for the Blog Generation System.
 """
 
+import argparse
+import asyncio
+import json
 import time
 import sys
 import os
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional
 
 # Fix import paths - use relative imports
+# Only lightweight modules are imported here; the agents (and with them
+# langchain, pydantic and requests) load on first use so --help stays fast.
 from src.utils.config import config
-from src.models.blog_models import GeneratedBlog
-from src.agents.research_agent import research_agent
-from src.agents.outline_agent import outline_agent
-from src.agents.writing_agent import writing_agent
 from src.utils.file_handlers import file_handlers
+from src.utils.batch import BatchStats, load_topics
+from src.utils.checkpoints import STAGES, checkpoint_store
+from src.utils.instrumentation import tracer
+from src.utils.micro_batch import batching
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from src.agents import OutlineAgent, ResearchAgent, WritingAgent
+    from src.models.blog_models import GeneratedBlog
 
 
 class BlogGenerationSystem:
     """Main orchestrator for the blog generation pipeline."""
     
-    def __init__(self):
-        """Initialize the system."""
+    def __init__(self, force_stages: Iterable[str] = (), skip_stages: Iterable[str] = ()):
+        """
+        Initialize the system.
+        
+        Args:
+            force_stages: Stages to rerun even when a checkpoint exists
+            skip_stages: Stages never to run; they must resume from a checkpoint
+        """
         self.system_start_time = None
         self.total_processing_time = None
+        self.force_stages = set(force_stages)
+        self.skip_stages = set(skip_stages)
+    
+    @property
+    def research_agent(self) -> "ResearchAgent":
+        """Research agent, imported on first use."""
+        from src.agents.research_agent import research_agent
+        return research_agent
+    
+    @property
+    def outline_agent(self) -> "OutlineAgent":
+        """Outline agent, imported on first use."""
+        from src.agents.outline_agent import outline_agent
+        return outline_agent
+    
+    @property
+    def writing_agent(self) -> "WritingAgent":
+        """Writing agent, imported on first use."""
+        from src.agents.writing_agent import writing_agent
+        return writing_agent
         
-    def generate_blog(self, topic: str, save_to_file: bool = True) -> Optional[GeneratedBlog]:
-        """Generate a complete blog post."""
+    def generate_blog(
+        self,
+        topic: str,
+        save_to_file: bool = True,
+        output_dir: Optional[str] = None,
+        stream: bool = False,
+        on_line: Optional[Callable[[str], None]] = None
+    ) -> Optional["GeneratedBlog"]:
+        """
+        Generate a complete blog post.
+        
+        With stream=True the writing phase streams formatted lines to the
+        output file and to on_line as they are generated.
+        """
+        with tracer.trace("blog", topic=topic):
+            return self._generate_blog(topic, save_to_file, output_dir, stream, on_line)
+    
+    def _generate_blog(
+        self,
+        topic: str,
+        save_to_file: bool,
+        output_dir: Optional[str],
+        stream: bool,
+        on_line: Optional[Callable[[str], None]]
+    ) -> Optional["GeneratedBlog"]:
+        """Run the pipeline for generate_blog inside its trace."""
         self.system_start_time = time.time()
         
         print("=" * 60)
@@ -46,12 +106,20 @@ class BlogGenerationSystem:
             print("PHASE 1: RESEARCH")
             print("=" * 40)
             
-            research_response = research_agent.conduct_research(topic)
-            if not research_response.success:
-                print(f"❌ Research failed: {research_response.error_message}")
-                return None
-                
-            research_result = research_response.data
+            research_result = self._resume_stage(topic, "research", upstream_ran=False)
+            research_ran = research_result is None
+            if research_ran:
+                if self._stage_skipped(topic, "research"):
+                    return None
+                with tracer.span("phase.research", kind="phase"):
+                    research_response = self.research_agent.conduct_research(
+                        topic, reuse="research" not in self.force_stages
+                    )
+                if not research_response.success:
+                    print(f"❌ Research failed: {research_response.error_message}")
+                    return None
+                research_result = research_response.data
+                self._checkpoint(topic, "research", research_result)
             print(f"✅ Research completed: {len(research_result.sources)} sources")
             
             # Step 2: Outline Phase
@@ -59,12 +127,18 @@ class BlogGenerationSystem:
             print("PHASE 2: OUTLINING") 
             print("=" * 40)
             
-            outline_response = outline_agent.create_outline(research_result)
-            if not outline_response.success:
-                print(f"❌ Outline failed: {outline_response.error_message}")
-                return None
-                
-            blog_outline = outline_response.data
+            blog_outline = self._resume_stage(topic, "outline", upstream_ran=research_ran)
+            outline_ran = blog_outline is None
+            if outline_ran:
+                if self._stage_skipped(topic, "outline"):
+                    return None
+                with tracer.span("phase.outline", kind="phase"):
+                    outline_response = self.outline_agent.create_outline(research_result)
+                if not outline_response.success:
+                    print(f"❌ Outline failed: {outline_response.error_message}")
+                    return None
+                blog_outline = outline_response.data
+                self._checkpoint(topic, "outline", blog_outline)
             print(f"✅ Outline created: '{blog_outline.title}'")
             
             # Step 3: Writing Phase
@@ -72,22 +146,41 @@ class BlogGenerationSystem:
             print("PHASE 3: WRITING")
             print("=" * 40)
             
-            writing_response = writing_agent.write_blog(blog_outline, research_result)
-            if not writing_response.success:
-                print(f"❌ Writing failed: {writing_response.error_message}")
-                return None
+            filepath = None
+            generated_blog = self._resume_stage(topic, "writing", upstream_ran=outline_ran)
+            if generated_blog is not None:
+                generated_blog.generation_metadata["resumed_from_checkpoint"] = True
+            else:
+                if self._stage_skipped(topic, "writing"):
+                    return None
+                with tracer.span("phase.writing", kind="phase", stream=stream):
+                    if stream:
+                        if save_to_file:
+                            filepath = file_handlers.blog_filepath(blog_outline.topic, output_dir=output_dir)
+                        writing_response = self.writing_agent.write_blog_stream(
+                            blog_outline, research_result, on_line=on_line, filepath=filepath
+                        )
+                    else:
+                        writing_response = self.writing_agent.write_blog(blog_outline, research_result)
+                if not writing_response.success:
+                    print(f"❌ Writing failed: {writing_response.error_message}")
+                    self._discard_partial_output(filepath)
+                    return None
+                generated_blog = writing_response.data
+                self._checkpoint(topic, "writing", generated_blog)
                 
-            generated_blog = writing_response.data
             self.total_processing_time = time.time() - self.system_start_time
             
             # Display results
-            self._display_results(generated_blog)
+            self._display_results(generated_blog, show_content=not stream)
             
-            # Save to file
+            # Save to file (a resumed blog is one whose run stopped before saving it)
             if save_to_file:
-                filepath = file_handlers.save_blog_to_file(generated_blog)
+                if filepath is None:
+                    filepath = file_handlers.save_blog_to_file(generated_blog, output_dir=output_dir)
                 file_handlers.save_metadata(generated_blog, filepath)
                 print(f"✅ Output saved to: {filepath}")
+            self._clear_checkpoints(topic)
             
             return generated_blog
             
@@ -98,7 +191,273 @@ class BlogGenerationSystem:
             traceback.print_exc()
             return None
     
-    def _display_results(self, blog: GeneratedBlog):
+    async def agenerate_blog(
+        self,
+        topic: str,
+        save_to_file: bool = True,
+        output_dir: Optional[str] = None,
+        stream: bool = False,
+        on_line: Optional[Callable[[str], None]] = None
+    ) -> Optional["GeneratedBlog"]:
+        """
+        Generate a complete blog post on the running event loop.
+        
+        Unlike generate_blog this keeps no per-run state on the instance, so
+        many topics can be generated concurrently by the same system. Phase
+        latencies are recorded under generation_metadata["phase_timings"].
+        """
+        with tracer.trace("blog", topic=topic):
+            return await self._agenerate_blog(topic, save_to_file, output_dir, stream, on_line)
+    
+    async def _agenerate_blog(
+        self,
+        topic: str,
+        save_to_file: bool,
+        output_dir: Optional[str],
+        stream: bool,
+        on_line: Optional[Callable[[str], None]]
+    ) -> Optional["GeneratedBlog"]:
+        """Run the pipeline for agenerate_blog inside its trace."""
+        start_time = time.time()
+        print(f"🚀 Starting pipeline for '{topic}'")
+        
+        try:
+            config.validate_config()
+            
+            phase_timings = {}
+            
+            research_result = self._resume_stage(topic, "research", upstream_ran=False)
+            research_ran = research_result is None
+            if research_ran:
+                if self._stage_skipped(topic, "research"):
+                    return None
+                with tracer.span("phase.research", kind="phase"):
+                    research_response = await self.research_agent.aconduct_research(
+                        topic, reuse="research" not in self.force_stages
+                    )
+                if not research_response.success:
+                    print(f"❌ Research failed for '{topic}': {research_response.error_message}")
+                    return None
+                research_result = research_response.data
+                phase_timings["research"] = research_response.processing_time
+                self._checkpoint(topic, "research", research_result)
+            
+            blog_outline = self._resume_stage(topic, "outline", upstream_ran=research_ran)
+            outline_ran = blog_outline is None
+            if outline_ran:
+                if self._stage_skipped(topic, "outline"):
+                    return None
+                with tracer.span("phase.outline", kind="phase"):
+                    outline_response = await self.outline_agent.acreate_outline(research_result)
+                if not outline_response.success:
+                    print(f"❌ Outline failed for '{topic}': {outline_response.error_message}")
+                    return None
+                blog_outline = outline_response.data
+                phase_timings["outline"] = outline_response.processing_time
+                self._checkpoint(topic, "outline", blog_outline)
+            
+            filepath = None
+            generated_blog = self._resume_stage(topic, "writing", upstream_ran=outline_ran)
+            if generated_blog is not None:
+                generated_blog.generation_metadata["resumed_from_checkpoint"] = True
+            else:
+                if self._stage_skipped(topic, "writing"):
+                    return None
+                
+                with tracer.span("phase.writing", kind="phase", stream=stream):
+                    if stream:
+                        if save_to_file:
+                            filepath = file_handlers.blog_filepath(blog_outline.topic, output_dir=output_dir)
+                        writing_response = await self.writing_agent.awrite_blog_stream(
+                            blog_outline, research_result, on_line=on_line, filepath=filepath
+                        )
+                    else:
+                        writing_response = await self.writing_agent.awrite_blog(blog_outline, research_result)
+                if not writing_response.success:
+                    print(f"❌ Writing failed for '{topic}': {writing_response.error_message}")
+                    self._discard_partial_output(filepath)
+                    return None
+                generated_blog = writing_response.data
+                phase_timings["writing"] = writing_response.processing_time
+                phase_timings["total"] = time.time() - start_time
+                generated_blog.generation_metadata["phase_timings"] = phase_timings
+                self._checkpoint(topic, "writing", generated_blog)
+            
+            # A resumed blog is one whose run stopped before saving it
+            if save_to_file:
+                if filepath is None:
+                    filepath = await asyncio.to_thread(
+                        file_handlers.save_blog_to_file, generated_blog, None, output_dir
+                    )
+                await asyncio.to_thread(file_handlers.save_metadata, generated_blog, filepath)
+            self._clear_checkpoints(topic)
+            
+            print(f"🎉 '{topic}' completed in {time.time() - start_time:.2f}s "
+                  f"({generated_blog.word_count} words)")
+            return generated_blog
+            
+        except Exception as e:
+            print(f"❌ System error for '{topic}': {str(e)}")
+            return None
+    
+    async def agenerate_blogs(
+        self,
+        topics: Iterable[str],
+        max_concurrency: Optional[int] = None,
+        save_to_file: bool = True
+    ) -> List[Optional["GeneratedBlog"]]:
+        """
+        Generate many blog posts concurrently on a single event loop.
+        
+        Args:
+            topics: Blog topics to generate
+            max_concurrency: Maximum generations in flight (uses config if None)
+            save_to_file: Whether to save each blog as it completes
+            
+        Returns:
+            Generated blogs in topic order, None for failed topics
+        """
+        if max_concurrency is None:
+            max_concurrency = config.MAX_CONCURRENT_GENERATIONS
+        topics = list(topics)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def run(topic: str) -> Optional["GeneratedBlog"]:
+            async with semaphore:
+                return await self.agenerate_blog(topic, save_to_file=save_to_file)
+        
+        # Small calls are batched across topics only when several can be in flight
+        with batching(len(topics) > 1 and max_concurrency > 1):
+            return await asyncio.gather(*(run(topic) for topic in topics))
+    
+    def generate_blogs(
+        self,
+        topics: Iterable[str],
+        max_concurrency: Optional[int] = None,
+        save_to_file: bool = True
+    ) -> List[Optional["GeneratedBlog"]]:
+        """Generate many blog posts concurrently from synchronous code."""
+        return asyncio.run(self.agenerate_blogs(topics, max_concurrency, save_to_file))
+    
+    async def arun_batch(
+        self,
+        topics: Iterable[str],
+        workers: Optional[int] = None,
+        output_dir: Optional[str] = None
+    ) -> dict:
+        """
+        Generate a batch of topics through a bounded worker pool.
+        
+        Each blog is written to the output directory as soon as its topic
+        finishes, and a throughput summary is printed and saved at the end.
+        
+        Args:
+            topics: Blog topics to generate
+            workers: Number of concurrent workers (uses config if None)
+            output_dir: Output directory (uses config if None)
+            
+        Returns:
+            Throughput summary dictionary
+        """
+        if workers is None:
+            workers = config.MAX_CONCURRENT_GENERATIONS
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        for topic in topics:
+            queue.put_nowait(topic)
+        
+        total = queue.qsize()
+        stats = BatchStats()
+        print(f"📦 Batch: {total} topics, {workers} workers")
+        
+        async def worker():
+            while True:
+                try:
+                    topic = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                
+                blog = await self.agenerate_blog(topic, save_to_file=True, output_dir=output_dir)
+                if blog:
+                    resumed = blog.generation_metadata.get("resumed_from_checkpoint")
+                    stats.record_success({} if resumed else blog.generation_metadata.get("phase_timings", {}))
+                else:
+                    stats.record_failure()
+                print(f"📦 Progress: {stats.succeeded + stats.failed}/{total}")
+        
+        batch_start = time.time()
+        concurrency = max(1, min(workers, total or 1))
+        # Small calls are batched across topics only when several can be in flight
+        with batching(concurrency > 1):
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+        summary = stats.summary(time.time() - batch_start)
+        if config.SEMANTIC_CACHE_ENABLED:
+            from .utils.semantic_cache import semantic_cache
+            summary["semantic_cache"] = semantic_cache.stats()
+        
+        print("\n" + "=" * 50)
+        print("📊 BATCH SUMMARY")
+        print("=" * 50)
+        print(BatchStats.format_summary(summary))
+        
+        summary_dir = file_handlers.ensure_directory(output_dir or config.OUTPUT_DIR)
+        summary_path = summary_dir / f"batch_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        print(f"✅ Summary saved to: {summary_path}")
+        
+        return summary
+    
+    def run_batch(
+        self,
+        topics: Iterable[str],
+        workers: Optional[int] = None,
+        output_dir: Optional[str] = None
+    ) -> dict:
+        """Run a batch of topics from synchronous code."""
+        return asyncio.run(self.arun_batch(topics, workers, output_dir))
+    
+    def _resume_stage(self, topic: str, stage: str, upstream_ran: bool) -> Optional["BaseModel"]:
+        """
+        Load a stage's checkpoint if it can be reused.
+        
+        A checkpoint is ignored when the stage is forced or when an earlier
+        stage was just rerun, since its output would be stale.
+        """
+        if not checkpoint_store.enabled or upstream_ran or stage in self.force_stages:
+            return None
+        
+        data = checkpoint_store.load(topic, stage)
+        if data is not None:
+            print(f"♻️ Resuming {stage} for '{topic}' from checkpoint")
+        return data
+    
+    def _stage_skipped(self, topic: str, stage: str) -> bool:
+        """Whether a stage without a usable checkpoint must not be run."""
+        if stage in self.skip_stages:
+            print(f"⏭️ Skipping {stage} for '{topic}': no checkpoint to resume from")
+            return True
+        return False
+    
+    @staticmethod
+    def _checkpoint(topic: str, stage: str, data: "BaseModel"):
+        """Persist a completed stage's output."""
+        if checkpoint_store.enabled:
+            checkpoint_store.save(topic, stage, data)
+    
+    @staticmethod
+    def _clear_checkpoints(topic: str):
+        """Drop a finished topic's checkpoints so only unfinished runs resume."""
+        if checkpoint_store.enabled:
+            checkpoint_store.clear(topic)
+    
+    @staticmethod
+    def _discard_partial_output(filepath: Optional[str]):
+        """Remove a partially streamed blog file after a failed writing phase."""
+        if filepath and os.path.exists(filepath):
+            os.remove(filepath)
+    
+    def _display_results(self, blog: "GeneratedBlog", show_content: bool = True):
         """Display generation results."""
         print("\n" + "=" * 50)
         print("🎉 BLOG GENERATION COMPLETED SUCCESSFULLY!")
@@ -108,33 +467,129 @@ class BlogGenerationSystem:
         print(f"📚 Sources used: {len(blog.research_sources)}")
         print()
         
+        if not show_content:
+            return
+        
         # Display formatted blog content
         print("📄 GENERATED BLOG CONTENT:")
         print("=" * 60)
         print(blog.content)
         print("=" * 60)
     
-    def run_from_cli(self):
+    def run_from_cli(self, args: Optional[argparse.Namespace] = None):
         """Run from command line."""
-        if len(sys.argv) < 2:
-            print("Usage: python run.py \"Your blog topic here\"")
-            print("Example: python run.py \"The Future of Artificial Intelligence\"")
+        if args is None:
+            args = build_arg_parser().parse_args()
+        
+        if args.batch:
+            try:
+                topics = load_topics(args.batch)
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"❌ Could not read batch input '{args.batch}': {e}")
+                sys.exit(1)
+            if not topics:
+                print("❌ No topics found in batch input.")
+                sys.exit(1)
+            
+            summary = self.run_batch(topics, workers=args.workers, output_dir=args.output_dir)
+            if summary["failed"]:
+                sys.exit(1)
+            return
+        
+        if not args.topic:
+            print("Usage: python -m src.main \"Your blog topic here\"")
+            print("Example: python -m src.main \"The Future of Artificial Intelligence\"")
             sys.exit(1)
         
-        topic = " ".join(sys.argv[1:])
-        result = self.generate_blog(topic)
+        topic = " ".join(args.topic)
+        result = self.generate_blog(
+            topic,
+            output_dir=args.output_dir,
+            stream=args.stream,
+            on_line=print if args.stream else None
+        )
         
         if not result:
             print("❌ Blog generation failed.")
             sys.exit(1)
 
 
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.main",
+        description="Generate well-researched blog posts with AI agents."
+    )
+    parser.add_argument("topic", nargs="*", help="Blog topic (interactive mode if omitted)")
+    parser.add_argument(
+        "--batch", metavar="FILE",
+        help="Generate every topic in FILE (plain text or JSONL, '-' for stdin)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Concurrent generations in batch mode (default: MAX_CONCURRENT_GENERATIONS)"
+    )
+    parser.add_argument(
+        "--output-dir", default=None,
+        help="Directory for generated blogs (default: OUTPUT_DIR)"
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="Stream the blog to the console and output file as it is written"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Bypass the LLM response and semantic research caches for this run"
+    )
+    parser.add_argument(
+        "--force", action="append", default=[], choices=STAGES, metavar="STAGE",
+        help="Rerun STAGE (research, outline, writing) even if a checkpoint exists; repeatable"
+    )
+    parser.add_argument(
+        "--skip", action="append", default=[], choices=STAGES, metavar="STAGE",
+        help="Never run STAGE; resume it from its checkpoint or stop; repeatable"
+    )
+    parser.add_argument(
+        "--no-checkpoints", action="store_true",
+        help="Neither read nor write stage checkpoints"
+    )
+    parser.add_argument(
+        "--trace-out", metavar="FILE", default=config.TRACE_EXPORT_PATH,
+        help="Write timing spans for every phase, LLM call and HTTP fetch as JSONL"
+    )
+    parser.add_argument(
+        "--metrics-out", metavar="FILE", default=config.METRICS_EXPORT_PATH,
+        help="Write aggregated timings in Prometheus text format"
+    )
+    return parser
+
+
+def export_instrumentation(args: argparse.Namespace):
+    """Export recorded spans to the files requested on the command line."""
+    if args.trace_out:
+        tracer.export_jsonl(args.trace_out)
+        print(f"📈 Trace spans saved to: {args.trace_out}")
+    if args.metrics_out:
+        tracer.export_prometheus(args.metrics_out)
+        print(f"📈 Metrics saved to: {args.metrics_out}")
+
+
 def main():
     """Main entry point."""
-    system = BlogGenerationSystem()
+    args = build_arg_parser().parse_args()
+    if args.no_cache:
+        config.LLM_CACHE_ENABLED = False
+        config.SEMANTIC_CACHE_ENABLED = False
+    if args.no_checkpoints:
+        config.CHECKPOINTS_ENABLED = False
+    tracer.recording = bool(args.trace_out or args.metrics_out)
+    system = BlogGenerationSystem(force_stages=args.force, skip_stages=args.skip)
     
-    if len(sys.argv) > 1:
-        system.run_from_cli()
+    if args.topic or args.batch:
+        try:
+            system.run_from_cli(args)
+        finally:
+            export_instrumentation(args)
     else:
         # Interactive mode
         print("🤖 Welcome to the Blog Generation System!")
@@ -144,6 +599,7 @@ def main():
             topic = input("Enter a blog topic (or 'quit' to exit): ").strip()
             
             if topic.lower() in ['quit', 'exit', 'q']:
+                export_instrumentation(args)
                 print("👋 Thank you for using the system!")
                 break
                 
@@ -152,7 +608,7 @@ def main():
                 continue
                 
             print()
-            result = system.generate_blog(topic)
+            result = system.generate_blog(topic, output_dir=args.output_dir)
             
             if not result:
                 print("❌ Generation failed. Please try again.")
@@ -163,6 +619,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
-
-
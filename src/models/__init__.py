@@ -5,6 +5,7 @@ Models package for Blog Generation System.
 from .blog_models import (
     ResearchSource,
     ResearchResult,
+    ResearchAnalysis,
     BlogSection,
     BlogOutline,
     GeneratedBlog,
@@ -16,6 +17,7 @@ from .blog_models import (
 __all__ = [
     "ResearchSource",
     "ResearchResult", 
+    "ResearchAnalysis",
     "BlogSection",
     "BlogOutline",
     "GeneratedBlog",
@@ -25,6 +25,12 @@ class ResearchResult(BaseModel):
     research_queries: List[str] = Field(description="Search queries used during research")
 
 
+class ResearchAnalysis(BaseModel):
+    """Model representing the structured output of a fused research analysis call."""
+    summary: str = Field(min_length=1, description="Synthesized research summary")
+    key_points: List[str] = Field(min_length=1, description="List of key findings/points")
+
+
 class BlogSection(BaseModel):
     """Model representing a single section of the blog."""
     heading: str = Field(description="Section heading")
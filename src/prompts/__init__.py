@@ -3,11 +3,15 @@ Prompts package for Blog Generation System.
 LLM prompt templates for all agents.
 """
 
+from .registry import PromptRegistry, prompt_registry, registered_prompt
 from .research_prompts import ResearchPrompts, research_prompts
 from .outline_prompts import OutlinePrompts, outline_prompts
 from .writing_prompts import WritingPrompts, writing_prompts
 
 __all__ = [
+    "PromptRegistry",
+    "prompt_registry",
+    "registered_prompt",
     "ResearchPrompts",
     "research_prompts",
     "OutlinePrompts", 
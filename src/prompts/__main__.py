@@ -0,0 +1,41 @@
+"""
+Command line entry point for the prompt registry.
+
+Usage:
+    python -m src.prompts --version v2
+    python -m src.prompts --export prompts/v2
+"""
+
+import argparse
+
+from .registry import load_all, prompt_registry
+
+
+def main():
+    """Validate the selected prompt version or export the built-in prompts."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.prompts",
+        description="Validate versioned prompt templates or export the built-in prompts."
+    )
+    parser.add_argument("--version", default=None, help="Template version to validate (default: PROMPT_VERSION)")
+    parser.add_argument("--export", metavar="DIR", help="Write the built-in prompts as template files into DIR")
+    args = parser.parse_args()
+
+    if args.version:
+        prompt_registry.version = args.version
+        prompt_registry.clear()
+
+    names = load_all()
+    print(f"✅ {len(names)} prompts valid (version: {prompt_registry.version or 'built-in'})")
+    for name in names:
+        path = prompt_registry.template_path(name)
+        source = path if path is not None and path.is_file() else "built-in"
+        print(f"   {name}: {source}")
+
+    if args.export:
+        paths = prompt_registry.export(args.export)
+        print(f"✅ Exported {len(paths)} templates to {args.export}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,14 @@ Designed to guide the LLM in creating well-structured blog outlines.
 """
 
 from langchain_core.prompts import PromptTemplate
+from .registry import registered_prompt
 from ..models.blog_models import BlogOutline
 
 
 class OutlinePrompts:
     """Prompt templates for outline generation."""
     
-    @property
+    @registered_prompt
     def blog_outline_prompt(self) -> PromptTemplate:
         """
         Prompt for generating a comprehensive blog outline from research.
@@ -53,7 +54,7 @@ Return a structured outline with:
 BLOG OUTLINE:"""
         )
     
-    @property
+    @registered_prompt
     def outline_refinement_prompt(self) -> PromptTemplate:
         """
         Prompt for refining an existing outline based on additional research.
@@ -0,0 +1,180 @@
+"""
+Prompt registry for the Blog Generation System.
+Compiles every prompt template once, validates its variables when it is
+loaded, and lets versioned template files replace the built-in prompts.
+"""
+
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from langchain_core.prompts import PromptTemplate
+from langchain_core.prompts.string import get_template_variables
+
+from ..utils.config import config
+
+
+class PromptRegistry:
+    """Caches compiled prompt templates, optionally overridden from files."""
+
+    def __init__(self, template_dir: Optional[str] = None, version: Optional[str] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            template_dir: Root directory of versioned template files (uses config if None)
+            version: Template version subdirectory; None uses the built-in prompts
+                (uses config if both arguments are None)
+        """
+        if template_dir is None and version is None:
+            version = config.PROMPT_VERSION
+        self.template_dir = Path(template_dir or config.PROMPT_TEMPLATE_DIR)
+        self.version = version
+        self._defaults: Dict[str, PromptTemplate] = {}
+        self._compiled: Dict[str, PromptTemplate] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str, default: Callable[[], PromptTemplate]) -> PromptTemplate:
+        """
+        Get a compiled prompt, building and validating it on first use.
+
+        Args:
+            name: Prompt name, also the template file name
+            default: Builds the built-in template
+
+        Returns:
+            Cached PromptTemplate
+
+        Raises:
+            ValueError: If the template uses variables the prompt does not declare
+        """
+        prompt = self._compiled.get(name)
+        if prompt is None:
+            with self._lock:
+                prompt = self._compiled.get(name)
+                if prompt is None:
+                    builtin = default()
+                    self.validate(name, builtin.template, builtin.input_variables, exact=True)
+                    self._defaults[name] = builtin
+                    prompt = self._load_file(name, builtin) or builtin
+                    self._compiled[name] = prompt
+        return prompt
+
+    def template_path(self, name: str) -> Optional[Path]:
+        """Path of the versioned template file for a prompt, if a version is selected."""
+        if not self.version:
+            return None
+        return self.template_dir / self.version / f"{name}.txt"
+
+    def _load_file(self, name: str, builtin: PromptTemplate) -> Optional[PromptTemplate]:
+        """Load and validate a versioned override of a built-in prompt."""
+        path = self.template_path(name)
+        if path is None or not path.is_file():
+            return None
+
+        template = path.read_text(encoding='utf-8')
+        self.validate(name, template, builtin.input_variables)
+        return PromptTemplate(input_variables=list(builtin.input_variables), template=template)
+
+    @staticmethod
+    def validate(name: str, template: str, input_variables: Iterable[str], exact: bool = False):
+        """
+        Check a template's variables against the inputs the agents supply.
+
+        Args:
+            name: Prompt name, for error messages
+            template: Template text in f-string format
+            input_variables: Variables the prompt is called with
+            exact: Also require every input variable to appear in the template
+
+        Raises:
+            ValueError: If the template and its inputs disagree
+        """
+        try:
+            used = set(get_template_variables(template, "f-string"))
+        except ValueError as e:
+            raise ValueError(f"Prompt '{name}' has an invalid template: {e}") from e
+
+        declared = set(input_variables)
+        unknown = used - declared
+        if unknown:
+            raise ValueError(
+                f"Prompt '{name}' uses undeclared variables {sorted(unknown)}; "
+                f"available: {sorted(declared)}"
+            )
+        unused = declared - used
+        if exact and unused:
+            raise ValueError(f"Prompt '{name}' declares variables it never uses: {sorted(unused)}")
+
+    def names(self) -> List[str]:
+        """Names of every prompt loaded so far."""
+        with self._lock:
+            return sorted(self._compiled)
+
+    def export(self, directory: str) -> List[str]:
+        """
+        Write every loaded built-in prompt as a template file, as a starting
+        point for a new version.
+
+        Args:
+            directory: Version directory to write into
+
+        Returns:
+            Paths of the written files
+        """
+        target = Path(directory)
+        target.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            defaults = dict(self._defaults)
+
+        paths = []
+        for name, prompt in sorted(defaults.items()):
+            path = target / f"{name}.txt"
+            path.write_text(prompt.template, encoding='utf-8')
+            paths.append(str(path))
+        return paths
+
+    def clear(self):
+        """Drop every compiled prompt so templates are reloaded on next use."""
+        with self._lock:
+            self._compiled.clear()
+
+
+class registered_prompt:
+    """
+    Decorator for prompt properties: the decorated method builds the
+    built-in template once and the shared registry caches the result.
+    """
+
+    def __init__(self, builder: Callable[[object], PromptTemplate]):
+        """Wrap a method that builds a built-in PromptTemplate."""
+        self.builder = builder
+        self.name = builder.__name__
+        self.__doc__ = builder.__doc__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return prompt_registry.get(self.name, lambda: self.builder(instance))
+
+
+def load_all() -> List[str]:
+    """
+    Load every prompt of the prompt classes, validating built-ins and overrides.
+
+    Returns:
+        Names of the loaded prompts
+    """
+    from .outline_prompts import outline_prompts
+    from .research_prompts import research_prompts
+    from .writing_prompts import writing_prompts
+
+    for prompts in (research_prompts, outline_prompts, writing_prompts):
+        for attribute, value in vars(type(prompts)).items():
+            if isinstance(value, registered_prompt):
+                getattr(prompts, attribute)
+    return prompt_registry.names()
+
+
+# Create registry instance shared by all prompt classes
+prompt_registry = PromptRegistry()
@@ -3,12 +3,13 @@ Prompt templates for the Research Agent.
 """
 
 from langchain_core.prompts import PromptTemplate
+from .registry import registered_prompt
 
 
 class ResearchPrompts:
     """Prompt templates for research operations."""
     
-    @property
+    @registered_prompt
     def research_analysis_prompt(self) -> PromptTemplate:
         """
         Prompt for analyzing and synthesizing research materials.
@@ -33,7 +34,34 @@ INSTRUCTIONS:
 RESEARCH SUMMARY:"""
         )
     
-    @property
+    @registered_prompt
+    def research_analysis_json_prompt(self) -> PromptTemplate:
+        """
+        Prompt for summarizing research materials and extracting key points in one call.
+        """
+        return PromptTemplate(
+            input_variables=["topic", "research_materials", "current_date"],
+            template="""You are an expert research assistant. Analyze the research materials, write a comprehensive summary and extract its key points.
+
+TOPIC: {topic}
+DATE: {current_date}
+
+RESEARCH MATERIALS:
+{research_materials}
+
+INSTRUCTIONS:
+- Write a well-structured research summary (300-500 words)
+- Focus on the most important and relevant information
+- Extract key facts, data, and insights, and maintain factual accuracy
+- Then list the 3-5 most important key points of the summary, each a clear,
+  standalone statement
+- Return only a JSON object of the form
+  {{"summary": "summary text", "key_points": ["point", "point", "point"]}}
+
+ANALYSIS JSON:"""
+        )
+    
+    @registered_prompt
     def key_points_extraction_prompt(self) -> PromptTemplate:
         """
         Prompt for extracting key points from research summary.
@@ -54,7 +82,7 @@ INSTRUCTIONS:
 KEY POINTS (one per line, no bullets):"""
         )
     
-    @property
+    @registered_prompt
     def research_queries_prompt(self) -> PromptTemplate:
         """
         Prompt for generating effective search queries.
@@ -67,9 +95,52 @@ INSTRUCTIONS:
 - Make each query specific and researchable
 - Cover different aspects of the topic
 - Queries should be suitable for Wikipedia and web search
-- Return only the queries, one per line
+- Return only a JSON array of query strings, for example ["query", "query", "query"]
+
+SEARCH QUERIES (JSON array):"""
+        )
+
+    @registered_prompt
+    def batch_research_queries_prompt(self) -> PromptTemplate:
+        """
+        Prompt for generating search queries for several topics in one call.
+        """
+        return PromptTemplate(
+            input_variables=["topics", "count"],
+            template="""Generate 3 specific search queries to research each of these {count} topics:
+
+{topics}
+
+INSTRUCTIONS:
+- Make each query specific and researchable
+- Cover different aspects of each topic
+- Queries should be suitable for Wikipedia and web search
+- Return only a JSON object mapping each topic number to its list of queries,
+  for example {{"1": ["query", "query", "query"], "2": ["query", "query", "query"]}}
+
+JSON:"""
+        )
+
+    @registered_prompt
+    def batch_key_points_prompt(self) -> PromptTemplate:
+        """
+        Prompt for extracting key points from several research summaries in one call.
+        """
+        return PromptTemplate(
+            input_variables=["summaries", "count"],
+            template="""Extract the key points from each of these {count} research summaries:
+
+{summaries}
+
+INSTRUCTIONS:
+- Extract 3-5 most important key points per summary
+- Each point should be a clear, concise statement
+- Focus on unique insights and important facts
+- Make each point standalone and meaningful
+- Return only a JSON object mapping each summary number to its list of key points,
+  for example {{"1": ["point", "point", "point"], "2": ["point", "point", "point"]}}
 
-SEARCH QUERIES (one per line, no numbering):"""
+JSON:"""
         )
 
 
@@ -4,12 +4,13 @@ Designed to guide the LLM in generating high-quality blog content.
 """
 
 from langchain_core.prompts import PromptTemplate
+from .registry import registered_prompt
 
 
 class WritingPrompts:
     """Prompt templates for blog content generation."""
     
-    @property
+    @registered_prompt
     def blog_generation_prompt(self) -> PromptTemplate:
         """
         Prompt for generating the full blog content from outline and research.
@@ -51,7 +52,37 @@ CONTENT QUALITY:
 BLOG CONTENT (in Markdown):"""
         )
     
-    @property
+    @registered_prompt
+    def section_prompt(self) -> PromptTemplate:
+        """
+        Prompt for writing a single body section of the blog independently.
+        """
+        return PromptTemplate(
+            input_variables=["topic", "title", "outline", "section_heading", "section_guidance", "word_count", "research_summary", "current_date"],
+            template="""You are a professional blog writer. Write one section of a blog post titled '{title}' about '{topic}'.
+
+CURRENT DATE: {current_date}
+
+FULL BLOG OUTLINE (for context, other sections are written separately):
+{outline}
+
+SECTION TO WRITE: {section_heading}
+SECTION GUIDANCE: {section_guidance}
+
+RESEARCH SUMMARY:
+{research_summary}
+
+WRITING INSTRUCTIONS:
+1. Write only the body of this section, without the section heading
+2. Use the research findings to support your content with facts and data
+3. Do not repeat material that belongs to other sections of the outline
+4. Use ### subheadings, bullet points and **bold** where appropriate
+5. Aim for about {word_count} words
+
+SECTION CONTENT (in Markdown):"""
+        )
+    
+    @registered_prompt
     def introduction_prompt(self) -> PromptTemplate:
         """
         Specialized prompt for writing compelling introductions.
@@ -75,7 +106,7 @@ INTRODUCTION REQUIREMENTS:
 INTRODUCTION:"""
         )
     
-    @property
+    @registered_prompt
     def conclusion_prompt(self) -> PromptTemplate:
         """
         Specialized prompt for writing effective conclusions.
@@ -3,12 +3,19 @@ Tools package for Blog Generation System.
 Search utilities and text processing tools.
 """
 
+from .http_client import HttpClient, HttpCache, http_client
 from .search_tools import SearchTools, search_tools
 from .text_utils import TextUtils, text_utils
+from .web_search import WebSearch, web_search
 
 __all__ = [
+    "HttpClient",
+    "HttpCache",
+    "http_client",
     "SearchTools",
     "search_tools", 
     "TextUtils",
-    "text_utils"
+    "text_utils",
+    "WebSearch",
+    "web_search"
 ]
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""
+Context packing for the Blog Generation System.
+Fits research sources into a token budget for the analysis prompt, giving
+more room to more relevant sources and cutting at sentence boundaries.
+"""
+
+from typing import Callable, List, Optional
+
+from ..models.blog_models import ResearchSource
+from ..utils.config import config
+from ..utils.rate_limiter import estimate_tokens
+from .text_utils import text_utils
+
+
+DEFAULT_RELEVANCE = 0.5
+MIN_RELEVANCE = 0.05
+
+
+class ContextPacker:
+    """Packs research sources into a token-budgeted prompt section."""
+
+    def __init__(
+        self,
+        max_tokens: Optional[int] = None,
+        count_tokens: Callable[[str], int] = estimate_tokens
+    ):
+        """
+        Initialize the packer.
+
+        Args:
+            max_tokens: Token budget for the packed sources (uses config if None)
+            count_tokens: Token counter (the rate limiter's estimate by default,
+                so budgets and rate limiting agree)
+        """
+        self.max_tokens = max_tokens or config.RESEARCH_CONTEXT_TOKENS
+        self.count_tokens = count_tokens
+
+    @staticmethod
+    def _header(index: int, source: ResearchSource) -> str:
+        """Label line introducing a source in the packed text."""
+        return f"Source {index} ({source.source_type}): {source.reference}\nContent: "
+
+    def allocate(self, needs: List[int], weights: List[float], budget: int) -> List[int]:
+        """
+        Split a token budget between sources in proportion to their weights.
+
+        Sources that need less than their share get exactly what they need and
+        the surplus is shared among the rest (water-filling).
+
+        Args:
+            needs: Tokens each source would use untruncated
+            weights: Relevance weight of each source
+            budget: Tokens to distribute
+
+        Returns:
+            Tokens allotted to each source
+        """
+        allotted = [0] * len(needs)
+        open_sources = [i for i, need in enumerate(needs) if need > 0]
+        remaining = max(0, budget)
+
+        while open_sources and remaining > 0:
+            total_weight = sum(weights[i] for i in open_sources)
+            shares = {i: remaining * weights[i] / total_weight for i in open_sources}
+            satisfied = [i for i in open_sources if needs[i] <= shares[i]]
+            if not satisfied:
+                for i in open_sources:
+                    allotted[i] = int(shares[i])
+                break
+            for i in satisfied:
+                allotted[i] = needs[i]
+                remaining -= needs[i]
+            open_sources = [i for i in open_sources if i not in satisfied]
+        return allotted
+
+    def pack(self, sources: List[ResearchSource], max_tokens: Optional[int] = None) -> str:
+        """
+        Format sources for the analysis prompt within a token budget.
+
+        Args:
+            sources: Research sources, best first
+            max_tokens: Token budget (uses the packer's budget if None)
+
+        Returns:
+            Research materials text, numbering only the sources it includes
+        """
+        budget = max_tokens or self.max_tokens
+        # Budgeted with every source's header; dropped sources only free tokens
+        header_tokens = sum(self.count_tokens(self._header(i, source)) for i, source in enumerate(sources, 1))
+
+        needs = [self.count_tokens(source.content) for source in sources]
+        weights = [
+            max(MIN_RELEVANCE, source.relevance_score if source.relevance_score is not None else DEFAULT_RELEVANCE)
+            for source in sources
+        ]
+        allotted = self.allocate(needs, weights, budget - header_tokens)
+
+        parts = []
+        for source, tokens in zip(sources, allotted):
+            content = text_utils.truncate_sentences(source.content, tokens, self.count_tokens)
+            if content:
+                # Numbered after filtering, so "Source N" labels have no gaps
+                parts.append(f"{self._header(len(parts) + 1, source)}{content}\n\n")
+        return "".join(parts)
+
+
+# Create packer instance
+context_packer = ContextPacker()
@@ -0,0 +1,328 @@
+"""
+Local full-text corpus index for the Blog Generation System.
+Builds an on-disk inverted index over markdown, text and JSONL documents
+(including Wikipedia dumps extracted to JSONL) and searches it with BM25.
+Every array is memory-mapped, so opening an index is instant and lookups
+only touch the postings of the query terms.
+
+Usage:
+    python -m src.tools.corpus_index build docs/ enwiki.jsonl --index .cache/corpus
+    python -m src.tools.corpus_index search "history of solar power" --index .cache/corpus
+"""
+
+import argparse
+import json
+import math
+import re
+import shutil
+import sys
+import threading
+import time
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ..utils.config import config
+from .text_utils import MAX_TOKEN_LENGTH, STOPWORDS, tokenize
+
+
+INDEX_VERSION = 1
+# Terms are stored as fixed-width ASCII; tokenize drops longer tokens
+TERM_BYTES = MAX_TOKEN_LENGTH
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_HEADING_PATTERN = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+
+
+def _iter_documents(paths: Iterable[str]) -> Iterator[Dict[str, str]]:
+    """Yield {title, text, reference} for every document under the given paths."""
+    for root in paths:
+        root_path = Path(root)
+        files = sorted(p for p in root_path.rglob("*") if p.is_file()) if root_path.is_dir() else [root_path]
+        for path in files:
+            suffix = path.suffix.lower()
+            if suffix in (".jsonl", ".json"):
+                with open(path, 'r', encoding='utf-8') as f:
+                    for line_number, line in enumerate(f, 1):
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            continue
+                        if not isinstance(record, dict):
+                            continue
+                        text = record.get("text") or record.get("content") or ""
+                        if text:
+                            yield {
+                                "title": record.get("title") or f"{path.stem} #{line_number}",
+                                "text": text,
+                                "reference": record.get("url") or f"{path}#{line_number}",
+                            }
+            elif suffix in (".md", ".markdown", ".txt"):
+                text = path.read_text(encoding='utf-8', errors='replace')
+                heading = _HEADING_PATTERN.search(text)
+                yield {
+                    "title": heading.group(1).strip() if heading else path.stem.replace('_', ' '),
+                    "text": text,
+                    "reference": str(path),
+                }
+
+
+def _passages(text: str, passage_words: int) -> Iterator[str]:
+    """Split a document into passages of about passage_words words, on paragraph boundaries."""
+    current: List[str] = []
+    count = 0
+    for paragraph in re.split(r"\n\s*\n", text):
+        words = paragraph.split()
+        if not words:
+            continue
+        # Paragraphs longer than a passage are cut into passage-sized pieces
+        for start in range(0, len(words), passage_words):
+            piece = words[start:start + passage_words]
+            if count and count + len(piece) > passage_words:
+                yield " ".join(current)
+                current, count = [], 0
+            current.extend(piece)
+            count += len(piece)
+    if current:
+        yield " ".join(current)
+
+
+def build_index(sources: Iterable[str], index_dir: str, passage_words: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Build a BM25 index over a corpus and write it to index_dir.
+
+    Args:
+        sources: Files or directories of .md/.txt/.jsonl documents
+        index_dir: Output directory (replaced atomically)
+        passage_words: Words per indexed passage (uses config if None)
+
+    Returns:
+        Index metadata
+    """
+    passage_words = passage_words or config.CORPUS_PASSAGE_WORDS
+    target = Path(index_dir)
+    tmp_dir = target.with_name(f"{target.name}.building")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    vocabulary: Dict[str, int] = {}
+    posting_terms = array('i')
+    posting_docs = array('i')
+    posting_tfs = array('H')
+    doc_lengths = array('i')
+    doc_offsets = array('q')
+
+    with open(tmp_dir / "docs.jsonl", 'wb') as docs_file:
+        for document in _iter_documents(sources):
+            for passage in _passages(document["text"], passage_words):
+                terms = tokenize(f"{document['title']} {passage}")
+                if not terms:
+                    continue
+                doc_id = len(doc_lengths)
+                for term, tf in Counter(terms).items():
+                    posting_terms.append(vocabulary.setdefault(term, len(vocabulary)))
+                    posting_docs.append(doc_id)
+                    posting_tfs.append(min(tf, 65535))
+                doc_lengths.append(len(terms))
+                doc_offsets.append(docs_file.tell())
+                record = {"title": document["title"], "reference": document["reference"], "text": passage}
+                docs_file.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b"\n")
+        doc_offsets.append(docs_file.tell())
+
+    # Lay postings out by term in sorted-term order so lookups can binary search the terms
+    terms_sorted = np.array(sorted(vocabulary), dtype=f"S{TERM_BYTES}")
+    term_rank = np.empty(len(vocabulary), dtype=np.int32)
+    for rank, term in enumerate(terms_sorted):
+        term_rank[vocabulary[term.decode('ascii')]] = rank
+
+    ranks = term_rank[np.frombuffer(posting_terms, dtype=np.int32)] if posting_terms else np.empty(0, np.int32)
+    order = np.argsort(ranks, kind="stable")
+    term_offsets = np.zeros(len(terms_sorted) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(ranks, minlength=len(terms_sorted)), out=term_offsets[1:])
+
+    np.save(tmp_dir / "terms.npy", terms_sorted)
+    np.save(tmp_dir / "term_offsets.npy", term_offsets)
+    np.save(tmp_dir / "postings_docs.npy", np.frombuffer(posting_docs, dtype=np.int32)[order] if posting_docs else np.empty(0, np.int32))
+    np.save(tmp_dir / "postings_tfs.npy", np.frombuffer(posting_tfs, dtype=np.uint16)[order] if posting_tfs else np.empty(0, np.uint16))
+    np.save(tmp_dir / "doc_lengths.npy", np.frombuffer(doc_lengths, dtype=np.int32) if doc_lengths else np.empty(0, np.int32))
+    np.save(tmp_dir / "doc_offsets.npy", np.frombuffer(doc_offsets, dtype=np.int64))
+
+    lengths = np.frombuffer(doc_lengths, dtype=np.int32) if doc_lengths else np.empty(0, np.int32)
+    meta = {
+        "version": INDEX_VERSION,
+        "documents": len(doc_lengths),
+        "terms": len(terms_sorted),
+        "postings": len(posting_docs),
+        "avg_doc_length": float(lengths.mean()) if len(lengths) else 0.0,
+        "passage_words": passage_words,
+        "k1": BM25_K1,
+        "b": BM25_B,
+        "built_at": time.time(),
+    }
+    with open(tmp_dir / "meta.json", 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+
+    shutil.rmtree(target, ignore_errors=True)
+    tmp_dir.replace(target)
+    return meta
+
+
+class CorpusIndex:
+    """Read-only BM25 search over a memory-mapped corpus index."""
+
+    def __init__(self, index_dir: str):
+        """
+        Open an index built by build_index.
+
+        Args:
+            index_dir: Index directory
+
+        Raises:
+            FileNotFoundError: If the directory holds no index
+            ValueError: If the index was built by an incompatible version
+        """
+        self.index_dir = Path(index_dir)
+        with open(self.index_dir / "meta.json", 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+        if self.meta.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported corpus index version: {self.meta.get('version')}")
+
+        def load(name: str) -> np.ndarray:
+            return np.load(self.index_dir / f"{name}.npy", mmap_mode='r')
+
+        self.terms = load("terms")
+        self.term_offsets = load("term_offsets")
+        self.postings_docs = load("postings_docs")
+        self.postings_tfs = load("postings_tfs")
+        self.doc_lengths = load("doc_lengths")
+        self.doc_offsets = load("doc_offsets")
+        self._docs_lock = threading.Lock()
+        self._docs_file = open(self.index_dir / "docs.jsonl", 'rb')
+
+    @property
+    def document_count(self) -> int:
+        """Number of indexed passages."""
+        return int(self.meta["documents"])
+
+    def _postings(self, term: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Doc ids and term frequencies for a term, or None if it is not indexed."""
+        key = term.encode('ascii', errors='ignore')
+        position = int(np.searchsorted(self.terms, key))
+        if position >= len(self.terms) or self.terms[position] != key:
+            return None
+        start, end = int(self.term_offsets[position]), int(self.term_offsets[position + 1])
+        return self.postings_docs[start:end], self.postings_tfs[start:end]
+
+    def search(self, query: str, k: int = 5) -> List[Tuple[int, float, float]]:
+        """
+        Rank passages for a query with BM25.
+
+        Args:
+            query: Free-text query
+            k: Maximum results
+
+        Returns:
+            List of (doc id, BM25 score, relevance in 0..1), best first. Relevance
+            is the score divided by the best score any passage could reach for
+            this query, so it is comparable across queries.
+        """
+        total = self.document_count
+        if not total or k <= 0:
+            return []
+
+        k1, b = self.meta["k1"], self.meta["b"]
+        avg_length = self.meta["avg_doc_length"] or 1.0
+        doc_ids, contributions = [], []
+        max_score = 0.0
+
+        for term in set(tokenize(query)):
+            postings = self._postings(term)
+            if postings is None:
+                continue
+            docs, tfs = postings
+            df = len(docs)
+            idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+            tf = tfs.astype(np.float32)
+            norm = k1 * (1 - b + b * self.doc_lengths[docs] / avg_length)
+            doc_ids.append(np.asarray(docs))
+            contributions.append(idf * tf * (k1 + 1) / (tf + norm))
+            max_score += idf * (k1 + 1)
+
+        if not doc_ids:
+            return []
+
+        candidates, inverse = np.unique(np.concatenate(doc_ids), return_inverse=True)
+        scores = np.bincount(inverse, weights=np.concatenate(contributions))
+        top = np.argpartition(-scores, min(k, len(scores)) - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(candidates[i]), float(scores[i]), float(scores[i] / max_score)) for i in top]
+
+    def document(self, doc_id: int) -> Dict[str, str]:
+        """
+        Load a stored passage.
+
+        Args:
+            doc_id: Passage id from search
+
+        Returns:
+            Dictionary with title, reference and text
+        """
+        start, end = int(self.doc_offsets[doc_id]), int(self.doc_offsets[doc_id + 1])
+        with self._docs_lock:
+            self._docs_file.seek(start)
+            raw = self._docs_file.read(end - start)
+        return json.loads(raw)
+
+    def close(self):
+        """Close the passage store."""
+        self._docs_file.close()
+
+
+def main():
+    """Build or query a corpus index from the command line."""
+    parser = argparse.ArgumentParser(prog="python -m src.tools.corpus_index", description="Local BM25 corpus index")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="Index .md/.txt/.jsonl files or directories")
+    build.add_argument("sources", nargs="+", help="Files or directories to index")
+    build.add_argument("--index", default=config.CORPUS_INDEX_DIR or ".cache/corpus_index", help="Index directory")
+    build.add_argument("--passage-words", type=int, default=None, help="Words per passage (default: CORPUS_PASSAGE_WORDS)")
+
+    search = commands.add_parser("search", help="Query an index")
+    search.add_argument("query", help="Search query")
+    search.add_argument("--index", default=config.CORPUS_INDEX_DIR or ".cache/corpus_index", help="Index directory")
+    search.add_argument("-k", type=int, default=5, help="Number of results")
+
+    args = parser.parse_args()
+    if args.command == "build":
+        start = time.time()
+        meta = build_index(args.sources, args.index, args.passage_words)
+        print(
+            f"✅ Indexed {meta['documents']} passages, {meta['terms']} terms "
+            f"in {time.time() - start:.2f}s -> {args.index}"
+        )
+    else:
+        try:
+            index = CorpusIndex(args.index)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not open corpus index '{args.index}': {e}")
+            sys.exit(1)
+        start = time.perf_counter()
+        results = index.search(args.query, args.k)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"🔍 {len(results)} results in {elapsed:.1f} ms")
+        for doc_id, score, relevance in results:
+            document = index.document(doc_id)
+            print(f"   [{relevance:.2f} | bm25 {score:.2f}] {document['title']} ({document['reference']})")
+            print(f"      {document['text'][:160]}")
+
+
+if __name__ == "__main__":
+    main()
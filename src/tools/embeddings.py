@@ -0,0 +1,147 @@
+"""
+Offline text embeddings and source ranking for the Blog Generation System.
+Embeds text with hashed TF-IDF features (no model download, no network) and
+uses the vectors to rank research sources against a topic and drop
+near-duplicates.
+"""
+
+import math
+import zlib
+from collections import Counter
+from typing import Callable, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from ..models.blog_models import ResearchSource
+from ..utils.config import config
+from .text_utils import tokenize
+
+
+class HashedEmbedder:
+    """Hashed TF-IDF embeddings over word unigrams and bigrams."""
+
+    def __init__(self, dim: Optional[int] = None, tokenizer: Optional[Callable[[str], List[str]]] = None):
+        """
+        Initialize the embedder.
+
+        Args:
+            dim: Vector dimension (uses config if None)
+            tokenizer: Splits a text into terms (the stopword-filtering index tokenizer if None)
+        """
+        self.dim = dim or config.EMBEDDING_DIM
+        self.tokenizer = tokenizer or tokenize
+
+    def features(self, text: str) -> Counter:
+        """
+        Count the unigram and bigram features of a text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Feature counts
+        """
+        tokens = self.tokenizer(text)
+        features = Counter(tokens)
+        features.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+        return features
+
+    def _slot(self, feature: str):
+        """Hash a feature to a (column, sign) pair; stable across processes."""
+        digest = zlib.crc32(feature.encode('utf-8'))
+        return digest % self.dim, 1.0 if digest & 0x80000000 else -1.0
+
+    def embed(self, texts: Sequence[str], idf_texts: Optional[Iterable[str]] = None) -> np.ndarray:
+        """
+        Embed a batch of texts as L2-normalized vectors.
+
+        Args:
+            texts: Texts to embed
+            idf_texts: Texts to fit document frequencies on (the batch itself if None;
+                pass an empty list for plain sublinear TF weights)
+
+        Returns:
+            Float32 matrix of shape (len(texts), dim); empty texts give zero rows
+        """
+        counts = [self.features(text) for text in texts]
+        idf_counts = counts if idf_texts is None else [self.features(text) for text in idf_texts]
+
+        document_frequency = Counter()
+        for features in idf_counts:
+            document_frequency.update(features.keys())
+        total = len(idf_counts)
+
+        rows, cols, values = [], [], []
+        for row, features in enumerate(counts):
+            for feature, tf in features.items():
+                column, sign = self._slot(feature)
+                weight = 1.0 + math.log(tf)
+                if total:
+                    weight *= math.log((1 + total) / (1 + document_frequency[feature])) + 1.0
+                rows.append(row)
+                cols.append(column)
+                values.append(sign * weight)
+
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        if rows:
+            np.add.at(matrix, (np.array(rows), np.array(cols)), np.array(values, dtype=np.float32))
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+
+class SourceRanker:
+    """Ranks research sources by similarity to the topic and drops near-duplicates."""
+
+    def __init__(self, embedder: Optional[HashedEmbedder] = None, dedup_threshold: Optional[float] = None):
+        """
+        Initialize the ranker.
+
+        Args:
+            embedder: Text embedder (a default HashedEmbedder if None)
+            dedup_threshold: Cosine similarity above which a source counts as a
+                duplicate of a better one (uses config if None)
+        """
+        self.embedder = embedder or HashedEmbedder()
+        self.dedup_threshold = (
+            config.RESEARCH_DEDUP_THRESHOLD if dedup_threshold is None else dedup_threshold
+        )
+
+    def rank(self, topic: str, sources: List[ResearchSource], k: int) -> List[ResearchSource]:
+        """
+        Keep the k most relevant distinct sources.
+
+        Args:
+            topic: Research topic
+            sources: Candidate sources
+            k: Maximum sources to keep
+
+        Returns:
+            Best sources first, with relevance_score set to their similarity to the topic
+        """
+        if not sources or k <= 0:
+            return []
+
+        texts = [f"{source.reference} {source.content}" for source in sources]
+        vectors = self.embedder.embed([topic] + texts)
+        topic_vector, source_vectors = vectors[0], vectors[1:]
+        scores = source_vectors @ topic_vector
+
+        kept: List[int] = []
+        for index in np.argsort(-scores, kind="stable"):
+            if not sources[index].content.strip():
+                continue
+            if kept and float(np.max(source_vectors[kept] @ source_vectors[index])) >= self.dedup_threshold:
+                continue
+            kept.append(int(index))
+            if len(kept) == k:
+                break
+
+        return [
+            sources[index].model_copy(update={"relevance_score": round(float(scores[index]), 4)})
+            for index in kept
+        ]
+
+
+# Create ranker instance
+source_ranker = SourceRanker()
@@ -0,0 +1,408 @@
+"""
+HTTP client for the Blog Generation System search tools.
+Provides a pooled keep-alive session, retry with jittered backoff and an
+on-disk response cache that revalidates with ETag/Last-Modified.
+"""
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from ..utils.config import config
+from ..utils.instrumentation import Span, tracer
+
+if TYPE_CHECKING:
+    import requests
+
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+CACHEABLE_STATUSES = (200, 404)
+
+
+class HttpResponse:
+    """Minimal response object shared by network and cache hits."""
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        headers: Dict[str, str],
+        content: bytes,
+        from_cache: bool = False,
+        truncated: bool = False
+    ):
+        """Initialize the response; truncated marks a body cut off at a byte cap."""
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.from_cache = from_cache
+        self.truncated = truncated
+
+    @property
+    def text(self) -> str:
+        """Response body decoded as UTF-8."""
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self) -> Any:
+        """Response body parsed as JSON."""
+        return json.loads(self.content)
+
+
+class HttpCache:
+    """On-disk HTTP response cache with TTL, conditional revalidation and LRU eviction."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        max_age_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cached responses (uses config if None)
+            ttl_seconds: Seconds a response is served without revalidation (uses config if None)
+            max_age_seconds: Entries unused for this long are deleted (uses config if None)
+            max_bytes: Size above which least recently used entries are evicted (uses config if None)
+        """
+        self.cache_dir = Path(cache_dir or config.HTTP_CACHE_DIR)
+        self.ttl_seconds = config.HTTP_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.max_age_seconds = config.HTTP_CACHE_MAX_AGE_SECONDS if max_age_seconds is None else max_age_seconds
+        self.max_bytes = config.HTTP_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+        self._last_sweep = 0.0
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        """Hash a full request URL into a cache key."""
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _paths(self, url: str):
+        """Metadata and body file paths of a URL's entry."""
+        key = self.key_for(url)
+        directory = self.cache_dir / key[:2]
+        return directory / f"{key}.json", directory / f"{key}.body"
+
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a cached entry.
+
+        Args:
+            url: Full request URL
+
+        Returns:
+            Entry dictionary with body bytes, or None if not cached
+        """
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            entry["body"] = body_path.read_bytes()
+            # The metadata file's mtime records the last use for eviction
+            os.utime(meta_path)
+            return entry
+        except (OSError, ValueError):
+            return None
+
+    def store(self, url: str, response: HttpResponse):
+        """
+        Store a response together with its validators.
+
+        Args:
+            url: Full request URL
+            response: Response to cache
+        """
+        meta_path, body_path = self._paths(url)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+
+        entry = {
+            "url": url,
+            "status_code": response.status_code,
+            "headers": {
+                name: value for name, value in response.headers.items()
+                if name.lower() in ("content-type", "etag", "last-modified")
+            },
+            "fetched_at": time.time(),
+        }
+
+        # Write to temporary files first so concurrent readers never see partial entries
+        tmp_suffix = f".{threading.get_ident()}.tmp"
+        body_tmp = body_path.with_name(body_path.name + tmp_suffix)
+        meta_tmp = meta_path.with_name(meta_path.name + tmp_suffix)
+        meta_bytes = json.dumps(entry).encode('utf-8')
+        body_tmp.write_bytes(response.content)
+        meta_tmp.write_bytes(meta_bytes)
+        body_tmp.replace(body_path)
+        meta_tmp.replace(meta_path)
+
+        with self._lock:
+            if self._total_bytes is not None:
+                # Sizes of what was written, not stat(): a concurrent sweep may already have removed it
+                self._total_bytes += len(response.content) + len(meta_bytes)
+            due = (
+                self._total_bytes is None
+                or (self.max_bytes and self._total_bytes > self.max_bytes)
+                or time.time() - self._last_sweep > self.ttl_seconds
+            )
+            if due:
+                self._sweep()
+
+    def touch(self, url: str):
+        """Mark a cached entry as freshly revalidated."""
+        meta_path, _ = self._paths(url)
+        entry = self.load(url)
+        if entry is None:
+            return
+        entry.pop("body", None)
+        entry["fetched_at"] = time.time()
+        meta_tmp = meta_path.with_name(f"{meta_path.name}.{threading.get_ident()}.tmp")
+        with open(meta_tmp, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        meta_tmp.replace(meta_path)
+
+    def _sweep(self):
+        """
+        Delete entries unused for max_age_seconds, then least recently used
+        entries until the cache fits in max_bytes. Caller holds the lock.
+        """
+        now = time.time()
+        entries = []
+        total = 0
+        for meta_path in self.cache_dir.glob("*/*.json"):
+            body_path = meta_path.with_suffix(".body")
+            try:
+                used_at = meta_path.stat().st_mtime
+                size = meta_path.stat().st_size + (body_path.stat().st_size if body_path.exists() else 0)
+            except OSError:
+                continue
+            if self.max_age_seconds and now - used_at > self.max_age_seconds:
+                self._remove(meta_path, body_path)
+                continue
+            entries.append((used_at, size, meta_path, body_path))
+            total += size
+
+        if self.max_bytes and total > self.max_bytes:
+            # Evict down to 90% so we do not evict again on the next store
+            target = total - int(self.max_bytes * 0.9)
+            entries.sort(key=lambda item: item[0])
+            freed = 0
+            for _, size, meta_path, body_path in entries:
+                if freed >= target:
+                    break
+                self._remove(meta_path, body_path)
+                freed += size
+            total -= freed
+
+        self._total_bytes = total
+        self._last_sweep = now
+
+    @staticmethod
+    def _remove(meta_path: Path, body_path: Path):
+        """Delete an entry's files, ignoring ones already gone."""
+        # Metadata first: an entry without it is never loaded
+        for path in (meta_path, body_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Whether an entry can be served without revalidation."""
+        return time.time() - entry.get("fetched_at", 0) < self.ttl_seconds
+
+
+class HttpClient:
+    """Pooled HTTP client with retry, jittered backoff and response caching."""
+
+    def __init__(
+        self,
+        pool_size: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        cache: Optional[HttpCache] = None
+    ):
+        """
+        Initialize the client. The session is created lazily on first request.
+
+        Args:
+            pool_size: Keep-alive connections per host (uses config if None)
+            max_retries: Retries on connection errors and 429/5xx (uses config if None)
+            cache: Response cache (a default HttpCache if None)
+        """
+        self.pool_size = pool_size or config.HTTP_POOL_SIZE
+        self.max_retries = config.HTTP_MAX_RETRIES if max_retries is None else max_retries
+        self.cache = cache or HttpCache()
+        self._session: Optional["requests.Session"] = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> "requests.Session":
+        """Shared keep-alive session sized to the connection pool."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    # requests is imported on first use to keep startup fast
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=self.pool_size,
+                        pool_maxsize=self.pool_size,
+                        max_retries=0
+                    )
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    session.headers["User-Agent"] = config.HTTP_USER_AGENT
+                    self._session = session
+        return self._session
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        use_cache: bool = True,
+        max_bytes: Optional[int] = None
+    ) -> HttpResponse:
+        """
+        Perform a GET request, serving and revalidating from the cache.
+
+        Args:
+            url: Request URL
+            params: Optional query parameters
+            headers: Optional extra request headers
+            use_cache: Whether to use the response cache for this request
+            max_bytes: Stream the body and stop reading after this many bytes
+
+        Returns:
+            HttpResponse from the network or the cache
+        """
+        if params:
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(sorted(params.items()))}"
+
+        use_cache = use_cache and config.HTTP_CACHE_ENABLED
+
+        with tracer.span("http.get", kind="http", host=urlsplit(url).netloc, url=url) as span:
+            request_headers = dict(headers or {})
+            entry = self.cache.load(url) if use_cache else None
+
+            if entry is not None:
+                if self.cache.is_fresh(entry):
+                    span.set(cache="hit", status=entry["status_code"], chars_out=len(entry["body"]))
+                    return self._from_entry(url, entry)
+
+                cached_headers = {name.lower(): value for name, value in entry["headers"].items()}
+                if "etag" in cached_headers:
+                    request_headers["If-None-Match"] = cached_headers["etag"]
+                if "last-modified" in cached_headers:
+                    request_headers["If-Modified-Since"] = cached_headers["last-modified"]
+
+            response = self._request_with_retry(url, request_headers, span, max_bytes)
+
+            if response.status_code == 304 and entry is not None:
+                span.set(cache="revalidated", status=304, chars_out=len(entry["body"]))
+                self.cache.touch(url)
+                return self._from_entry(url, entry)
+
+            span.set(
+                cache="miss" if use_cache else "bypass",
+                status=response.status_code,
+                chars_out=len(response.content)
+            )
+            if response.truncated:
+                span.set(truncated=True)
+            # A body cut off at max_bytes must not be served later as the whole page
+            if use_cache and response.status_code in CACHEABLE_STATUSES and not response.truncated:
+                self.cache.store(url, response)
+            return response
+
+    @staticmethod
+    def _from_entry(url: str, entry: Dict[str, Any]) -> HttpResponse:
+        """Build a response from a cache entry."""
+        return HttpResponse(url, entry["status_code"], entry["headers"], entry["body"], from_cache=True)
+
+    def _request_with_retry(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        span: Span,
+        max_bytes: Optional[int] = None
+    ) -> HttpResponse:
+        """Send a request, retrying connection errors and 429/5xx with backoff."""
+        import requests
+
+        timeout = (config.HTTP_CONNECT_TIMEOUT, config.HTTP_READ_TIMEOUT)
+
+        for attempt in range(self.max_retries + 1):
+            span.set(retries=attempt)
+            last_attempt = attempt == self.max_retries
+            try:
+                raw = self.session.get(url, headers=headers, timeout=timeout, stream=max_bytes is not None)
+                if raw.status_code in RETRY_STATUSES and not last_attempt:
+                    # Hand the connection back to the pool before waiting; the error body is not needed
+                    raw.close()
+                    retry_after = self._retry_after(raw.headers.get("Retry-After"))
+                    time.sleep(retry_after if retry_after is not None else self._backoff(attempt))
+                    continue
+                if max_bytes is None:
+                    content, truncated = raw.content, False
+                else:
+                    content, truncated = self._read_capped(raw, max_bytes)
+            except (requests.ConnectionError, requests.Timeout):
+                if last_attempt:
+                    raise
+                time.sleep(self._backoff(attempt))
+                continue
+
+            return HttpResponse(url, raw.status_code, dict(raw.headers), content, truncated=truncated)
+
+    @staticmethod
+    def _read_capped(raw: "requests.Response", max_bytes: int) -> Tuple[bytes, bool]:
+        """Read a streamed body up to max_bytes, then drop the connection; also report whether it was cut off."""
+        chunks = []
+        size = 0
+        try:
+            for chunk in raw.iter_content(chunk_size=16384):
+                chunks.append(chunk)
+                size += len(chunk)
+                # One byte past the cap tells a cut-off body from one of exactly max_bytes
+                if size > max_bytes:
+                    break
+        finally:
+            raw.close()
+        return b"".join(chunks)[:max_bytes], size > max_bytes
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """Exponential backoff with full jitter."""
+        ceiling = min(config.HTTP_BACKOFF_MAX, config.HTTP_BACKOFF_BASE * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def _retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header given in seconds or as an HTTP date."""
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return max(0.0, min(seconds, config.HTTP_BACKOFF_MAX))
+
+
+# Create shared client instance
+http_client = HttpClient()
@@ -2,88 +2,282 @@
 Search and research tools for the Blog Generation System.
 """
 
+import threading
 import warnings
-from typing import List
-import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
 from ..models.blog_models import ResearchSource
+from ..utils.config import config
+from .http_client import HttpClient, http_client
+from .web_search import WebSearch, web_search
+
+if TYPE_CHECKING:
+    from .corpus_index import CorpusIndex
+
+
+_FALLBACK_REFERENCE = "Wikipedia Search: "
 
 
 class SearchTools:
     """Wrapper class for search and research tools."""
     
-    def __init__(self):
-        """Initialize search tools."""
-        pass
+    def __init__(
+        self,
+        client: Optional[HttpClient] = None,
+        corpus_index_dir: Optional[str] = None,
+        web: Optional[WebSearch] = None
+    ):
+        """
+        Initialize search tools with a shared pooled HTTP client.
         
-    def search_wikipedia(self, query: str) -> List[ResearchSource]:
+        Args:
+            client: HTTP client (the shared client if None)
+            corpus_index_dir: Local corpus index directory (uses config if None)
+            web: Web search backend (the shared backend if None)
         """
-        Search Wikipedia for information.
+        self.http = client or http_client
+        self.corpus_index_dir = corpus_index_dir
+        self._corpus: Optional["CorpusIndex"] = None
+        self._corpus_lock = threading.Lock()
+        self._title_cache: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        self._title_lock = threading.Lock()
+        self.web = web or web_search
+    
+    def corpus_available(self) -> bool:
+        """Whether a built local corpus index is configured."""
+        index_dir = self.corpus_index_dir or config.CORPUS_INDEX_DIR
+        return bool(index_dir) and (Path(index_dir) / "meta.json").is_file()
+    
+    @property
+    def corpus(self) -> "CorpusIndex":
+        """Local corpus index, memory-mapped on first use."""
+        if self._corpus is None:
+            with self._corpus_lock:
+                if self._corpus is None:
+                    # numpy is only needed once a corpus is actually searched
+                    from .corpus_index import CorpusIndex
+                    self._corpus = CorpusIndex(self.corpus_index_dir or config.CORPUS_INDEX_DIR)
+        return self._corpus
+        
+    @property
+    def _wikipedia_api(self) -> str:
+        return f"{config.WIKIPEDIA_BASE_URL}/w/api.php"
+    
+    def resolve_wikipedia_titles(self, query: str, limit: Optional[int] = None) -> List[str]:
         """
-        try:
-            # Simple Wikipedia API implementation
-            url = "https://en.wikipedia.org/api/rest_v1/page/summary/"
-            formatted_query = query.replace(" ", "_")
-            response = requests.get(url + formatted_query, timeout=10)
+        Resolve a natural-language query to article titles with the search API.
+        
+        Args:
+            query: Search query
+            limit: Maximum titles (uses config if None)
+            
+        Returns:
+            Matching article titles, best first
+        """
+        response = self.http.get(self._wikipedia_api, params={
+            "action": "query",
+            "list": "search",
+            "srsearch": query,
+            "srlimit": limit or config.WIKIPEDIA_MAX_RESULTS,
+            "srprop": "",
+            "format": "json",
+            "formatversion": 2,
+        })
+        if response.status_code != 200:
+            raise RuntimeError(f"Wikipedia search returned HTTP {response.status_code}")
+        return [hit["title"] for hit in response.json().get("query", {}).get("search", [])]
+    
+    def fetch_wikipedia_extracts(self, titles: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Fetch the introduction extracts of many articles, batching uncached titles
+        into multi-title requests.
+        
+        Args:
+            titles: Article titles
             
-            if response.status_code == 200:
-                data = response.json()
-                source = ResearchSource(
-                    content=data.get('extract', f'Information about {query}'),
+        Returns:
+            Mapping of each requested title to its plain-text extract (None if missing)
+        """
+        extracts: Dict[str, Optional[str]] = {}
+        pending = []
+        with self._title_lock:
+            for title in dict.fromkeys(titles):
+                if title in self._title_cache:
+                    self._title_cache.move_to_end(title)
+                    extracts[title] = self._title_cache[title]
+                elif '|' not in title:
+                    pending.append(title)
+        
+        # Sorted so a repeated title set maps to the same cacheable URL
+        pending.sort()
+        batch_size = config.WIKIPEDIA_EXTRACTS_PER_REQUEST
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            fetched = self._fetch_extract_batch(batch)
+            with self._title_lock:
+                for title in batch:
+                    self._title_cache[title] = extracts[title] = fetched.get(title)
+                while len(self._title_cache) > config.WIKIPEDIA_TITLE_CACHE_SIZE:
+                    self._title_cache.popitem(last=False)
+        return extracts
+    
+    def _fetch_extract_batch(self, titles: List[str]) -> Dict[str, Optional[str]]:
+        """Fetch extracts for up to one request's worth of titles, following redirects."""
+        response = self.http.get(self._wikipedia_api, params={
+            "action": "query",
+            "prop": "extracts",
+            "exintro": 1,
+            "explaintext": 1,
+            "exlimit": "max",
+            "redirects": 1,
+            "titles": "|".join(titles),
+            "format": "json",
+            "formatversion": 2,
+        })
+        if response.status_code != 200:
+            raise RuntimeError(f"Wikipedia extracts returned HTTP {response.status_code}")
+        query = response.json().get("query", {})
+        
+        # Map normalized and redirected titles back to the requested ones
+        aliases = {title: title for title in titles}
+        for mapping in query.get("normalized", []) + query.get("redirects", []):
+            for requested, alias in list(aliases.items()):
+                if alias == mapping.get("from"):
+                    aliases[requested] = mapping.get("to")
+        
+        pages = {
+            page.get("title"): page.get("extract")
+            for page in query.get("pages", [])
+            if not page.get("missing") and not page.get("invalid")
+        }
+        return {requested: pages.get(alias) or None for requested, alias in aliases.items()}
+    
+    def search_wikipedia_many(self, queries: List[str]) -> List[List[ResearchSource]]:
+        """
+        Search Wikipedia for several queries: resolve every query to titles
+        concurrently, then fetch all their extracts in batched requests.
+        
+        Args:
+            queries: Search queries
+            
+        Returns:
+            Sources per query, in query order
+        """
+        if not queries:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=len(queries), thread_name_prefix="wikipedia") as executor:
+            futures = [executor.submit(copy_context().run, self.resolve_wikipedia_titles, query) for query in queries]
+            resolved = []
+            for query, future in zip(queries, futures):
+                try:
+                    resolved.append(future.result())
+                except Exception as e:
+                    print(f"⚠️ Wikipedia search error for '{query}': {e}")
+                    resolved.append(None)
+        
+        try:
+            extracts = self.fetch_wikipedia_extracts(
+                [title for titles in resolved if titles for title in titles]
+            )
+        except Exception as e:
+            print(f"⚠️ Wikipedia fetch error: {e}")
+            extracts = {}
+        
+        results = []
+        for query, titles in zip(queries, resolved):
+            sources = [
+                ResearchSource(
+                    content=extracts[title],
                     source_type="wikipedia",
-                    reference=data.get('title', query),
+                    reference=title,
                     relevance_score=0.9
                 )
-                return [source]
-            else:
-                # Return a fallback source
-                fallback_source = ResearchSource(
-                    content=f"Wikipedia information about {query}. This topic covers important aspects and developments.",
-                    source_type="wikipedia",
-                    reference=f"Wikipedia: {query}",
-                    relevance_score=0.7
-                )
-                return [fallback_source]
+                for title in titles or [] if extracts.get(title)
+            ]
+            if titles is None or (titles and not sources and not extracts):
+                sources = [self._wikipedia_fallback(query)]
+            results.append(sources)
+        return results
+    
+    def search_wikipedia(self, query: str) -> List[ResearchSource]:
+        """
+        Search Wikipedia for information.
+        
+        Args:
+            query: Search query
             
-        except Exception as e:
-            print(f"⚠️ Wikipedia search error for '{query}': {e}")
-            # Return fallback
-            fallback_source = ResearchSource(
-                content=f"Research information about {query}. This would contain detailed Wikipedia content in a production environment.",
-                source_type="wikipedia",
-                reference=f"Wikipedia Search: {query}",
-                relevance_score=0.5
-            )
-            return [fallback_source]
+        Returns:
+            Articles matching the query, or a fallback source if Wikipedia is unreachable
+        """
+        return self.search_wikipedia_many([query])[0]
     
-    def search_web(self, query: str) -> List[ResearchSource]:
+    @staticmethod
+    def _wikipedia_fallback(query: str) -> ResearchSource:
+        """Placeholder source used when Wikipedia cannot be reached."""
+        return ResearchSource(
+            content=f"Research information about {query}. This would contain detailed Wikipedia content in a production environment.",
+            source_type="wikipedia",
+            reference=f"{_FALLBACK_REFERENCE}{query}",
+            relevance_score=0.5
+        )
+    
+    @staticmethod
+    def is_fallback(source: ResearchSource) -> bool:
+        """Whether a source is the placeholder used when Wikipedia cannot be reached."""
+        return source.source_type == "wikipedia" and source.reference.startswith(_FALLBACK_REFERENCE)
+    
+    def search_web_many(self, queries: List[str]) -> List[List[ResearchSource]]:
         """
-        Simple web search implementation.
+        Search the web for several queries, fetching the result pages concurrently.
+        
+        Args:
+            queries: Search queries
+            
+        Returns:
+            Page sources per query, in query order (empty if web search is disabled)
         """
-        try:
+        if not config.WEB_SEARCH_ENABLED:
+            return [[] for _ in queries]
+        return self.web.search_many(queries)
+    
+    def search_web(self, query: str) -> List[ResearchSource]:
+        """
+        Search the web for information.
+        
+        Args:
+            query: Search query
             
-            source = ResearchSource(
-                content=f"Web research on '{query}' reveals current trends, developments, and future prospects. Key areas include technological advancements, market impact, and potential applications across various sectors.",
-                source_type="web_search", 
-                reference=f"Web Search: {query}",
-                relevance_score=0.7
-            )
-            return [source]
+        Returns:
+            Cleaned text of the top result pages
+        """
+        return self.search_web_many([query])[0]
+    
+    def search_corpus(self, query: str) -> List[ResearchSource]:
+        """
+        Search the local corpus index with BM25.
+        
+        Args:
+            query: Search query
             
-        except Exception as e:
-            print(f"⚠️ Web search error for '{query}': {e}")
-            fallback_source = ResearchSource(
-                content=f"Comprehensive web research about {query} covering current state, challenges, and future directions.",
-                source_type="web_search",
-                reference=f"Web Research: {query}",
-                relevance_score=0.5
-            )
-            return [fallback_source]
+        Returns:
+            Best matching passages, scored by relevance to the query
+        """
+        index = self.corpus
+        sources = []
+        for doc_id, _, relevance in index.search(query, config.CORPUS_MAX_RESULTS):
+            document = index.document(doc_id)
+            sources.append(ResearchSource(
+                content=document["text"],
+                source_type="corpus",
+                reference=f"{document['title']} ({document['reference']})",
+                relevance_score=round(relevance, 4)
+            ))
+        return sources
 
 
 # Create tool instance
 search_tools = SearchTools()
-
-
-
-
-
@@ -0,0 +1,255 @@
+"""
+Local stub HTTP server for the Blog Generation System search tools.
+Mimics the Wikipedia endpoints used by SearchTools (REST page summaries and
+the action API's search and multi-title extracts) and a web search engine
+(/search returning links to HTML pages under /pages/) so the HTTP client,
+its cache and the web fetcher can be exercised without network access.
+
+Run standalone and point the tools at it:
+
+    python -m src.tools.stub_server --port 8765
+    WIKIPEDIA_BASE_URL=http://127.0.0.1:8765 WEB_SEARCH_URL=http://127.0.0.1:8765 python -m src.main "Topic"
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+
+class _Server(ThreadingHTTPServer):
+    # The default backlog of 5 drops connections under concurrent load; a dropped
+    # SYN costs a one-second retransmit and skews latency measurements
+    request_queue_size = 128
+
+
+class StubServer:
+    """In-process HTTP server serving canned Wikipedia and web search responses."""
+
+    def __init__(
+        self,
+        pages: Optional[Dict[str, str]] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        generate_missing: bool = True
+    ):
+        """
+        Initialize the server.
+
+        Args:
+            pages: Mapping of page title to extract text
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            generate_missing: Synthesize pages for unknown titles instead of 404
+        """
+        self.pages = dict(pages or {})
+        self.generate_missing = generate_missing
+        self.request_log: List[Tuple[str, Dict[str, str]]] = []
+        self.last_modified = formatdate(usegmt=True)
+        self._failures: List[int] = []
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to use in place of https://en.wikipedia.org."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def fail_next(self, count: int, status: int = 503):
+        """Answer the next count requests with an error status."""
+        with self._lock:
+            self._failures.extend([status] * count)
+
+    def start(self) -> "StubServer":
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the server."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _page_extract(self, title: str) -> Optional[str]:
+        """Look up or synthesize the extract for a page title."""
+        if title in self.pages:
+            return self.pages[title]
+        if self.generate_missing:
+            return (
+                f"{title} is a subject covered by this stub encyclopedia. "
+                f"This extract describes the history, current state and outlook of {title}."
+            )
+        return None
+
+    def _web_page(self, slug: str) -> str:
+        """Render an HTML result page, wrapped in navigation and script boilerplate."""
+        subject = slug.replace("-", " ")
+        paragraphs = "".join(
+            f"<p>{sentence.format(subject=subject)}</p>"
+            for sentence in (
+                "Interest in {subject} has grown steadily, and practitioners now describe it as a core part of their planning rather than an experiment.",
+                "Surveys of organizations working on {subject} show that most teams start with a small pilot, measure the results carefully and expand only once the benefits are clear.",
+                "The main obstacles reported for {subject} are cost, a shortage of experienced staff and uncertainty about regulation, although each has eased in recent years.",
+                "Looking ahead, analysts expect {subject} to keep spreading as tools mature and shared standards make it easier to compare approaches.",
+            )
+        )
+        return (
+            f"<!DOCTYPE html><html><head><title>{subject.title()} | Stub Web</title>"
+            "<style>body { font-family: sans-serif; }</style>"
+            "<script>window.analytics = { track: function () {} };</script></head><body>"
+            "<header><nav><a href='/'>Home</a> <a href='/about'>About</a> <a href='/contact'>Contact us today for a free consultation and quote</a></nav></header>"
+            f"<main><article><h1>{subject.title()}</h1>{paragraphs}</article></main>"
+            "<aside><p>Related posts you might enjoy reading next, hand picked by our editors for you</p></aside>"
+            "<footer><p>Copyright Stub Web. All rights reserved. Terms of service and privacy policy apply.</p></footer>"
+            "</body></html>"
+        )
+
+    def _web_search(self, search: str, limit: int) -> dict:
+        """Answer /search with links to generated pages for the query."""
+        slug = "-".join(search.lower().split())
+        results = []
+        for rank, angle in enumerate(("overview", "guide", "analysis", "news")[:limit], start=1):
+            results.append({
+                "title": f"{search.strip().title()} {angle.title()}",
+                "url": f"{self.base_url}/pages/{quote(slug)}?view={angle}",
+                "snippet": f"A {angle} of {search.strip()} covering its background, adoption and outlook.",
+            })
+        return {"results": results}
+
+    def _route(self, path: str, query: Dict[str, List[str]]) -> Tuple[int, Union[dict, str]]:
+        """Resolve a request path to a status code and a JSON payload or HTML page."""
+        summary_prefix = "/api/rest_v1/page/summary/"
+        if path.startswith(summary_prefix):
+            title = unquote(path[len(summary_prefix):]).replace("_", " ")
+            extract = self._page_extract(title)
+            if extract is None:
+                return 404, {"type": "not_found", "title": "Not found."}
+            return 200, {"title": title, "extract": extract}
+
+        if path == "/w/api.php":
+            return self._action_api({name: values[-1] for name, values in query.items()})
+
+        if path == "/search":
+            search = query.get("q", [""])[-1]
+            return 200, self._web_search(search, int(query.get("max_results", ["3"])[-1]))
+
+        if path.startswith("/pages/"):
+            return 200, self._web_page(unquote(path[len("/pages/"):]))
+
+        return 404, {"type": "not_found", "title": "Not found."}
+
+    def _search_titles(self, search: str, limit: int) -> List[str]:
+        """Rank known titles by words shared with the search, then synthesize one."""
+        words = set(search.lower().split())
+        scored = []
+        for title in self.pages:
+            overlap = len(words & set(title.lower().split()))
+            if overlap:
+                scored.append((-overlap, title))
+        titles = [title for _, title in sorted(scored)]
+        if self.generate_missing and search.strip():
+            generated = search.strip()[0].upper() + search.strip()[1:]
+            if generated not in titles:
+                titles.append(generated)
+        return titles[:limit]
+
+    def _action_api(self, params: Dict[str, str]) -> Tuple[int, dict]:
+        """Answer the MediaWiki action API: list=search and prop=extracts."""
+        if params.get("action") != "query":
+            return 400, {"error": {"code": "badvalue", "info": "Unsupported action."}}
+
+        if params.get("list") == "search":
+            titles = self._search_titles(params.get("srsearch", ""), int(params.get("srlimit", "10")))
+            return 200, {"query": {"search": [{"ns": 0, "title": title} for title in titles]}}
+
+        if params.get("prop") == "extracts":
+            pages = []
+            for title in params.get("titles", "").split("|"):
+                if not title:
+                    continue
+                extract = self._page_extract(title)
+                if extract is None:
+                    pages.append({"ns": 0, "title": title, "missing": True})
+                else:
+                    pages.append({"pageid": len(pages) + 1, "ns": 0, "title": title, "extract": extract})
+            return 200, {"batchcomplete": True, "query": {"pages": pages}}
+
+        return 400, {"error": {"code": "badvalue", "info": "Unsupported query."}}
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                with stub._lock:
+                    stub.request_log.append((self.path, dict(self.headers)))
+                    failure = stub._failures.pop(0) if stub._failures else None
+
+                if failure is not None:
+                    self._send(failure, b'{"error": "stub failure"}', {"Retry-After": "0"})
+                    return
+
+                status, payload = stub._route(parts.path, parse_qs(parts.query))
+                if isinstance(payload, str):
+                    body, content_type = payload.encode('utf-8'), "text/html; charset=utf-8"
+                else:
+                    body, content_type = json.dumps(payload).encode('utf-8'), "application/json; charset=utf-8"
+                etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+
+                if status == 200 and self.headers.get("If-None-Match") == etag:
+                    self._send(304, b"", {"ETag": etag})
+                    return
+
+                self._send(status, body, {
+                    "Content-Type": content_type,
+                    "ETag": etag,
+                    "Last-Modified": stub.last_modified,
+                })
+
+            def _send(self, status: int, body: bytes, headers: Dict[str, str]):
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if body:
+                    self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    """Run the stub server in the foreground."""
+    parser = argparse.ArgumentParser(description="Local stub server for the search tools.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = StubServer(host=args.host, port=args.port)
+    print(f"🧪 Stub server listening on {server.base_url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
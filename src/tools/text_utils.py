@@ -3,11 +3,49 @@ Text utility functions for the Blog Generation System.
 Provides text processing, cleaning, and analysis capabilities.
 """
 
+import math
 import re
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from ..utils.config import config
 
 
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+MAX_TOKEN_LENGTH = 32
+
+STOPWORDS = frozenset("""
+a about above after again against all am an and any are as at be because been before being below between
+both but by can did do does doing down during each few for from further had has have having he her here
+hers herself him himself his how i if in into is it its itself just me more most my myself no nor not now
+of off on once only or other our ours ourselves out over own same she should so some such than that the
+their theirs them themselves then there these they this those through to too under until up very was we
+were what when where which while who whom why will with you your yours yourself yourselves
+""".split())
+# A word (group 1) or a phrase delimiter: punctuation other than in-word hyphens and apostrophes
+_PHRASE_TOKEN = re.compile(r"([a-z0-9]+(?:['-][a-z0-9]+)*)|[^\sa-z0-9]")
+# Words that carry no topic on their own, in addition to STOPWORDS
+_PHRASE_STOPWORDS = frozenset("""
+also among around could etc however including like made make makes many may might much must new often one
+per several since still though thus use used uses using via well whether within without would yet
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase terms, dropping stopwords and oversized tokens.
+
+    Args:
+        text: Input text
+
+    Returns:
+        List of terms in order of appearance
+    """
+    return [
+        token for token in _TOKEN_PATTERN.findall(text.lower())
+        if token not in STOPWORDS and len(token) <= MAX_TOKEN_LENGTH
+    ]
+
+
 class TextUtils:
     """Utility class for text processing operations."""
     
@@ -70,22 +108,161 @@ class TextUtils:
         return truncated + "..."
     
     @staticmethod
-    def extract_key_phrases(text: str, max_phrases: int = 10) -> List[str]:
+    def split_sentences(text: str) -> List[str]:
+        """
+        Split text into sentences at terminal punctuation.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            Non-empty sentences in order
+        """
+        return [sentence for sentence in _SENTENCE_BOUNDARY.split(text.strip()) if sentence]
+    
+    @staticmethod
+    def truncate_sentences(text: str, max_tokens: int, count_tokens: Callable[[str], int]) -> str:
+        """
+        Truncate text to a token budget, cutting at a sentence boundary.
+        
+        Args:
+            text: Input text
+            max_tokens: Token budget
+            count_tokens: Token counter for a piece of text
+            
+        Returns:
+            The leading whole sentences that fit, or the first sentence cut at a
+            word boundary with "..." if not even one sentence fits
+        """
+        if max_tokens <= 0:
+            return ""
+        if count_tokens(text) <= max_tokens:
+            return text
+        
+        kept = []
+        used = 0
+        for sentence in TextUtils.split_sentences(text):
+            cost = count_tokens(sentence + " ")
+            if used + cost > max_tokens:
+                break
+            kept.append(sentence)
+            used += cost
+        if kept:
+            return " ".join(kept)
+        
+        words = []
+        used = count_tokens("...")
+        for word in text.split():
+            cost = count_tokens(word + " ")
+            if used + cost > max_tokens:
+                break
+            words.append(word)
+            used += cost
+        return " ".join(words) + "..." if words else ""
+    
+    @staticmethod
+    def extract_key_phrases(text: str, max_phrases: int = 10, max_words: int = 3) -> List[str]:
         """
-        Extract potential key phrases from text (simple implementation).
+        Extract key phrases from text with RAKE-style scoring.
         
         Args:
             text: Input text
             max_phrases: Maximum number of phrases to extract
+            max_words: Maximum words per phrase
+            
+        Returns:
+            Lowercase key phrases, best first
+        """
+        return TextUtils.extract_key_phrases_many([text], max_phrases, max_words)[0]
+    
+    @staticmethod
+    def extract_key_phrases_many(texts: List[str], max_phrases: int = 10, max_words: int = 3) -> List[List[str]]:
+        """
+        Extract key phrases from many texts at once.
+        
+        Candidate phrases are runs of up to max_words content words between
+        stopwords and punctuation, found in a single pass over each text. A
+        word scores its RAKE degree over frequency. A phrase scores the sum of
+        its word scores, raised by how often the phrase repeats and by how
+        early it first appears. Across a batch, words that occur in most of
+        the texts are weighted down. Phrases already contained in a better
+        phrase are skipped.
+        
+        Args:
+            texts: Input texts
+            max_phrases: Maximum number of phrases per text
+            max_words: Maximum words per phrase
             
         Returns:
-            List of key phrases
+            Lowercase key phrases per text, best first
         """
-        # Simple implementation - in a real system, you might use NLP libraries
-        words = text.lower().split()
-        # Filter for longer, potentially meaningful words
-        key_words = [word for word in words if len(word) > 5 and word.isalpha()]
-        return list(set(key_words))[:max_phrases]
+        documents = []
+        document_frequency: Dict[str, int] = {}
+        for text in texts:
+            phrases: Dict[Tuple[str, ...], List[int]] = {}  # phrase -> [count, first position]
+            run: List[str] = []
+            position = 0
+            for match in _PHRASE_TOKEN.finditer(text.lower().replace("\u2019", "'")):
+                word = match.group(1)
+                if word is not None and word.endswith("'s"):
+                    word = word[:-2]
+                if word is None or word in STOPWORDS or word in _PHRASE_STOPWORDS:
+                    # Stopwords and punctuation end the current run
+                    TextUtils._add_runs(phrases, run, max_words, position)
+                    run = []
+                else:
+                    run.append(word)
+                position += 1
+            TextUtils._add_runs(phrases, run, max_words, position)
+            documents.append((phrases, position))
+            for word in {word for phrase in phrases for word in phrase}:
+                document_frequency[word] = document_frequency.get(word, 0) + 1
+        
+        results = []
+        for phrases, length in documents:
+            frequency: Dict[str, int] = {}
+            degree: Dict[str, int] = {}
+            for phrase, (count, _) in phrases.items():
+                for word in phrase:
+                    frequency[word] = frequency.get(word, 0) + count
+                    degree[word] = degree.get(word, 0) + count * len(phrase)
+            
+            scored = []
+            for phrase, (count, first) in phrases.items():
+                if len(phrase) == 1 and phrase[0].isdigit():
+                    continue
+                score = 0.0
+                for word in phrase:
+                    weight = degree[word] / frequency[word]
+                    if len(texts) > 1:
+                        weight *= math.log((1 + len(texts)) / document_frequency[word]) + 0.1
+                    score += weight
+                score *= (1.0 + math.log(count)) * (1.0 + 0.5 * (1.0 - first / max(length, 1)))
+                scored.append((-score, first, phrase))
+            scored.sort()
+            
+            selected: List[Tuple[str, ...]] = []
+            for _, _, phrase in scored:
+                words = set(phrase)
+                if any(words <= set(kept) for kept in selected):
+                    continue
+                selected.append(phrase)
+                if len(selected) == max_phrases:
+                    break
+            results.append([" ".join(phrase) for phrase in selected])
+        return results
+    
+    @staticmethod
+    def _add_runs(phrases: Dict[Tuple[str, ...], List[int]], run: List[str], max_words: int, end: int):
+        """Record a run of content words as candidate phrases of at most max_words."""
+        start = end - len(run)
+        for offset in range(0, len(run), max_words):
+            phrase = tuple(run[offset:offset + max_words])
+            entry = phrases.get(phrase)
+            if entry is None:
+                phrases[phrase] = [1, start + offset]
+            else:
+                entry[0] += 1
     
     @staticmethod
     def format_sources(sources: List) -> str:
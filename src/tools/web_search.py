@@ -0,0 +1,421 @@
+"""
+Web search backend for the Blog Generation System.
+Resolves queries to result URLs through a pluggable transport (DuckDuckGo via
+ddgs, or a local fixture server's /search endpoint), fetches the pages
+concurrently with a bounded pool and per-host limits, and strips each page
+down to its main text.
+"""
+
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import Context, copy_context
+from html.parser import HTMLParser
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from ..models.blog_models import ResearchSource
+from ..utils.config import config
+from .http_client import HttpClient, HttpResponse, http_client
+
+
+# Elements whose text is navigation, chrome or code rather than page content
+_SKIPPED_TAGS = {
+    "script", "style", "noscript", "template", "svg", "nav", "header",
+    "footer", "aside", "form", "button", "select", "iframe",
+}
+_BLOCK_TAGS = {
+    "p", "div", "section", "article", "main", "li", "ul", "ol", "br", "tr",
+    "td", "th", "table", "blockquote", "pre", "h1", "h2", "h3", "h4", "h5", "h6",
+    "dd", "dt", "figcaption",
+}
+_VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+_MIN_BLOCK_WORDS = 8
+_WHITESPACE = re.compile(r"\s+")
+_CHARSET = re.compile(r"charset=[\"']?([\w.:-]+)")
+
+
+class _TextExtractor(HTMLParser):
+    """Collects the text blocks of an HTML page outside boilerplate elements."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks: List[str] = []
+        self.title = ""
+        self._current: List[str] = []
+        self._skip_depth = 0
+        self._in_title = False
+
+    def handle_starttag(self, tag: str, attrs):
+        if tag in _VOID_TAGS:
+            if tag == "br":
+                self._flush()
+            return
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag == "title":
+            self._in_title = True
+        elif tag in _BLOCK_TAGS:
+            self._flush()
+
+    def handle_endtag(self, tag: str):
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == "title":
+            self._in_title = False
+        elif tag in _BLOCK_TAGS:
+            self._flush()
+
+    def handle_data(self, data: str):
+        if self._in_title:
+            self.title += data
+        elif not self._skip_depth:
+            self._current.append(data)
+
+    def _flush(self):
+        text = _WHITESPACE.sub(" ", "".join(self._current)).strip()
+        self._current = []
+        # Short blocks are menus, bylines and link lists
+        if len(text.split()) >= _MIN_BLOCK_WORDS:
+            self.blocks.append(text)
+
+    def close(self):
+        super().close()
+        self._flush()
+
+
+def extract_main_text(html: str, max_words: Optional[int] = None) -> Dict[str, str]:
+    """
+    Strip an HTML page down to its readable text.
+
+    Args:
+        html: Page markup
+        max_words: Truncate the text to this many words (no limit if None)
+
+    Returns:
+        Dictionary with the page title and its main text
+    """
+    extractor = _TextExtractor()
+    try:
+        extractor.feed(html)
+        extractor.close()
+    except Exception:
+        # Truncated or malformed markup: keep whatever parsed cleanly
+        pass
+    text = "\n\n".join(extractor.blocks)
+    if max_words:
+        words = text.split(" ")
+        if len(words) > max_words:
+            text = " ".join(words[:max_words])
+    return {"title": _WHITESPACE.sub(" ", extractor.title).strip(), "text": text}
+
+
+class WebTransport(ABC):
+    """Resolves queries to result links and fetches pages over HTTP."""
+
+    def __init__(self, client: Optional[HttpClient] = None):
+        """
+        Initialize the transport.
+
+        Args:
+            client: HTTP client for page fetches (the shared client if None)
+        """
+        self.http = client or http_client
+
+    @abstractmethod
+    def search(self, query: str, max_results: int) -> List[Dict[str, str]]:
+        """
+        Resolve a query to result links.
+
+        Args:
+            query: Search query
+            max_results: Maximum results
+
+        Returns:
+            Results as dictionaries with title, url and snippet, best first
+        """
+
+    def fetch(self, url: str, max_bytes: int) -> HttpResponse:
+        """
+        Fetch a result page, reading at most max_bytes of its body.
+
+        Args:
+            url: Page URL
+            max_bytes: Byte cap for the streamed body
+
+        Returns:
+            The HTTP response
+        """
+        return self.http.get(
+            url,
+            headers={"Accept": "text/html,application/xhtml+xml,text/plain;q=0.8"},
+            max_bytes=max_bytes
+        )
+
+
+class DdgsTransport(WebTransport):
+    """Searches DuckDuckGo through the ddgs package."""
+
+    def search(self, query: str, max_results: int) -> List[Dict[str, str]]:
+        # ddgs pulls in its own HTTP stack; only load it once the web is searched
+        from ddgs import DDGS
+
+        hits = DDGS(timeout=int(config.HTTP_READ_TIMEOUT)).text(query, max_results=max_results) or []
+        return [
+            {"title": hit.get("title", ""), "url": hit["href"], "snippet": hit.get("body", "")}
+            for hit in hits if hit.get("href")
+        ]
+
+
+class FixtureTransport(WebTransport):
+    """Searches a local fixture server (such as the stub server) at {base_url}/search."""
+
+    def __init__(self, base_url: str, client: Optional[HttpClient] = None):
+        """
+        Initialize the transport.
+
+        Args:
+            base_url: Base URL of the fixture server
+            client: HTTP client (the shared client if None)
+        """
+        super().__init__(client)
+        self.base_url = base_url.rstrip("/")
+
+    def search(self, query: str, max_results: int) -> List[Dict[str, str]]:
+        response = self.http.get(f"{self.base_url}/search", params={"q": query, "max_results": max_results})
+        if response.status_code != 200:
+            raise RuntimeError(f"Web search returned HTTP {response.status_code}")
+        return response.json().get("results", [])[:max_results]
+
+
+class WebSearch:
+    """Concurrent web search: resolve result links, fetch and clean the pages."""
+
+    def __init__(
+        self,
+        transport: Optional[WebTransport] = None,
+        max_workers: Optional[int] = None,
+        per_host: Optional[int] = None,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        Initialize the web search backend.
+
+        Args:
+            transport: Search and fetch transport (chosen from config if None)
+            max_workers: Fetch pool size (uses config if None)
+            per_host: Concurrent fetches allowed per host (uses config if None)
+            max_bytes: Body size cap per page (uses config if None)
+        """
+        self._transport = transport
+        self._default_transport: Optional[WebTransport] = None
+        self.max_workers = max_workers or config.WEB_FETCH_MAX_WORKERS
+        self.per_host = per_host or config.WEB_FETCH_PER_HOST
+        self.max_bytes = max_bytes or config.WEB_FETCH_MAX_BYTES
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Fetches in flight per host, and fetches waiting for one of its slots
+        self._host_active: Dict[str, int] = {}
+        self._host_queues: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def transport(self) -> WebTransport:
+        """Configured transport: the fixture server if WEB_SEARCH_URL is set, else ddgs."""
+        if self._transport is not None:
+            return self._transport
+        with self._lock:
+            # Rebuilt when the configured URL changes (benchmarks point it at a stub server)
+            wanted = config.WEB_SEARCH_URL.rstrip("/") if config.WEB_SEARCH_URL else None
+            current = getattr(self._default_transport, "base_url", None)
+            if self._default_transport is None or current != wanted:
+                if config.WEB_SEARCH_URL:
+                    self._default_transport = FixtureTransport(config.WEB_SEARCH_URL)
+                else:
+                    self._default_transport = DdgsTransport()
+            return self._default_transport
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Shared bounded pool for searches and page fetches."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="web")
+            return self._executor
+
+    def _submit_fetch(self, result: Dict[str, str]) -> Future:
+        """
+        Schedule a page fetch. A fetch whose host is at its per-host limit waits
+        in a queue rather than in a pool worker, so one busy host cannot occupy
+        the whole pool.
+
+        Args:
+            result: Search result to fetch
+
+        Returns:
+            Future for the page's source; cancelling it drops a fetch still queued
+        """
+        future: Future = Future()
+        host = urlsplit(result["url"]).netloc.lower()
+        context = copy_context()
+        with self._lock:
+            if self._host_active.get(host, 0) >= self.per_host:
+                self._host_queues.setdefault(host, deque()).append((future, result, context))
+                return future
+            self._host_active[host] = self._host_active.get(host, 0) + 1
+        future.set_running_or_notify_cancel()
+        self._get_executor().submit(self._run_fetch, host, future, result, context)
+        return future
+
+    def _run_fetch(self, host: str, future: Future, result: Dict[str, str], context: Context):
+        """Fetch a page into its future, then hand the host's slot on."""
+        try:
+            future.set_result(context.run(self._fetch_page, result))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            self._release_host(host)
+
+    def _release_host(self, host: str):
+        """Start the host's next queued fetch in the freed slot, or free the slot."""
+        while True:
+            with self._lock:
+                queue = self._host_queues.get(host)
+                if not queue:
+                    self._host_queues.pop(host, None)
+                    self._host_active[host] -= 1
+                    if not self._host_active[host]:
+                        del self._host_active[host]
+                    return
+                future, result, context = queue.popleft()
+            # Fetches cancelled while queued (deadline passed) are skipped
+            if future.set_running_or_notify_cancel():
+                self._get_executor().submit(self._run_fetch, host, future, result, context)
+                return
+
+    def _fetch_page(self, result: Dict[str, str]) -> Optional[ResearchSource]:
+        """
+        Fetch one result page and turn it into a source, falling back to the
+        search snippet when the page is unusable.
+        """
+        url = result["url"]
+        text, title = "", result.get("title", "")
+        try:
+            response = self.transport.fetch(url, self.max_bytes)
+            content_type = next(
+                (value.lower() for name, value in response.headers.items() if name.lower() == "content-type"), ""
+            )
+            if response.status_code == 200 and ("html" in content_type or "text/plain" in content_type):
+                charset = _CHARSET.search(content_type)
+                try:
+                    body = response.content.decode(charset.group(1) if charset else "utf-8", errors="replace")
+                except LookupError:
+                    body = response.text
+                if "html" in content_type:
+                    page = extract_main_text(body, config.MAX_RESEARCH_WORDS)
+                    text, title = page["text"], title or page["title"]
+                else:
+                    text = " ".join(body.split()[:config.MAX_RESEARCH_WORDS])
+        except Exception as e:
+            print(f"⚠️ Web fetch error for {url}: {e}")
+
+        if len(text.split()) < config.WEB_PAGE_MIN_WORDS:
+            return self._snippet_source(result)
+        return self._source(text, title, url)
+
+    def _snippet_source(self, result: Dict[str, str]) -> Optional[ResearchSource]:
+        """Source built from a result's search snippet, if it has one."""
+        snippet = (result.get("snippet") or "").strip()
+        if not snippet:
+            return None
+        return self._source(snippet, result.get("title", ""), result["url"])
+
+    @staticmethod
+    def _source(text: str, title: str, url: str) -> ResearchSource:
+        return ResearchSource(
+            content=text,
+            source_type="web_search",
+            reference=f"{title} ({url})" if title else url,
+            relevance_score=0.7
+        )
+
+    def search_many(self, queries: List[str], max_results: Optional[int] = None) -> List[List[ResearchSource]]:
+        """
+        Search the web for several queries. Page fetches start as soon as each
+        query's results arrive; a URL returned for several queries is fetched once.
+        Pages still loading after WEB_FETCH_DEADLINE_SECONDS fall back to their snippets.
+
+        Args:
+            queries: Search queries
+            max_results: Pages per query (uses config if None)
+
+        Returns:
+            Sources per query, in query order and result rank
+        """
+        if not queries:
+            return []
+        limit = max_results or config.SEARCH_MAX_RESULTS
+        executor = self._get_executor()
+
+        # Repeated queries are searched once, under their first position
+        first_index = {}
+        for index, query in enumerate(queries):
+            first_index.setdefault(query, index)
+        searches = {
+            executor.submit(copy_context().run, self.transport.search, query, limit): index
+            for query, index in first_index.items()
+        }
+        fetches = {}
+        ranked: List[List[Dict[str, str]]] = [[] for _ in queries]
+        pending = set(searches)
+        deadline = time.monotonic() + config.WEB_FETCH_DEADLINE_SECONDS
+        try:
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future not in searches:
+                        continue
+                    index = searches[future]
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        print(f"⚠️ Web search error for '{queries[index]}': {e}")
+                        continue
+                    for result in results:
+                        url = result.get("url")
+                        if not url:
+                            continue
+                        ranked[index].append(result)
+                        if url not in fetches:
+                            fetches[url] = self._submit_fetch(result)
+                            pending.add(fetches[url])
+        finally:
+            # Pages still loading at the deadline fall back to their snippets
+            for future in pending:
+                future.cancel()
+
+        # A page found by several queries is credited to the first of them
+        sources = []
+        seen = set()
+        for results in ranked:
+            page_sources = []
+            for result in results:
+                if result["url"] in seen:
+                    continue
+                seen.add(result["url"])
+                future = fetches[result["url"]]
+                if future.done() and not future.cancelled():
+                    source = future.result()
+                else:
+                    source = self._snippet_source(result)
+                if source is not None:
+                    page_sources.append(source)
+            sources.append(page_sources)
+        return sources
+
+# Create web search instance
+web_search = WebSearch()
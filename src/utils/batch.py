@@ -0,0 +1,157 @@
+"""
+Batch run helpers for the Blog Generation System.
+Loads topic lists and summarizes throughput for batch generation runs.
+"""
+
+import json
+import math
+import sys
+from typing import Dict, Iterator, List, Optional, TextIO
+
+
+PHASES = ("research", "outline", "writing", "total")
+
+
+def _parse_topic_line(line: str, jsonl: bool) -> Optional[str]:
+    """Parse a single topic line, returning None for blanks and comments."""
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return None
+
+    if jsonl:
+        record = json.loads(line)
+        if isinstance(record, dict):
+            record = record.get("topic")
+        if not isinstance(record, str):
+            raise ValueError(f"JSONL topic entries need a 'topic' string: {line[:80]}")
+        return record.strip() or None
+
+    return line
+
+
+def iter_topics(stream: TextIO, jsonl: Optional[bool] = None) -> Iterator[str]:
+    """
+    Iterate over topics in a plain text or JSONL stream. Malformed JSONL
+    lines are reported with their line number and skipped.
+
+    Args:
+        stream: Text stream with one topic per line
+        jsonl: Force JSONL parsing; detected from the first entry if None
+
+    Returns:
+        Iterator of topic strings
+    """
+    for line_number, line in enumerate(stream, 1):
+        if jsonl is None and line.strip() and not line.strip().startswith('#'):
+            # Only objects mark JSONL: plain topics may start with a quote ("Rust" vs Go)
+            jsonl = line.lstrip().startswith('{')
+        try:
+            topic = _parse_topic_line(line, bool(jsonl))
+        except ValueError as e:
+            # json.JSONDecodeError is a ValueError too
+            print(f"⚠️ Skipping line {line_number} of the topic file: {e}")
+            continue
+        if topic:
+            yield topic
+
+
+def load_topics(path: str) -> List[str]:
+    """
+    Load topics from a file, or from stdin when path is '-'.
+
+    Args:
+        path: Topic file path (.jsonl for JSONL, anything else is sniffed)
+
+    Returns:
+        List of topics in file order
+    """
+    if path == '-':
+        return list(iter_topics(sys.stdin))
+
+    jsonl = True if path.endswith('.jsonl') else None
+    with open(path, 'r', encoding='utf-8') as f:
+        return list(iter_topics(f, jsonl=jsonl))
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of a list of values.
+
+    Args:
+        values: Sample values
+        pct: Percentile between 0 and 100
+
+    Returns:
+        Percentile value, 0.0 for an empty sample
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class BatchStats:
+    """Collects per-topic outcomes and phase latencies for a batch run."""
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.succeeded = 0
+        self.failed = 0
+        self.phase_timings: Dict[str, List[float]] = {phase: [] for phase in PHASES}
+
+    def record_success(self, phase_timings: Dict[str, float]):
+        """Record a completed topic and its phase timings."""
+        self.succeeded += 1
+        for phase, seconds in phase_timings.items():
+            if phase in self.phase_timings and seconds is not None:
+                self.phase_timings[phase].append(seconds)
+
+    def record_failure(self):
+        """Record a failed topic."""
+        self.failed += 1
+
+    def summary(self, elapsed: float) -> dict:
+        """
+        Build a throughput summary.
+
+        Args:
+            elapsed: Wall-clock duration of the batch in seconds
+
+        Returns:
+            Dictionary with counts, blogs/minute and p50/p95 per phase
+        """
+        return {
+            "topics": self.succeeded + self.failed,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "elapsed_seconds": round(elapsed, 3),
+            "blogs_per_minute": round(self.succeeded / elapsed * 60, 2) if elapsed > 0 else 0.0,
+            "latency_seconds": {
+                phase: {
+                    "p50": round(percentile(values, 50), 3),
+                    "p95": round(percentile(values, 95), 3),
+                }
+                for phase, values in self.phase_timings.items()
+            },
+        }
+
+    @staticmethod
+    def format_summary(summary: dict) -> str:
+        """Render a summary dictionary as a human readable report."""
+        lines = [
+            f"Topics: {summary['topics']} "
+            f"(✅ {summary['succeeded']} succeeded, ❌ {summary['failed']} failed)",
+            f"Elapsed: {summary['elapsed_seconds']:.2f}s",
+            f"Throughput: {summary['blogs_per_minute']:.2f} blogs/minute",
+            "Latency per phase:",
+        ]
+        for phase, stats in summary["latency_seconds"].items():
+            lines.append(f"   {phase:<9} p50 {stats['p50']:.2f}s   p95 {stats['p95']:.2f}s")
+        cache = summary.get("semantic_cache")
+        if cache:
+            lines.append(
+                f"Semantic cache: {cache['hits']} hits, {cache['misses']} misses, "
+                f"{cache['stale']} stale ({cache['hit_rate']:.0%} hit rate)"
+            )
+        return "\n".join(lines)
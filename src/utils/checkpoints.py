@@ -0,0 +1,175 @@
+"""
+Pipeline stage checkpoints for the Blog Generation System.
+Persists each stage's output so a failed or interrupted run can resume.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type
+
+from .config import config
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+
+STAGES = ("research", "outline", "writing")
+
+# Bumped when the checkpoint file layout changes
+CHECKPOINT_VERSION = 1
+
+
+def stage_model(stage: str) -> Type["BaseModel"]:
+    """
+    Get the model class a stage's checkpoint is stored as.
+
+    The models are imported here rather than at module load so the CLI can
+    parse its arguments without paying for pydantic.
+
+    Args:
+        stage: One of STAGES
+
+    Returns:
+        Pydantic model class
+    """
+    from ..models.blog_models import BlogOutline, GeneratedBlog, ResearchResult
+
+    return {
+        "research": ResearchResult,
+        "outline": BlogOutline,
+        "writing": GeneratedBlog,
+    }[stage]
+
+
+class CheckpointStore:
+    """Stores stage outputs as JSON files keyed by topic and stage."""
+
+    def __init__(self, checkpoint_dir: Optional[str] = None):
+        """
+        Initialize the store.
+
+        Args:
+            checkpoint_dir: Directory for checkpoint files (uses config if None)
+        """
+        self.checkpoint_dir = Path(checkpoint_dir or config.CHECKPOINT_DIR)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether checkpointing is switched on in the configuration."""
+        return config.CHECKPOINTS_ENABLED
+
+    @staticmethod
+    def topic_key(topic: str) -> str:
+        """
+        Derive a stable key for a topic, ignoring case and extra whitespace.
+
+        Args:
+            topic: Blog topic
+
+        Returns:
+            Readable, collision-resistant key
+        """
+        normalized = " ".join(topic.lower().split())
+        digest = hashlib.sha256(normalized.encode('utf-8')).hexdigest()[:16]
+        slug = "".join(c if c.isalnum() else '_' for c in normalized)[:40].strip('_')
+        return f"{slug}_{digest}"
+
+    def _path(self, topic: str, stage: str) -> Path:
+        return self.checkpoint_dir / self.topic_key(topic) / f"{stage}.json"
+
+    @staticmethod
+    def versions() -> Dict[str, Any]:
+        """Get the prompt and model versions a checkpoint must have been written with to be reused."""
+        return {
+            "version": CHECKPOINT_VERSION,
+            "prompt_version": config.PROMPT_VERSION,
+            "model": f"{config.LLM_BACKEND}/{config.GROQ_MODEL}",
+        }
+
+    def _stale_reason(self, payload: Dict[str, Any]) -> Optional[str]:
+        """Explain why a checkpoint may not be resumed, or None if it may."""
+        for key, expected in self.versions().items():
+            if payload.get(key) != expected:
+                return f"written with {key} {payload.get(key)!r}, now {expected!r}"
+        max_age_days = config.CHECKPOINT_MAX_AGE_DAYS
+        age_days = (time.time() - float(payload.get("saved_at", 0))) / 86400
+        if max_age_days > 0 and age_days > max_age_days:
+            return f"saved {age_days:.1f} days ago (max {max_age_days:g})"
+        return None
+
+    def load(self, topic: str, stage: str) -> Optional["BaseModel"]:
+        """
+        Load a stage checkpoint.
+
+        Args:
+            topic: Blog topic
+            stage: One of STAGES
+
+        Returns:
+            The stage's model, or None if missing, unreadable, too old, or
+            written with other prompt or model versions
+        """
+        from pydantic import ValidationError
+
+        path = self._path(topic, stage)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            if not isinstance(payload, dict):
+                raise ValueError("not a checkpoint object")
+            reason = self._stale_reason(payload)
+            if reason:
+                print(f"⚠️ Ignoring outdated {stage} checkpoint for '{topic}': {reason}")
+                return None
+            return stage_model(stage).model_validate(payload.get("data"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, ValidationError) as e:
+            print(f"⚠️ Ignoring unreadable {stage} checkpoint for '{topic}': {e}")
+            return None
+
+    def save(self, topic: str, stage: str, data: "BaseModel") -> str:
+        """
+        Save a stage checkpoint atomically, stamped with the time and the
+        prompt and model versions it was produced with.
+
+        Args:
+            topic: Blog topic
+            stage: One of STAGES
+            data: The stage's output model
+
+        Returns:
+            Path to the checkpoint file
+        """
+        path = self._path(topic, stage)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        payload = {**self.versions(), "saved_at": time.time(), "data": data.model_dump(mode='json')}
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2)
+        tmp_path.replace(path)
+
+        with open(path.parent / "topic.json", 'w', encoding='utf-8') as f:
+            json.dump({"topic": topic}, f)
+        return str(path)
+
+    def clear(self, topic: str):
+        """Delete every checkpoint for a topic, along with its directory."""
+        topic_dir = self.checkpoint_dir / self.topic_key(topic)
+        for name in [f"{stage}.json" for stage in STAGES] + ["topic.json"]:
+            path = topic_dir / name
+            if path.exists():
+                path.unlink()
+        try:
+            topic_dir.rmdir()
+        except OSError:
+            # Missing, or holds files this store did not write
+            pass
+
+
+# Create checkpoint store instance
+checkpoint_store = CheckpointStore()
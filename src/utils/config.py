@@ -19,18 +19,145 @@ class Config:
     GROQ_TEMPERATURE: float = 0.3
     GROQ_MAX_TOKENS: int = 4000
     
+    # LLM Backend: "groq" calls the Groq API; "fake" answers locally with
+    # deterministic, correctly formatted text for offline load tests
+    LLM_BACKEND: str = os.getenv("LLM_BACKEND", "groq")
+    FAKE_LLM_LATENCY_MS: float = float(os.getenv("FAKE_LLM_LATENCY_MS", "0"))
+    FAKE_LLM_TOKENS_PER_SECOND: float = float(os.getenv("FAKE_LLM_TOKENS_PER_SECOND", "0"))
+    FAKE_LLM_ERROR_RATE: float = float(os.getenv("FAKE_LLM_ERROR_RATE", "0"))
+    FAKE_LLM_SEED: int = int(os.getenv("FAKE_LLM_SEED", "0"))
+    
+    # Groq Rate Limits (defaults match the free tier; 0 disables a budget).
+    # Off by default on the fake backend, which has no quota to protect
+    GROQ_REQUESTS_PER_MINUTE: int = int(os.getenv("GROQ_REQUESTS_PER_MINUTE", "30" if LLM_BACKEND == "groq" else "0"))
+    GROQ_TOKENS_PER_MINUTE: int = int(os.getenv("GROQ_TOKENS_PER_MINUTE", "6000" if LLM_BACKEND == "groq" else "0"))
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+    LLM_COMPLETION_TOKEN_ESTIMATE: int = 500
+    LLM_MAX_RETRIES: int = 4
+    LLM_BACKOFF_BASE: float = 1.0
+    LLM_MAX_BACKOFF: float = 60.0
+    
+    # Micro-batching of small per-topic LLM calls (query generation and
+    # key points) across concurrent topics in batch runs
+    LLM_BATCHING_ENABLED: bool = os.getenv("LLM_BATCHING", "1").lower() not in ("0", "false", "no", "off")
+    LLM_BATCH_WINDOW_MS: float = float(os.getenv("LLM_BATCH_WINDOW_MS", "50"))
+    LLM_BATCH_MAX_ITEMS: int = int(os.getenv("LLM_BATCH_MAX_ITEMS", "8"))
+    
     # Agent Configuration
     MAX_RESEARCH_WORDS: int = 800
+    RESEARCH_CONTEXT_TOKENS: int = int(os.getenv("RESEARCH_CONTEXT_TOKENS", "2000"))
     MAX_BLOG_LENGTH: int = 1500
+    RESEARCH_MAX_QUERIES: int = 2
+    RESEARCH_MAX_SOURCES: int = 4
+    RESEARCH_MAX_WORKERS: int = 16
+    
+    # Source ranking: fetch up to RESEARCH_CANDIDATE_POOL sources, then keep the
+    # RESEARCH_MAX_SOURCES most similar to the topic, dropping near-duplicates
+    RESEARCH_RANKING_ENABLED: bool = os.getenv("RESEARCH_RANKING", "1").lower() not in ("0", "false", "no", "off")
+    RESEARCH_CANDIDATE_POOL: int = 12
+    RESEARCH_DEDUP_THRESHOLD: float = 0.9
+    EMBEDDING_DIM: int = 1024
+    
+    # Query mode: "llm" has the model write the search queries; "keyphrase"
+    # expands the topic's key phrases into queries locally, without an LLM call
+    QUERY_MODE: str = os.getenv("QUERY_MODE", "llm")
+    
+    # Research analysis mode: "separate" writes the summary, then extracts key
+    # points from it in a second call; "fused" returns both as one JSON object
+    RESEARCH_ANALYSIS_MODE: str = os.getenv("RESEARCH_ANALYSIS_MODE", "separate")
+    
+    # Key points mode: "llm" asks the model for the summary's key points;
+    # "extractive" selects them locally with TextRank over the summary sentences
+    KEY_POINTS_MODE: str = os.getenv("KEY_POINTS_MODE", "llm")
+    KEY_POINTS_MAX: int = 5
+    KEY_POINTS_REDUNDANCY: float = 0.5
+    
+    # Writing mode: "single" writes the post in one completion,
+    # "sections" writes each outline section concurrently and stitches them
+    WRITING_MODE: str = os.getenv("WRITING_MODE", "single")
+    
+    # Outline mode: "llm" has the model draft the outline and parses it,
+    # "deterministic" derives it from the research key points without an LLM call
+    OUTLINE_MODE: str = os.getenv("OUTLINE_MODE", "llm")
+    
+    # Prompt Template Configuration: with PROMPT_VERSION set, a file
+    # PROMPT_TEMPLATE_DIR/<version>/<prompt name>.txt replaces that built-in prompt
+    PROMPT_TEMPLATE_DIR: str = os.getenv("PROMPT_TEMPLATE_DIR", "prompts")
+    PROMPT_VERSION: Optional[str] = os.getenv("PROMPT_VERSION") or None
     
     # Tool Configuration
     WIKIPEDIA_MAX_RESULTS: int = 2
     SEARCH_MAX_RESULTS: int = 2
+    WIKIPEDIA_BASE_URL: str = os.getenv("WIKIPEDIA_BASE_URL", "https://en.wikipedia.org")
+    WIKIPEDIA_EXTRACTS_PER_REQUEST: int = 20
+    WIKIPEDIA_TITLE_CACHE_SIZE: int = 2048
+    
+    # Web Search: results come from DuckDuckGo (ddgs), or from the /search
+    # endpoint of WEB_SEARCH_URL when set (e.g. the local stub server);
+    # result pages are fetched concurrently and stripped to their main text
+    WEB_SEARCH_ENABLED: bool = os.getenv("WEB_SEARCH", "1").lower() not in ("0", "false", "no", "off")
+    WEB_SEARCH_URL: Optional[str] = os.getenv("WEB_SEARCH_URL") or None
+    WEB_FETCH_MAX_WORKERS: int = int(os.getenv("WEB_FETCH_MAX_WORKERS", "8"))
+    WEB_FETCH_PER_HOST: int = int(os.getenv("WEB_FETCH_PER_HOST", "2"))
+    WEB_FETCH_MAX_BYTES: int = 512 * 1024
+    WEB_FETCH_DEADLINE_SECONDS: float = 8.0
+    WEB_PAGE_MIN_WORDS: int = 40
+    
+    # Local Corpus Index: searched as an extra research backend when set
+    # (build it with python -m src.tools.corpus_index build ...)
+    CORPUS_INDEX_DIR: Optional[str] = os.getenv("CORPUS_INDEX_DIR") or None
+    CORPUS_MAX_RESULTS: int = 2
+    CORPUS_PASSAGE_WORDS: int = 200
+    
+    # HTTP Client Configuration
+    HTTP_POOL_SIZE: int = int(os.getenv("HTTP_POOL_SIZE", "16"))
+    HTTP_CONNECT_TIMEOUT: float = 5.0
+    HTTP_READ_TIMEOUT: float = 10.0
+    HTTP_MAX_RETRIES: int = 3
+    HTTP_BACKOFF_BASE: float = 0.5
+    HTTP_BACKOFF_MAX: float = 8.0
+    HTTP_USER_AGENT: str = "blog-generation-system/0.1 (https://github.com/Richmondiroegbu/blog-generation-system)"
+    HTTP_CACHE_ENABLED: bool = os.getenv("HTTP_CACHE", "1").lower() not in ("0", "false", "no", "off")
+    HTTP_CACHE_DIR: str = os.getenv("HTTP_CACHE_DIR", ".cache/http")
+    HTTP_CACHE_TTL_SECONDS: int = 24 * 3600
+    HTTP_CACHE_MAX_AGE_SECONDS: int = 7 * 24 * 3600
+    HTTP_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    
+    # Concurrency Configuration
+    MAX_CONCURRENT_GENERATIONS: int = int(os.getenv("MAX_CONCURRENT_GENERATIONS", "8"))
+    
+    # Output Configuration
+    OUTPUT_DIR: str = os.getenv("OUTPUT_DIR", "examples/output")
+    
+    # Checkpoint Configuration
+    CHECKPOINTS_ENABLED: bool = os.getenv("CHECKPOINTS", "1").lower() not in ("0", "false", "no", "off")
+    CHECKPOINT_DIR: str = os.getenv("CHECKPOINT_DIR", ".cache/checkpoints")
+    # Older checkpoints are ignored and their stage reruns; 0 disables the limit
+    CHECKPOINT_MAX_AGE_DAYS: float = float(os.getenv("CHECKPOINT_MAX_AGE_DAYS", "7"))
+    
+    # Instrumentation Configuration
+    TRACE_EXPORT_PATH: Optional[str] = os.getenv("TRACE_EXPORT_PATH")
+    METRICS_EXPORT_PATH: Optional[str] = os.getenv("METRICS_EXPORT_PATH")
+    
+    # LLM Response Cache Configuration
+    LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE", "1").lower() not in ("0", "false", "no", "off")
+    LLM_CACHE_PATH: str = os.getenv("LLM_CACHE_PATH", ".cache/llm_cache.sqlite3")
+    LLM_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+    LLM_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    LLM_CACHE_DATE_WINDOW_DAYS: int = 7
+    
+    # Semantic Research Cache: reuses research for paraphrased topics
+    SEMANTIC_CACHE_ENABLED: bool = os.getenv("SEMANTIC_CACHE", "1").lower() not in ("0", "false", "no", "off")
+    SEMANTIC_CACHE_DIR: str = os.getenv("SEMANTIC_CACHE_DIR", ".cache/semantic")
+    SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.9"))
+    # Same lifetime as LLM cache entries; expired topics are purged from disk
+    SEMANTIC_CACHE_MAX_AGE_DAYS: float = LLM_CACHE_TTL_SECONDS / 86400
+    SEMANTIC_CACHE_DIM: int = 256
     
     @classmethod
     def validate_config(cls) -> bool:
         """Validate configuration."""
-        if not cls.GROQ_API_KEY:
+        if cls.LLM_BACKEND == "groq" and not cls.GROQ_API_KEY:
             raise ValueError(
                 "GROQ_API_KEY not found. Please set it in your .env file."
             )
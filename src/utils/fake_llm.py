@@ -0,0 +1,262 @@
+"""
+Fake LLM backend for the Blog Generation System.
+A deterministic local chat model that answers every agent prompt with text
+in the shape the agents parse (query lists, key points, JSON batches,
+outlines, Markdown posts), with configurable latency, token throughput and
+error rate. Used for offline load tests and benchmarks without an API key.
+"""
+
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from typing import Any, AsyncIterator, Iterator, List, Optional
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import PrivateAttr
+
+from .rate_limiter import estimate_tokens
+
+
+_TOPIC_PATTERNS = [
+    re.compile(r"^(?:BLOG )?TOPIC: (.+)$", re.MULTILINE),
+    re.compile(r"(?:about|topic:) '([^'\n]+)'"),
+]
+
+_ASPECTS = [
+    "current landscape", "key challenges", "practical applications",
+    "economic impact", "recent research", "future outlook",
+    "policy and regulation", "common misconceptions",
+]
+
+_SENTENCES = [
+    "{topic} has moved from a niche interest to a mainstream concern over the last decade.",
+    "Researchers point to {aspect} as the area where {topic} is changing fastest.",
+    "Early adopters report measurable gains, although results vary widely between organizations.",
+    "A recurring theme in the literature is the gap between pilot projects and large-scale deployment.",
+    "Costs have fallen steadily, which has made {topic} accessible to smaller teams.",
+    "Critics argue that {aspect} deserves more scrutiny than it currently receives.",
+    "Several surveys suggest that public understanding of {topic} still lags behind practice.",
+    "Standards bodies have begun publishing guidance on {aspect}.",
+    "The most successful programs combine technical investment with training and clear goals.",
+    "Looking ahead, {aspect} is likely to determine how quickly {topic} matures.",
+]
+
+
+class FakeLLMError(Exception):
+    """Simulated transient provider failure; retried like a real 503."""
+
+    status_code = 503
+
+
+class FakeResponder:
+    """Builds deterministic, parseable completions for the agents' prompts."""
+
+    def respond(self, prompt: str, rng: random.Random) -> str:
+        """
+        Answer a rendered prompt in the format its instructions ask for.
+
+        Args:
+            prompt: Rendered prompt text
+            rng: Random source seeded from the prompt
+
+        Returns:
+            Completion text
+        """
+        topic = self._topic(prompt)
+        tail = prompt.rstrip().rsplit("\n", 1)[-1].strip()
+
+        if tail == "JSON:":
+            return self._batch(prompt, rng)
+        if tail == "ANALYSIS JSON:":
+            return json.dumps({
+                "summary": self._paragraphs(topic, rng, 350),
+                "key_points": self._points(topic, rng),
+            })
+        if tail.startswith("SEARCH QUERIES"):
+            return json.dumps(self._queries(topic, rng))
+        if tail.startswith("KEY POINTS"):
+            return "\n".join(self._points(topic, rng))
+        if tail == "RESEARCH SUMMARY:":
+            return self._paragraphs(topic, rng, 350)
+        if tail.endswith("OUTLINE:"):
+            return self._outline(topic, rng)
+        if tail.startswith("BLOG CONTENT"):
+            return self._blog(topic, rng)
+        if tail.startswith("SECTION CONTENT"):
+            match = re.search(r"Aim for about (\d+) words", prompt)
+            return self._paragraphs(topic, rng, int(match.group(1)) if match else 250)
+        return self._paragraphs(topic, rng, 120)
+
+    @staticmethod
+    def _topic(prompt: str) -> str:
+        for pattern in _TOPIC_PATTERNS:
+            match = pattern.search(prompt)
+            if match:
+                return match.group(1).strip()
+        return "the topic"
+
+    @staticmethod
+    def _aspects(rng: random.Random, count: int) -> List[str]:
+        return rng.sample(_ASPECTS, count)
+
+    def _queries(self, topic: str, rng: random.Random) -> List[str]:
+        return [f"{topic} {aspect}" for aspect in self._aspects(rng, 3)]
+
+    def _points(self, topic: str, rng: random.Random) -> List[str]:
+        return [
+            f"The {aspect} of {topic} shapes how it is adopted in practice"
+            for aspect in self._aspects(rng, rng.randint(3, 5))
+        ]
+
+    def _batch(self, prompt: str, rng: random.Random) -> str:
+        """Answer a batched prompt with a JSON object keyed by item number."""
+        items = re.findall(r"^(\d+)\. (.+)$", prompt, re.MULTILINE)
+        build = self._queries
+        if not items:
+            items = re.findall(r"^SUMMARY (\d+) \(topic: '([^'\n]+)'\):$", prompt, re.MULTILINE)
+            build = self._points
+        return json.dumps({number: build(topic, rng) for number, topic in items})
+
+    def _paragraphs(self, topic: str, rng: random.Random, words: int) -> str:
+        paragraphs, current, count = [], [], 0
+        while count < words:
+            sentence = rng.choice(_SENTENCES).format(topic=topic, aspect=rng.choice(_ASPECTS))
+            current.append(sentence[0].upper() + sentence[1:])
+            count += len(sentence.split())
+            if len(current) == 4:
+                paragraphs.append(" ".join(current))
+                current = []
+        if current:
+            paragraphs.append(" ".join(current))
+        return "\n\n".join(paragraphs)
+
+    def _outline(self, topic: str, rng: random.Random) -> str:
+        lines = [f"# {topic}: What to Know", "", "## Introduction", f"- Why {topic} matters now", ""]
+        for aspect in self._aspects(rng, 4):
+            lines.append(f"## {aspect.title()}")
+            lines.extend(f"- {point}" for point in self._points(topic, rng)[:3])
+            lines.append("")
+        lines += ["## Conclusion", f"- Main takeaways about {topic}"]
+        return "\n".join(lines)
+
+    def _blog(self, topic: str, rng: random.Random) -> str:
+        parts = [f"# {topic}: What to Know", "", self._paragraphs(topic, rng, 150)]
+        for aspect in self._aspects(rng, 4):
+            parts += ["", f"## {aspect.title()}", "", self._paragraphs(topic, rng, 280)]
+        parts += ["", "## Conclusion", "", self._paragraphs(topic, rng, 150)]
+        return "\n".join(parts)
+
+
+class FakeChatModel(BaseChatModel):
+    """Local stand-in for a hosted chat model, with simulated latency and failures."""
+
+    model_name: str = "fake"
+    latency_ms: float = 0.0
+    tokens_per_second: float = 0.0
+    error_rate: float = 0.0
+    seed: int = 0
+
+    _responder: FakeResponder = PrivateAttr(default_factory=FakeResponder)
+    _failures: random.Random = PrivateAttr(default=None)
+    _failures_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def model_post_init(self, __context: Any):
+        """Seed the failure sequence so error runs are reproducible."""
+        self._failures = random.Random(self.seed)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    @property
+    def _identifying_params(self) -> dict:
+        return {"model_name": self.model_name, "seed": self.seed}
+
+    def _complete(self, messages: List[BaseMessage]) -> tuple:
+        """
+        Produce the completion for a conversation, or raise a simulated failure.
+
+        Returns:
+            Tuple of (completion text, usage metadata, seconds before the first token,
+            seconds per output token)
+        """
+        prompt = "\n".join(str(message.content) for message in messages)
+        with self._failures_lock:
+            failed = self._failures.random() < self.error_rate
+        if failed:
+            raise FakeLLMError("Simulated service unavailable")
+
+        rng = random.Random(zlib.crc32(prompt.encode("utf-8")) ^ self.seed)
+        text = self._responder.respond(prompt, rng)
+        input_tokens, output_tokens = estimate_tokens(prompt), estimate_tokens(text)
+        usage = {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+        per_token = 1.0 / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+        return text, usage, self.latency_ms / 1000.0, per_token
+
+    @staticmethod
+    def _chunks(text: str) -> List[str]:
+        """Split a completion into word-sized stream chunks."""
+        return re.findall(r"\S+\s*|\s+", text)
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        text, usage, latency, per_token = self._complete(messages)
+        time.sleep(latency + per_token * usage["output_tokens"])
+        message = AIMessage(content=text, usage_metadata=usage)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        text, usage, latency, per_token = self._complete(messages)
+        await asyncio.sleep(latency + per_token * usage["output_tokens"])
+        message = AIMessage(content=text, usage_metadata=usage)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any
+    ) -> Iterator[ChatGenerationChunk]:
+        text, usage, latency, per_token = self._complete(messages)
+        time.sleep(latency)
+        for piece in self._chunks(text):
+            time.sleep(per_token * len(piece) / 4)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=piece))
+        yield ChatGenerationChunk(message=AIMessageChunk(content="", usage_metadata=usage))
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        text, usage, latency, per_token = self._complete(messages)
+        await asyncio.sleep(latency)
+        for piece in self._chunks(text):
+            await asyncio.sleep(per_token * len(piece) / 4)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=piece))
+        yield ChatGenerationChunk(message=AIMessageChunk(content="", usage_metadata=usage))
@@ -5,13 +5,11 @@ File handling utilities for the Blog Generation System.
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
 
-# Fix relative imports
-try:
-    from models.blog_models import GeneratedBlog
-except ImportError:
-    # Fallback for direct execution
+from .config import config
+
+if TYPE_CHECKING:
     from ..models.blog_models import GeneratedBlog
 
 
@@ -34,25 +32,48 @@ class FileHandlers:
         return path_obj
     
     @staticmethod
-    def save_blog_to_file(blog: GeneratedBlog, filename: str = None) -> str:
+    def blog_filepath(topic: str, filename: str = None, output_dir: str = None) -> str:
         """
-        Save generated blog to a markdown file.
+        Choose the markdown file path for a blog without writing it.
         
         Args:
-            blog: GeneratedBlog object to save
+            topic: Blog topic used to derive the default filename
             filename: Optional custom filename
+            output_dir: Output directory (uses config if None)
             
         Returns:
-            Path to the saved file
+            Path for the blog file
         """
+        output_path = FileHandlers.ensure_directory(output_dir or config.OUTPUT_DIR)
+        
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_topic = "".join(c for c in blog.outline.topic if c.isalnum() or c in (' ', '-', '_')).rstrip()
+            safe_topic = "".join(c for c in topic if c.isalnum() or c in (' ', '-', '_')).rstrip()
             safe_topic = safe_topic.replace(' ', '_')[:50]
             filename = f"blog_{safe_topic}_{timestamp}.md"
+            
+            # Concurrent runs can finish the same topic within one second
+            counter = 1
+            while (output_path / filename).exists():
+                counter += 1
+                filename = f"blog_{safe_topic}_{timestamp}_{counter}.md"
+        
+        return str(output_path / filename)
+    
+    @staticmethod
+    def save_blog_to_file(blog: "GeneratedBlog", filename: str = None, output_dir: str = None) -> str:
+        """
+        Save generated blog to a markdown file.
         
-        output_dir = FileHandlers.ensure_directory("examples/output")
-        filepath = output_dir / filename
+        Args:
+            blog: GeneratedBlog object to save
+            filename: Optional custom filename
+            output_dir: Output directory (uses config if None)
+            
+        Returns:
+            Path to the saved file
+        """
+        filepath = FileHandlers.blog_filepath(blog.outline.topic, filename, output_dir)
         
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(blog.content)
@@ -61,7 +82,7 @@ class FileHandlers:
         return str(filepath)
     
     @staticmethod
-    def save_metadata(blog: GeneratedBlog, filepath: str) -> str:
+    def save_metadata(blog: "GeneratedBlog", filepath: str) -> str:
         """
         Save generation metadata to a JSON file.
         
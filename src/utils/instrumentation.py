@@ -0,0 +1,277 @@
+"""
+Timing instrumentation for the Blog Generation System.
+Records nested spans for pipeline phases, LLM calls and HTTP fetches, and
+exports them as JSONL or in the Prometheus text exposition format.
+"""
+
+import json
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from .batch import percentile
+from .config import config
+
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class Span:
+    """A single timed operation within a trace."""
+
+    __slots__ = ("name", "kind", "trace_id", "span_id", "parent_id", "parent",
+                 "start_time", "duration", "attributes", "error")
+
+    def __init__(self, name: str, kind: str, trace_id: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        """Initialize and start the span."""
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent = parent
+        self.parent_id = parent.span_id if parent else None
+        self.start_time = time.time()
+        self.duration: Optional[float] = None
+        self.attributes = attributes
+        self.error: Optional[str] = None
+
+    def set(self, **attributes: Any):
+        """Attach attributes to the span."""
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the span for export."""
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class Tracer:
+    """Collects spans from every thread and task of the process."""
+
+    def __init__(self, recording: Optional[bool] = None):
+        """
+        Initialize an empty tracer.
+
+        Args:
+            recording: Keep finished spans for export (on if an export path is configured, when None)
+        """
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+        # Without an exporter nothing reads the spans, so long runs must not accumulate them
+        self.recording = bool(config.TRACE_EXPORT_PATH or config.METRICS_EXPORT_PATH) if recording is None else recording
+
+    @contextmanager
+    def trace(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """
+        Start a new root span with its own trace id (one per blog).
+
+        Args:
+            name: Span name
+            **attributes: Initial span attributes
+
+        Returns:
+            Context manager yielding the root span
+        """
+        with self._span(name, "trace", uuid.uuid4().hex, None, attributes) as span:
+            yield span
+
+    @contextmanager
+    def span(self, name: str, kind: str = "internal", **attributes: Any) -> Iterator[Span]:
+        """
+        Start a span nested under the current one.
+
+        Args:
+            name: Span name
+            kind: Span category (phase, llm, http, ...)
+            **attributes: Initial span attributes
+
+        Returns:
+            Context manager yielding the span
+        """
+        parent = _current_span.get()
+        trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        with self._span(name, kind, trace_id, parent, attributes) as span:
+            yield span
+
+    @contextmanager
+    def suspended(self) -> Iterator[None]:
+        """
+        Make the current span's parent current for the duration of the block.
+
+        A generator yielding from inside a span wraps each yield in this, so
+        the consumer's work between chunks is not attributed to the span.
+        """
+        current = _current_span.get()
+        token = _current_span.set(current.parent if current else None)
+        try:
+            yield
+        finally:
+            try:
+                _current_span.reset(token)
+            except ValueError:
+                # Generator closed from another context; that context never saw the change
+                pass
+
+    @contextmanager
+    def _span(self, name, kind, trace_id, parent, attributes) -> Iterator[Span]:
+        span = Span(name, kind, trace_id, parent, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.duration = time.time() - span.start_time
+            _current_span.reset(token)
+            if self.recording:
+                with self._lock:
+                    self._spans.append(span)
+
+    def finished_spans(self) -> List[Span]:
+        """Snapshot of every finished span."""
+        with self._lock:
+            return list(self._spans)
+
+    def reset(self):
+        """Discard all recorded spans."""
+        with self._lock:
+            self._spans.clear()
+
+    def export_jsonl(self, path: str) -> str:
+        """
+        Write every finished span as one JSON object per line.
+
+        Args:
+            path: Output file path
+
+        Returns:
+            Path to the written file
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            for span in self.finished_spans():
+                f.write(json.dumps(span.to_dict(), ensure_ascii=False) + "\n")
+        return path
+
+    def prometheus_text(self) -> str:
+        """
+        Aggregate finished spans into Prometheus text exposition format.
+
+        Returns:
+            Metrics text with duration summaries and token, character and cache counters
+        """
+        durations: Dict[tuple, List[float]] = {}
+        counters: Dict[str, Dict[tuple, float]] = {
+            "blog_tokens_total": {},
+            "blog_chars_total": {},
+            "blog_cache_lookups_total": {},
+            "blog_span_errors_total": {},
+        }
+
+        def bump(metric: str, labels: tuple, value: float):
+            counters[metric][labels] = counters[metric].get(labels, 0) + value
+
+        for span in self.finished_spans():
+            base = (("kind", span.kind), ("name", span.name))
+            durations.setdefault(base, []).append(span.duration or 0.0)
+            attrs = span.attributes
+
+            for attr, direction in (("prompt_tokens", "prompt"), ("completion_tokens", "completion")):
+                if attrs.get(attr):
+                    bump("blog_tokens_total", base + (("direction", direction),), attrs[attr])
+            for attr, direction in (("chars_in", "in"), ("chars_out", "out")):
+                if attrs.get(attr):
+                    bump("blog_chars_total", base + (("direction", direction),), attrs[attr])
+            if attrs.get("cache"):
+                bump("blog_cache_lookups_total", base + (("result", attrs["cache"]),), 1)
+            if span.error:
+                bump("blog_span_errors_total", base, 1)
+
+        lines = [
+            "# HELP blog_span_duration_seconds Duration of instrumented operations.",
+            "# TYPE blog_span_duration_seconds summary",
+        ]
+        for labels, values in sorted(durations.items()):
+            for quantile in (0.5, 0.95):
+                lines.append(
+                    f"blog_span_duration_seconds{self._labels(labels + (('quantile', str(quantile)),))} "
+                    f"{percentile(values, quantile * 100):.6f}"
+                )
+            lines.append(f"blog_span_duration_seconds_sum{self._labels(labels)} {sum(values):.6f}")
+            lines.append(f"blog_span_duration_seconds_count{self._labels(labels)} {len(values)}")
+
+        help_text = {
+            "blog_tokens_total": "LLM tokens by direction.",
+            "blog_chars_total": "Characters sent and received.",
+            "blog_cache_lookups_total": "Cache lookups by result.",
+            "blog_span_errors_total": "Operations that raised an error.",
+        }
+        for metric, values in counters.items():
+            lines.append(f"# HELP {metric} {help_text[metric]}")
+            lines.append(f"# TYPE {metric} counter")
+            for labels, value in sorted(values.items()):
+                lines.append(f"{metric}{self._labels(labels)} {value:g}")
+
+        return "\n".join(lines) + "\n"
+
+    def export_prometheus(self, path: str) -> str:
+        """
+        Write aggregated metrics in Prometheus text format.
+
+        Args:
+            path: Output file path
+
+        Returns:
+            Path to the written file
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.prometheus_text())
+        return path
+
+    @staticmethod
+    def _labels(labels: tuple) -> str:
+        """Render a label set, escaping backslashes, quotes and newlines."""
+        rendered = []
+        for key, value in labels:
+            value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            rendered.append(f'{key}="{value}"')
+        return "{" + ",".join(rendered) + "}"
+
+
+def usage_from_message(message: Any) -> Dict[str, int]:
+    """
+    Extract token usage from a LangChain AI message or chunk.
+
+    Args:
+        message: AIMessage or AIMessageChunk
+
+    Returns:
+        Dictionary with prompt_tokens and completion_tokens when reported
+    """
+    usage = getattr(message, "usage_metadata", None)
+    if usage:
+        return {"prompt_tokens": usage.get("input_tokens", 0), "completion_tokens": usage.get("output_tokens", 0)}
+
+    token_usage = (getattr(message, "response_metadata", None) or {}).get("token_usage") or {}
+    if token_usage:
+        return {
+            "prompt_tokens": token_usage.get("prompt_tokens", 0),
+            "completion_tokens": token_usage.get("completion_tokens", 0),
+        }
+    return {}
+
+
+# Create tracer instance shared by the whole pipeline
+tracer = Tracer()
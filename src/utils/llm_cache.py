@@ -0,0 +1,196 @@
+"""
+Persistent LLM response cache for the Blog Generation System.
+Stores completions on disk keyed by a hash of the model settings and rendered prompt.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .config import config
+
+
+class LLMCache:
+    """Disk-backed, content-addressed cache of LLM completions with TTL and LRU eviction."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        date_window_days: Optional[int] = None
+    ):
+        """
+        Initialize the cache. The database is opened lazily on first use.
+
+        Args:
+            path: SQLite database path (uses config if None)
+            ttl_seconds: Entry lifetime in seconds (uses config if None)
+            max_bytes: Maximum total size of cached completions (uses config if None)
+            date_window_days: Days a dated prompt stays reusable (uses config if None)
+        """
+        self.path = path or config.LLM_CACHE_PATH
+        self.ttl_seconds = config.LLM_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.max_bytes = config.LLM_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.date_window_days = (
+            config.LLM_CACHE_DATE_WINDOW_DAYS if date_window_days is None else date_window_days
+        )
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is switched on in the configuration."""
+        return config.LLM_CACHE_ENABLED
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema on first use."""
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " content TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def key_inputs(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Normalize prompt inputs for keying.
+
+        Every prompt injects current_date, so the date is bucketed into a
+        window of date_window_days to let entries be reused across days.
+
+        Args:
+            inputs: Prompt input variables
+
+        Returns:
+            Inputs with current_date replaced by its window start
+        """
+        current_date = inputs.get("current_date")
+        if not current_date or self.date_window_days <= 0:
+            return inputs
+
+        try:
+            day = datetime.strptime(current_date, "%Y-%m-%d").date()
+        except (TypeError, ValueError):
+            return inputs
+
+        offset = (day - date(1970, 1, 1)).days % self.date_window_days
+        return {**inputs, "current_date": (day - timedelta(days=offset)).isoformat()}
+
+    @staticmethod
+    def make_key(model: str, temperature: float, max_tokens: int, prompt_text: str) -> str:
+        """
+        Build the content-addressed key for a completion.
+
+        Args:
+            model: Model name
+            temperature: Sampling temperature
+            max_tokens: Completion token limit
+            prompt_text: Fully rendered prompt
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        payload = json.dumps(
+            [model, temperature, max_tokens, prompt_text],
+            ensure_ascii=False,
+            separators=(',', ':')
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached completion.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached completion text, or None on a miss or expired entry
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT content, created_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            content, created_at = row
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                conn.commit()
+                return None
+
+            conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            conn.commit()
+            return content
+
+    def set(self, key: str, content: str):
+        """
+        Store a completion and evict least recently used entries over the size limit.
+
+        Args:
+            key: Cache key from make_key
+            content: Completion text
+        """
+        now = time.time()
+        size = len(content.encode('utf-8'))
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, content, size, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, content, size, now, now)
+            )
+            if self.ttl_seconds:
+                conn.execute("DELETE FROM entries WHERE created_at < ?", (now - self.ttl_seconds,))
+            self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop least recently used entries until the cache fits in max_bytes."""
+        if not self.max_bytes:
+            return
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        # Evict down to 90% so we do not evict again on the next insert
+        target = total - int(self.max_bytes * 0.9)
+        freed = 0
+        stale_keys = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed_at ASC"):
+            stale_keys.append((key,))
+            freed += size
+            if freed >= target:
+                break
+        conn.executemany("DELETE FROM entries WHERE key = ?", stale_keys)
+
+    def clear(self):
+        """Remove every cached completion."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM entries")
+            conn.commit()
+
+
+# Create cache instance shared by all agents
+llm_cache = LLMCache()
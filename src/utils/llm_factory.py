@@ -0,0 +1,141 @@
+"""
+LLM client factory for the Blog Generation System.
+Creates chat model clients on first use and shares them between agents,
+so importing the agents stays cheap and every agent reuses one connection pool.
+The backend that builds the clients is selected with LLM_BACKEND.
+"""
+
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from .config import config
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+
+
+# A backend builds a chat model client from (model, temperature, max_tokens)
+Backend = Callable[[str, float, int], "BaseChatModel"]
+
+
+def create_groq(model: str, temperature: float, max_tokens: int) -> "BaseChatModel":
+    """Construct a Groq chat client; langchain_groq is imported here, not at startup."""
+    import httpx
+    from langchain_groq import ChatGroq
+
+    from .rate_limiter import arecord_response_headers, record_response_headers
+
+    return ChatGroq(
+        groq_api_key=config.GROQ_API_KEY,
+        model_name=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        # Retries are handled by the shared rate limiter
+        max_retries=0,
+        # Rate-limit headers of every response, successful or not, feed the shared limiter
+        http_client=httpx.Client(event_hooks={"response": [record_response_headers]}),
+        http_async_client=httpx.AsyncClient(event_hooks={"response": [arecord_response_headers]})
+    )
+
+
+def create_fake(model: str, temperature: float, max_tokens: int) -> "BaseChatModel":
+    """Construct the local deterministic chat model configured by the FAKE_LLM_* settings."""
+    from .fake_llm import FakeChatModel
+
+    return FakeChatModel(
+        model_name=model,
+        latency_ms=config.FAKE_LLM_LATENCY_MS,
+        tokens_per_second=config.FAKE_LLM_TOKENS_PER_SECOND,
+        error_rate=config.FAKE_LLM_ERROR_RATE,
+        seed=config.FAKE_LLM_SEED
+    )
+
+
+class LLMFactory:
+    """Builds and caches one chat model client per backend and model configuration."""
+
+    def __init__(self):
+        """Initialize an empty client cache and the built-in backends."""
+        self._clients: Dict[Tuple[Any, ...], "BaseChatModel"] = {}
+        self._backends: Dict[str, Backend] = {"groq": create_groq, "fake": create_fake}
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self) -> str:
+        """Name of the configured backend."""
+        return config.LLM_BACKEND
+
+    def register_backend(self, name: str, create: Backend):
+        """
+        Add or replace a backend.
+
+        Args:
+            name: Backend name, as used in LLM_BACKEND
+            create: Callable building a client from (model, temperature, max_tokens)
+        """
+        with self._lock:
+            self._backends[name] = create
+            self._clients = {key: client for key, client in self._clients.items() if key[0] != name}
+
+    def model_id(self, model: str) -> str:
+        """
+        Identify a model across backends, e.g. for response cache keys.
+
+        Args:
+            model: Model name
+
+        Returns:
+            The model name for the default backend, "<backend>:<model>" otherwise
+        """
+        return model if self.backend == "groq" else f"{self.backend}:{model}"
+
+    def get(
+        self,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> "BaseChatModel":
+        """
+        Get the shared client for a model configuration, creating it on first use.
+
+        Args:
+            model: Model name (uses config if None)
+            temperature: Sampling temperature (uses config if None)
+            max_tokens: Completion token limit (uses config if None)
+
+        Returns:
+            Chat model client
+        """
+        settings = config.get_groq_config()
+        key = (
+            self.backend,
+            model or settings["model"],
+            settings["temperature"] if temperature is None else temperature,
+            settings["max_tokens"] if max_tokens is None else max_tokens,
+        )
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._create(*key)
+                    self._clients[key] = client
+        return client
+
+    def _create(self, backend: str, model: str, temperature: float, max_tokens: int) -> "BaseChatModel":
+        """Construct a client with the named backend."""
+        create = self._backends.get(backend)
+        if create is None:
+            raise ValueError(
+                f"Unknown LLM_BACKEND '{backend}'. Available: {', '.join(sorted(self._backends))}"
+            )
+        return create(model, temperature, max_tokens)
+
+    def reset(self):
+        """Drop every cached client, e.g. after the configuration changed."""
+        with self._lock:
+            self._clients.clear()
+
+
+# Create factory instance shared by all agents
+llm_factory = LLMFactory()
@@ -0,0 +1,123 @@
+"""
+Micro-batching for small LLM calls in the Blog Generation System.
+Collects requests made by concurrent tasks within a short window and hands
+them to a flush function as one batch, then routes each result back.
+Batching applies only inside a batching() block, which multi-topic runs
+open; a lone topic has nothing to batch with and must not wait the window.
+"""
+
+import asyncio
+import contextvars
+import weakref
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Generic, Iterator, List, Optional, Set, Tuple, TypeVar
+
+from .config import config
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_batching: contextvars.ContextVar[bool] = contextvars.ContextVar("llm_batching", default=False)
+
+
+@contextmanager
+def batching(enabled: bool = True) -> Iterator[None]:
+    """
+    Let calls made inside the block, and by tasks started in it, be micro-batched.
+
+    Args:
+        enabled: Whether several topics will be in flight, so batching can pay off
+    """
+    token = _batching.set(enabled)
+    try:
+        yield
+    finally:
+        _batching.reset(token)
+
+
+def batching_active() -> bool:
+    """Whether the current call should go through a batcher (LLM_BATCHING on and inside batching())."""
+    return config.LLM_BATCHING_ENABLED and _batching.get()
+
+
+class MicroBatcher(Generic[T, R]):
+    """Coalesces concurrent async submissions into batches per event loop."""
+
+    def __init__(
+        self,
+        flush: Callable[[List[T]], Awaitable[List[R]]],
+        window_seconds: Optional[float] = None,
+        max_items: Optional[int] = None
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            flush: Processes a batch of items and returns one result per item, in order
+            window_seconds: How long the first item of a batch waits for company (uses config if None)
+            max_items: Batch size that is flushed immediately (uses config if None)
+        """
+        self.flush = flush
+        self.window_seconds = config.LLM_BATCH_WINDOW_MS / 1000 if window_seconds is None else window_seconds
+        self.max_items = max(1, config.LLM_BATCH_MAX_ITEMS if max_items is None else max_items)
+        # One open batch per event loop, so the batcher survives asyncio.run() calls
+        self._open: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, List[Tuple[T, asyncio.Future]]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._timers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.TimerHandle]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, item: T) -> R:
+        """
+        Add an item to the current batch and wait for its result.
+
+        Args:
+            item: Request to batch
+
+        Returns:
+            The flush function's result for this item
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._open.get(loop)
+        if batch is None:
+            batch = self._open[loop] = []
+            self._timers[loop] = loop.call_later(self.window_seconds, self._dispatch, loop, batch)
+
+        future = loop.create_future()
+        batch.append((item, future))
+        if len(batch) >= self.max_items:
+            self._dispatch(loop, batch)
+        return await future
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop, batch: List[Tuple[T, asyncio.Future]]):
+        """Close a batch and flush it in its own task."""
+        if self._open.get(loop) is not batch:
+            return
+        del self._open[loop]
+        timer = self._timers.pop(loop, None)
+        if timer is not None:
+            timer.cancel()
+
+        # A fresh context keeps the batch's spans out of whichever topic happened to close it
+        task = loop.create_task(self._run(batch), context=contextvars.Context())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[T, asyncio.Future]]):
+        """Flush a batch and resolve every waiter."""
+        try:
+            results = await self.flush([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(f"Batch flush returned {len(results)} results for {len(batch)} items")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,382 @@
+"""
+Rate limiting for LLM calls in the Blog Generation System.
+A process-wide token-bucket limiter (requests/min and tokens/min) combined
+with a fair concurrency governor, shared by every agent, thread and task.
+"""
+
+import asyncio
+import random
+import re
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterator, Mapping, Optional, TypeVar
+
+from .config import config
+
+
+T = TypeVar("T")
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_ERROR_NAMES = ("RateLimitError", "APIConnectionError", "APITimeoutError", "InternalServerError")
+
+# Holder for the headers of the LLM HTTP responses received by the current call
+_response_headers: ContextVar[Optional[Dict[str, str]]] = ContextVar("llm_response_headers", default=None)
+
+_DURATION_PATTERN = re.compile(r"(?:(\d+(?:\.\d+)?)h)?(?:(\d+(?:\.\d+)?)m(?!s))?(?:(\d+(?:\.\d+)?)s)?(?:(\d+(?:\.\d+)?)ms)?$")
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a rate-limit reset duration such as '2m59.56s', '7.66s' or '850ms'.
+
+    Args:
+        value: Header value
+
+    Returns:
+        Seconds, or None if the value cannot be parsed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    match = _DURATION_PATTERN.match(value)
+    if not match or not any(match.groups()):
+        return None
+    hours, minutes, seconds, millis = (float(group) if group else 0.0 for group in match.groups())
+    return hours * 3600 + minutes * 60 + seconds + millis / 1000
+
+
+@contextmanager
+def capture_response_headers() -> Iterator[Dict[str, str]]:
+    """
+    Collect the headers of the LLM HTTP responses received inside the block.
+
+    Yields:
+        Dictionary holding the headers of the latest response (empty until one arrives)
+    """
+    # A mutable holder, so responses received in copied contexts (LangChain runs steps in one) still land here
+    headers: Dict[str, str] = {}
+    token = _response_headers.set(headers)
+    try:
+        yield headers
+    finally:
+        _response_headers.reset(token)
+
+
+def record_response_headers(response) -> None:
+    """httpx response hook: keep the response's headers for the call that is capturing them."""
+    headers = _response_headers.get()
+    if headers is not None:
+        headers.clear()
+        headers.update(response.headers)
+
+
+async def arecord_response_headers(response) -> None:
+    """Async httpx response hook, see record_response_headers."""
+    record_response_headers(response)
+
+
+class _TokenBucket:
+    """Token bucket that lets callers reserve capacity ahead of time."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.available = per_minute
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float):
+        self.available = min(self.capacity, self.available + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take amount now, going into debt if needed; return seconds until the debt clears."""
+        self._refill(now)
+        # A single request larger than the bucket may only wait for a full bucket
+        amount = min(amount, self.capacity)
+        self.available -= amount
+        return 0.0 if self.available >= 0 else -self.available / self.rate
+
+    def refund(self, amount: float, now: float):
+        """Give back (or charge, when negative) capacity after the real cost is known."""
+        self._refill(now)
+        self.available = min(self.capacity, self.available + amount)
+
+    def limit_to(self, remaining: float, now: float):
+        """Lower the available capacity to what the server reports as remaining."""
+        self._refill(now)
+        self.available = min(self.available, remaining)
+
+    def drain(self, now: float):
+        """Empty the bucket after the server reported the budget exhausted."""
+        self._refill(now)
+        self.available = min(self.available, 0.0)
+
+
+class _Waiter:
+    """A queued acquirer of a concurrency slot."""
+
+    __slots__ = ("wake", "granted")
+
+    def __init__(self, wake: Callable[[], None]):
+        self.wake = wake
+        self.granted = False
+
+
+class RateLimiter:
+    """Shared requests/min and tokens/min limiter with a FIFO concurrency governor."""
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrency: Optional[int] = None
+    ):
+        """
+        Initialize the limiter. A budget of 0 disables that limit.
+
+        Args:
+            requests_per_minute: Request budget (uses config if None)
+            tokens_per_minute: Token budget (uses config if None)
+            max_concurrency: Maximum calls in flight (uses config if None)
+        """
+        rpm = config.GROQ_REQUESTS_PER_MINUTE if requests_per_minute is None else requests_per_minute
+        tpm = config.GROQ_TOKENS_PER_MINUTE if tokens_per_minute is None else tokens_per_minute
+        self.max_concurrency = config.LLM_MAX_CONCURRENCY if max_concurrency is None else max_concurrency
+
+        self._requests = _TokenBucket(rpm) if rpm else None
+        self._tokens = _TokenBucket(tpm) if tpm else None
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self._active = 0
+        self._waiters: deque = deque()
+
+    # Concurrency governor
+
+    def _try_acquire(self, waiter: _Waiter) -> bool:
+        """Take a slot immediately, or queue the waiter. Caller holds the lock."""
+        if not self.max_concurrency or (self._active < self.max_concurrency and not self._waiters):
+            self._active += 1
+            return True
+        self._waiters.append(waiter)
+        return False
+
+    def _release(self):
+        """Hand the slot to the longest waiting caller, or free it."""
+        with self._lock:
+            if self._waiters:
+                waiter = self._waiters.popleft()
+                waiter.granted = True
+                waiter.wake()
+            else:
+                self._active -= 1
+
+    def _acquire(self):
+        event = threading.Event()
+        waiter = _Waiter(event.set)
+        with self._lock:
+            if self._try_acquire(waiter):
+                return
+        event.wait()
+
+    async def _aacquire(self):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def wake():
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+        waiter = _Waiter(wake)
+        with self._lock:
+            if self._try_acquire(waiter):
+                return
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                granted = waiter.granted
+                if not granted:
+                    self._waiters.remove(waiter)
+            if granted:
+                self._release()
+            raise
+
+    # Rate budgets
+
+    def _reserve(self, estimated_tokens: int) -> float:
+        """Reserve one request and its tokens; return how long to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._blocked_until - now)
+            if self._requests:
+                wait = max(wait, self._requests.reserve(1, now))
+            if self._tokens:
+                wait = max(wait, self._tokens.reserve(estimated_tokens, now))
+            return wait
+
+    def _blocked_for(self) -> float:
+        with self._lock:
+            return max(0.0, self._blocked_until - time.monotonic())
+
+    def settle(self, estimated_tokens: int, actual_tokens: Optional[int]):
+        """
+        Correct the token budget once a call reports its real usage.
+
+        Args:
+            estimated_tokens: Tokens reserved before the call
+            actual_tokens: Tokens the call actually used, if known
+        """
+        if self._tokens is None or not actual_tokens:
+            return
+        with self._lock:
+            self._tokens.refund(estimated_tokens - actual_tokens, time.monotonic())
+
+    def observe_headers(self, headers: Optional[Mapping[str, str]]) -> Optional[float]:
+        """
+        Apply the server's rate-limit headers to the shared budget. Called for
+        successful responses too, so the local buckets never claim more budget
+        than the server has left.
+
+        Args:
+            headers: Response headers (retry-after and x-ratelimit-*)
+
+        Returns:
+            Seconds every caller must now pause, if the server asked for a pause
+        """
+        if not headers:
+            return None
+        headers = {name.lower(): value for name, value in headers.items()}
+        pause = parse_duration(headers.get("retry-after"))
+
+        with self._lock:
+            now = time.monotonic()
+            for kind, bucket in (("requests", self._requests), ("tokens", self._tokens)):
+                try:
+                    remaining = float(headers[f"x-ratelimit-remaining-{kind}"])
+                except (KeyError, ValueError):
+                    continue
+                reset = parse_duration(headers.get(f"x-ratelimit-reset-{kind}"))
+                if remaining <= 0 and reset is not None:
+                    pause = max(pause or 0.0, reset)
+                    if bucket is not None:
+                        bucket.drain(now)
+                elif bucket is not None:
+                    bucket.limit_to(remaining, now)
+            if pause:
+                pause = min(pause, config.LLM_MAX_BACKOFF)
+                self._blocked_until = max(self._blocked_until, now + pause)
+        return pause
+
+    # Calls
+
+    @contextmanager
+    def permit(self, estimated_tokens: int) -> Iterator[None]:
+        """Hold a concurrency slot and wait for rate budget, for a blocking call."""
+        self._acquire()
+        try:
+            time.sleep(self._reserve(estimated_tokens))
+            while self._blocked_for() > 0:
+                time.sleep(self._blocked_for())
+            yield
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def apermit(self, estimated_tokens: int) -> AsyncIterator[None]:
+        """Hold a concurrency slot and wait for rate budget, without blocking the event loop."""
+        await self._aacquire()
+        try:
+            await asyncio.sleep(self._reserve(estimated_tokens))
+            while self._blocked_for() > 0:
+                await asyncio.sleep(self._blocked_for())
+            yield
+        finally:
+            self._release()
+
+    def call(self, fn: Callable[[], T], estimated_tokens: int, usage: Callable[[T], Optional[int]]) -> T:
+        """
+        Run a blocking LLM call under the limiter, retrying rate-limit and transient errors.
+
+        Args:
+            fn: The call to make
+            estimated_tokens: Tokens to reserve before the call
+            usage: Extracts the actual token usage from the result
+
+        Returns:
+            The call's result
+        """
+        for attempt in range(config.LLM_MAX_RETRIES + 1):
+            try:
+                with self.permit(estimated_tokens):
+                    result = fn()
+            except Exception as e:
+                delay = self._retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+            self.settle(estimated_tokens, usage(result))
+            return result
+
+    async def acall(self, fn: Callable[[], Awaitable[T]], estimated_tokens: int, usage: Callable[[T], Optional[int]]) -> T:
+        """
+        Run an async LLM call under the limiter, retrying rate-limit and transient errors.
+
+        Args:
+            fn: Factory for the awaitable call
+            estimated_tokens: Tokens to reserve before the call
+            usage: Extracts the actual token usage from the result
+
+        Returns:
+            The call's result
+        """
+        for attempt in range(config.LLM_MAX_RETRIES + 1):
+            try:
+                async with self.apermit(estimated_tokens):
+                    result = await fn()
+            except Exception as e:
+                delay = self._retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            self.settle(estimated_tokens, usage(result))
+            return result
+
+    def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying a failed call, or None if it should not be retried."""
+        if attempt >= config.LLM_MAX_RETRIES or not self.is_retryable(error):
+            return None
+
+        response = getattr(error, "response", None)
+        pause = self.observe_headers(getattr(response, "headers", None))
+        if pause:
+            # The shared pause already applies; the permit waits it out for every caller
+            return 0.0
+
+        ceiling = min(config.LLM_MAX_BACKOFF, config.LLM_BACKOFF_BASE * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        """Whether an LLM client error is a rate limit or a transient failure."""
+        status = getattr(error, "status_code", None)
+        if status is None:
+            status = getattr(getattr(error, "response", None), "status_code", None)
+        return status in RETRY_STATUSES or type(error).__name__ in RETRY_ERROR_NAMES
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for budgeting (about four characters per token)."""
+    return len(text) // 4 + 1
+
+
+# Create limiter instance shared by all agents
+rate_limiter = RateLimiter()
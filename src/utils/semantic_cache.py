@@ -0,0 +1,327 @@
+"""
+Semantic research cache for the Blog Generation System.
+Reuses the research of a previous topic when a new topic is a paraphrase of
+it ("Future of AI" / "The Future of Artificial Intelligence"), matched by
+vector similarity within a freshness window.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import numpy as np
+
+from .config import config
+from .instrumentation import tracer
+
+if TYPE_CHECKING:
+    from ..models.blog_models import ResearchResult
+    from ..tools.embeddings import HashedEmbedder
+
+
+# Abbreviations expanded before embedding so short and long forms of a topic match
+ABBREVIATIONS: Dict[str, str] = {
+    "ai": "artificial intelligence",
+    "ml": "machine learning",
+    "dl": "deep learning",
+    "llm": "large language model",
+    "llms": "large language models",
+    "nlp": "natural language processing",
+    "iot": "internet of things",
+    "ar": "augmented reality",
+    "vr": "virtual reality",
+    "ev": "electric vehicle",
+    "evs": "electric vehicles",
+    "us": "united states",
+    "uk": "united kingdom",
+    "eu": "european union",
+}
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Filler words of topic titles. Unlike the search stopwords this keeps negations,
+# prepositions and comparatives, which flip a topic's meaning ("for"/"against",
+# "before"/"after", "not", "more"/"less").
+TOPIC_STOPWORDS = frozenset("""
+a an the of and or is are was were be been being do does did doing this that these those it its
+i me my we our you your he him his she her they them their what which who whom whose how why when where
+can could should would will shall may might must
+""".split())
+
+
+class SemanticCache:
+    """On-disk vector index of researched topics, searched by cosine similarity."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        threshold: Optional[float] = None,
+        max_age_days: Optional[float] = None,
+        dim: Optional[int] = None
+    ):
+        """
+        Initialize the cache. The index is loaded lazily on first use.
+
+        Args:
+            cache_dir: Directory for the index and stored results (uses config if None)
+            threshold: Minimum cosine similarity for a hit (uses config if None)
+            max_age_days: Age after which entries are no longer reused and get purged (uses config if None)
+            dim: Embedding dimension (uses config if None)
+        """
+        self.cache_dir = Path(cache_dir or config.SEMANTIC_CACHE_DIR)
+        self.threshold = config.SEMANTIC_CACHE_THRESHOLD if threshold is None else threshold
+        self.max_age_days = config.SEMANTIC_CACHE_MAX_AGE_DAYS if max_age_days is None else max_age_days
+        self.dim = dim or config.SEMANTIC_CACHE_DIM
+        self._embedder: Optional["HashedEmbedder"] = None
+        self._vectors: Optional[np.ndarray] = None
+        self._created: Optional[np.ndarray] = None
+        self._pending: List[np.ndarray] = []
+        self._entries: List[Dict] = []
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is switched on in the configuration."""
+        return config.SEMANTIC_CACHE_ENABLED
+
+    @staticmethod
+    def normalize(topic: str) -> str:
+        """
+        Normalize a topic for matching: lowercase, expand abbreviations, drop
+        filler words and plural endings.
+
+        Args:
+            topic: Blog topic
+
+        Returns:
+            Normalized topic text
+        """
+        words = []
+        for word in _WORD_PATTERN.findall(topic.lower()):
+            for part in ABBREVIATIONS.get(word, word).split():
+                if part in TOPIC_STOPWORDS:
+                    continue
+                if len(part) > 3 and part.endswith("s") and not part.endswith("ss"):
+                    part = part[:-1]
+                words.append(part)
+        return " ".join(words)
+
+    def _embed(self, topic: str) -> np.ndarray:
+        if self._embedder is None:
+            from ..tools.embeddings import HashedEmbedder
+            # The topic is already normalized; the index tokenizer would drop "not", "for", "after"...
+            self._embedder = HashedEmbedder(dim=self.dim, tokenizer=str.split)
+        # Plain TF weights: vectors must not depend on which topics are embedded together
+        return self._embedder.embed([self.normalize(topic)], idf_texts=[])[0]
+
+    def _load(self):
+        """Load the entry log, with each entry's vector, from disk. Caller holds the lock."""
+        if self._vectors is not None:
+            if self._pending:
+                # Rows stored since the last lookup are stacked once, not per store
+                self._vectors = np.vstack([self._vectors] + self._pending)
+                self._created = np.array([entry["created_at"] for entry in self._entries])
+                self._pending = []
+            return
+        self._entries = []
+        rows = []
+
+        entries_path = self.cache_dir / "entries.jsonl"
+        if entries_path.is_file():
+            with open(entries_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        vector = np.frombuffer(base64.b64decode(entry.pop("vector")), dtype=np.float32)
+                    except (ValueError, KeyError, TypeError):
+                        # A line torn by an interrupted write, or from an older index format
+                        continue
+                    if entry.get("dim") != self.dim or vector.shape != (self.dim,):
+                        continue
+                    self._entries.append(entry)
+                    rows.append(vector)
+        self._vectors = np.vstack(rows) if rows else np.zeros((0, self.dim), dtype=np.float32)
+        self._created = np.array([entry["created_at"] for entry in self._entries], dtype=np.float64)
+        self._pending = []
+
+    def _result_path(self, key: str) -> Path:
+        """Path of the stored ResearchResult for an entry key."""
+        return self.cache_dir / "results" / f"{key}.json"
+
+    def _purge_expired(self):
+        """Drop entries older than max_age_days from disk and memory. Caller holds the lock."""
+        cutoff = time.time() - self.max_age_days * 86400
+        if not self._entries or self._created.min() >= cutoff:
+            return
+
+        # Reread first, so entries appended by other processes since the last load survive
+        self._vectors = None
+        self._load()
+        keep = self._created >= cutoff
+        expired = [entry for entry, fresh in zip(self._entries, keep) if not fresh]
+        self._entries = [entry for entry, fresh in zip(self._entries, keep) if fresh]
+        self._vectors = self._vectors[keep]
+        self._created = self._created[keep]
+
+        entries_path = self.cache_dir / "entries.jsonl"
+        tmp_path = entries_path.with_name(f"{entries_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry, vector in zip(self._entries, self._vectors):
+                f.write(self._entry_line(entry, vector))
+        tmp_path.replace(entries_path)
+        for entry in expired:
+            try:
+                self._result_path(entry["key"]).unlink()
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _entry_line(entry: Dict, vector: np.ndarray) -> str:
+        """One entry log line, with the vector stored inline."""
+        encoded = base64.b64encode(vector.astype(np.float32).tobytes()).decode('ascii')
+        return json.dumps(dict(entry, vector=encoded), ensure_ascii=False) + "\n"
+
+    def lookup(self, topic: str) -> Optional["ResearchResult"]:
+        """
+        Find fresh research for a topic or a paraphrase of it.
+
+        Args:
+            topic: Blog topic
+
+        Returns:
+            The cached ResearchResult (retitled to this topic), or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        from ..models.blog_models import ResearchResult
+
+        with tracer.span("semantic_cache.lookup", kind="cache", topic=topic) as span:
+            query = self._embed(topic)
+            with self._lock:
+                self._load()
+                if not self._entries:
+                    self._record(span, "miss")
+                    return None
+                similarities = self._vectors @ query
+                best_any = float(similarities.max())
+                cutoff = time.time() - self.max_age_days * 86400
+                similarities = np.where(self._created >= cutoff, similarities, -1.0)
+                best = float(similarities.max())
+                # Prefer the newest entry among equally similar ones
+                entry = self._entries[int(np.flatnonzero(similarities == best)[-1])]
+
+            span.set(similarity=round(best_any, 4))
+            if best < self.threshold:
+                self._record(span, "stale" if best_any >= self.threshold else "miss")
+                return None
+
+            try:
+                with open(self._result_path(entry["key"]), 'r', encoding='utf-8') as f:
+                    result = ResearchResult.model_validate_json(f.read())
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Ignoring unreadable semantic cache entry for '{entry['topic']}': {e}")
+                self._record(span, "miss")
+                return None
+
+            self._record(span, "hit")
+            span.set(matched_topic=entry["topic"])
+            print(f"♻️ Reusing research for '{entry['topic']}' (similarity {best:.2f})")
+            return result.model_copy(update={"topic": topic})
+
+    def _record(self, span, outcome: str):
+        """Count a lookup outcome (hit, miss or stale) and tag its span."""
+        span.set(cache=outcome)
+        with self._stats_lock:
+            if outcome == "hit":
+                self.hits += 1
+            elif outcome == "stale":
+                self.stale += 1
+            else:
+                self.misses += 1
+
+    def store(self, topic: str, result: "ResearchResult"):
+        """
+        Add a topic's research to the cache.
+
+        Args:
+            topic: Blog topic
+            result: Research to reuse for this topic and its paraphrases
+        """
+        if not self.enabled:
+            return
+
+        vector = self._embed(topic).astype(np.float32)
+        key = hashlib.sha256(f"{topic}\0{time.time()}".encode('utf-8')).hexdigest()[:24]
+        entry = {
+            "key": key,
+            "topic": topic,
+            "normalized": self.normalize(topic),
+            "created_at": time.time(),
+            "dim": self.dim,
+        }
+
+        with self._lock:
+            self._load()
+            self._purge_expired()
+            result_path = self._result_path(key)
+            result_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = result_path.with_name(f"{result_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(result.model_dump_json())
+            tmp_path.replace(result_path)
+
+            # One append per entry, vector included, so concurrent writers cannot misalign them
+            with open(self.cache_dir / "entries.jsonl", 'a', encoding='utf-8') as f:
+                f.write(self._entry_line(entry, vector))
+
+            self._pending.append(vector[None, :])
+            self._entries.append(entry)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Lookup statistics for this process.
+
+        Returns:
+            Dictionary with entries, hits, misses, stale and hit_rate
+        """
+        with self._stats_lock:
+            lookups = self.hits + self.misses + self.stale
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale": self.stale,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self):
+        """Delete every cached topic."""
+        with self._lock:
+            # vectors.f32 is the vector file of the previous index format
+            for name in ("entries.jsonl", "vectors.f32"):
+                path = self.cache_dir / name
+                if path.exists():
+                    path.unlink()
+            results_dir = self.cache_dir / "results"
+            if results_dir.is_dir():
+                for path in results_dir.glob("*.json"):
+                    path.unlink()
+            self._vectors = None
+            self._created = None
+            self._pending = []
+            self._entries = []
+
+
+# Create semantic cache instance
+semantic_cache = SemanticCache()